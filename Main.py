@@ -1,8 +1,6 @@
 import os
 import sys
-import shutil
-import subprocess
-import platform
+import multiprocessing
 
 
 def _check_tkinter():
@@ -16,6 +14,11 @@ def _check_tkinter():
     except ImportError:
         pass
 
+    # Only needed to install tkinter; kept out of the startup path
+    import platform
+    import shutil
+    import subprocess
+
     print("tkinter is not installed. Attempting automatic installation...")
 
     system = platform.system()
@@ -104,18 +107,25 @@ def _check_tkinter():
     sys.exit(1)
 
 
-_check_tkinter()
-
-from modules.dependency_checker import check_and_install_dependencies
-
 def main():
     """
     Main entry point for the application.
-    Checks dependencies and launches the GUI.
+
+    `docx-integrity-checker scan ...` runs the headless CLI, which never imports
+    tkinter. Otherwise checks dependencies and launches the GUI.
     """
+    if len(sys.argv) > 1 and sys.argv[1] == "scan":
+        from modules.cli import run_scan
+        sys.exit(run_scan(sys.argv[2:]))
+
+    _check_tkinter()
+
+    from modules.dependency_checker import check_and_install_dependencies
     if check_and_install_dependencies():
         from gui.main_window import create_and_run_gui
         create_and_run_gui()
 
 if __name__ == "__main__":
+    # Batch analysis uses worker processes; required for frozen (.exe) builds
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
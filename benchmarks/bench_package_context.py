@@ -0,0 +1,102 @@
+"""
+Benchmark: shared DocxPackage vs. one ZIP open per checker.
+
+Builds a batch of synthetic .docx files and times the .docx pipeline twice:
+  - "per-checker": every checker gets its own package and python-docx is
+    built twice, reproducing the old behaviour (six ZIP opens and two
+    docx.Document builds per file)
+  - "shared":      analyze_file, which hands one package to every checker
+
+The baseline needs python-docx, which the program itself no longer uses:
+    pip install -e ".[bench]"
+
+Usage:
+    python benchmarks/bench_package_context.py [--files 200] [--paragraphs 200]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import docx
+
+from modules.docx_package import DocxPackage
+from modules.file_analyzer import analyze_file
+from modules.metadata.app_checker import check_app_properties
+from modules.metadata.author_checker import check_author
+from modules.metadata.gdocs_checker import check_gdocs
+from modules.metadata.keyword_checker import check_keywords
+from modules.metadata.revision_checker import check_revision
+from modules.metadata.scrape_detector import check_scrape_indicators
+from modules.metadata.timestamp_checker import check_timestamps
+from modules.rsid_scraper import scrape_rsids
+from modules.content.comment_extractor import extract_comments
+from modules.content.formatting_checker import check_formatting
+from modules.content.stats_checker import check_stats
+from modules.content.track_changes_checker import check_track_changes
+
+
+def _make_corpus(folder, n_files, n_paragraphs):
+    document = docx.Document()
+    document.core_properties.author = "Student"
+    for i in range(n_paragraphs):
+        document.add_paragraph(f"Paragraph {i} " + "lorem ipsum dolor sit amet " * 8)
+    paths = []
+    for i in range(n_files):
+        path = os.path.join(folder, f"paper_{i:04d}.docx")
+        document.save(path)
+        paths.append(path)
+    return paths
+
+
+def _analyze_per_checker(path):
+    """Pre-DocxPackage access pattern: a fresh archive for every checker."""
+    props = docx.Document(path).core_properties
+    check_app_properties(DocxPackage(path))
+    check_gdocs(DocxPackage(path))
+    check_scrape_indicators(DocxPackage(path), props)
+    check_keywords(props)
+    check_revision(props)
+    check_timestamps(props)
+    check_author(props)
+    scrape_rsids(DocxPackage(path))
+    docx.Document(path)
+    check_stats(DocxPackage(path))
+    check_track_changes(DocxPackage(path))
+    extract_comments(DocxPackage(path))
+    check_formatting(DocxPackage(path))
+
+
+def _time_batch(fn, paths):
+    start = time.perf_counter()
+    for path in paths:
+        fn(path)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--paragraphs", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        paths = _make_corpus(folder, args.files, args.paragraphs)
+        # Warm the OS page cache so both runs read from memory
+        _time_batch(analyze_file, paths[:5])
+
+        per_checker = _time_batch(_analyze_per_checker, paths)
+        shared = _time_batch(analyze_file, paths)
+
+    print(f"Files: {args.files}  Paragraphs/file: {args.paragraphs}")
+    print(f"  per-checker: {per_checker:8.3f} s  ({args.files / per_checker:7.1f} files/s)")
+    print(f"  shared:      {shared:8.3f} s  ({args.files / shared:7.1f} files/s)")
+    print(f"  speedup:     {per_checker / shared:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
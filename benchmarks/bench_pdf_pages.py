@@ -0,0 +1,71 @@
+"""
+Benchmark: PDF analysis with one shared reader and lazy page text.
+
+Generates a text PDF (1,000 pages by default) and times:
+  - "baseline":  the old access pattern -- a PdfReader for the metadata check,
+                 a second one for the content check, and page text appended
+                 to one string with +=
+  - "shared":    analyze_pdf with page_workers=1 (one reader, text joined once)
+  - "parallel":  analyze_pdf with page ranges split across worker processes
+
+Usage:
+    python benchmarks/bench_pdf_pages.py [--pages 1000] [--lines 40] [--workers N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pypdf
+
+from modules.batch.engine import default_workers
+from modules.pdf import analyze_pdf
+
+from corpus import write_pdf
+
+
+def _baseline(path):
+    """Pre-PdfDocument access pattern."""
+    reader = pypdf.PdfReader(path)
+    reader.metadata.creator
+    reader = pypdf.PdfReader(path)
+    full_text = ""
+    for page in reader.pages:
+        full_text += (page.extract_text() or "") + "\n"
+    return len(full_text.split())
+
+
+def _time(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--lines", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=default_workers())
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "thesis.pdf")
+        write_pdf(path, args.pages, args.lines)
+        size_mb = os.path.getsize(path) / 1e6
+
+        baseline = _time(lambda: _baseline(path))
+        shared = _time(lambda: analyze_pdf(path, page_workers=1))
+        parallel = _time(lambda: analyze_pdf(path, page_workers=args.workers))
+
+    print(f"Pages: {args.pages}  Lines/page: {args.lines}  Size: {size_mb:.1f} MB  Workers: {args.workers}")
+    print(f"  baseline: {baseline:8.3f} s")
+    print(f"  shared:   {shared:8.3f} s  ({baseline / shared:5.2f}x)")
+    print(f"  parallel: {parallel:8.3f} s  ({baseline / parallel:5.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark: cold-start import cost of each entry point, from `python -X importtime`.
+
+Starts a fresh interpreter for each target, repeatedly, and reports its wall
+time and the import time Python itself records, plus the packages that
+account for most of it:
+  - "scan":     `docx-integrity-checker scan`, up to argument parsing
+  - "worker":   what a batch worker process imports before its first file
+  - "docx":     analyze_file on one .docx (loads the .docx checkers and lxml)
+  - "pdf":      analyze_file on one .pdf (loads the PDF checkers and pypdf)
+  - "probe":    the GUI's startup dependency check
+  - "python":   an empty interpreter, for reference
+
+Short scans and every spawned worker pay this cost before doing any work.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 5] [--top 8] [--target scan ...]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from corpus import write_docx, write_pdf
+
+
+def _targets(docx_path, pdf_path):
+    return {
+        "scan": "from modules.cli import build_parser; build_parser()",
+        "worker": "import modules.batch.engine",
+        "docx": f"from modules.file_analyzer import analyze_file; analyze_file({docx_path!r})",
+        "pdf": f"from modules.file_analyzer import analyze_file; analyze_file({pdf_path!r})",
+        "probe": ("from modules.dependency_checker import is_installed, get_import_name; "
+                  "[is_installed(get_import_name(p)) for p in open('modules/requirements.txt').read().split()]"),
+        "python": "pass",
+    }
+
+
+def _parse_importtime(stderr):
+    """Total import time and self time per top-level package, in microseconds."""
+    total = 0
+    packages = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        self_us = int(self_us)
+        total += self_us
+        package = name.strip().split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+    return total, packages
+
+
+def _run(code):
+    start = time.perf_counter()
+    done = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=ROOT, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if done.returncode != 0:
+        raise RuntimeError(done.stderr.strip().splitlines()[-1])
+    return elapsed, _parse_importtime(done.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8, help="Heaviest packages listed per target.")
+    parser.add_argument("--target", action="append", default=None,
+                        help="Only run these targets (may be repeated).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        docx_path = os.path.join(folder, "sample.docx")
+        pdf_path = os.path.join(folder, "sample.pdf")
+        write_docx(docx_path, paragraphs=50)
+        write_pdf(pdf_path, pages=2)
+        targets = _targets(docx_path, pdf_path)
+
+        for name in args.target or targets:
+            walls, imports, packages = [], [], {}
+            for _ in range(args.repeat):
+                wall, (total, by_package) = _run(targets[name])
+                walls.append(wall)
+                imports.append(total)
+                for package, us in by_package.items():
+                    packages.setdefault(package, []).append(us)
+
+            print(f"{name}: wall {statistics.median(walls) * 1000:7.1f} ms   "
+                  f"imports {statistics.median(imports) / 1000:7.1f} ms   (median of {args.repeat})")
+            heaviest = sorted(packages.items(), key=lambda item: -statistics.median(item[1]))
+            for package, times in heaviest[:args.top]:
+                print(f"    {package:<24} {statistics.median(times) / 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: scanning every story part of a .docx, one part at a time vs. concurrently.
+
+Builds a template-heavy document (a large body plus several large headers and
+a footnotes part) and times DocxPackage.story_scans() three ways:
+  - "main only":   word/document.xml alone, what the body scan used to cover
+  - "sequential":  every story part, part_threads=1
+  - "threaded":    every story part, part_threads=--threads
+
+Decompression and lxml's parsing release the GIL, so the threaded scan can
+overlap parts on a machine with more than one CPU; the collectors themselves
+run in Python. On a single CPU the two are expected to take the same time.
+
+Usage:
+    python benchmarks/bench_story_parts.py [--paragraphs 5000] [--headers 6] [--threads 4] [--repeat 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from corpus import write_docx
+from modules.body_scan import scan_document
+from modules.docx_package import DocxPackage, MAIN_DOCUMENT
+
+
+def _time(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=5000, help="body paragraphs")
+    parser.add_argument("--headers", type=int, default=6, help="header parts")
+    parser.add_argument("--header-paragraphs", type=int, default=1500)
+    parser.add_argument("--footnotes", type=int, default=3000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "template.docx")
+        write_docx(path, paragraphs=args.paragraphs, sessions=40, headers=args.headers,
+                   header_paragraphs=args.header_paragraphs, footnotes=args.footnotes)
+
+        def main_only():
+            with DocxPackage(path) as package, package.open_part(MAIN_DOCUMENT) as part:
+                return {MAIN_DOCUMENT: scan_document(part)}
+
+        def all_parts(threads):
+            with DocxPackage(path, part_threads=threads) as package:
+                return package.story_scans()
+
+        main_time, main_scans = _time(main_only, args.repeat)
+        sequential, scans = _time(lambda: all_parts(1), args.repeat)
+        threaded, _ = _time(lambda: all_parts(args.threads), args.repeat)
+
+        size = os.path.getsize(path)
+        rsids = lambda found: len(set().union(*(scan.rsids.sessions for scan in found.values())))
+        words = lambda found: sum(len(scan.text.full_text.split()) for scan in found.values())
+        print(f"Document: {size / 1e6:.1f} MB, {len(scans)} story parts, {os.cpu_count()} CPU(s), "
+              f"median of {args.repeat}")
+        print(f"  main only:  {main_time:8.3f} s  {words(main_scans):>9,} words  {rsids(main_scans)} RSIDs")
+        print(f"  sequential: {sequential:8.3f} s  {words(scans):>9,} words  {rsids(scans)} RSIDs")
+        print(f"  threaded:   {threaded:8.3f} s  ({args.threads} threads, {sequential / threaded:.2f}x sequential)")
+
+
+if __name__ == "__main__":
+    main()
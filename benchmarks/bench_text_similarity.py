@@ -0,0 +1,99 @@
+"""
+Benchmark: MinHash/LSH near-duplicate search vs. comparing every pair.
+
+Generates a class of random essays and plants edited copies (a share of the
+words replaced), then finds similar pairs three ways:
+  - "signatures":  minhash.text_signature for every essay (done by the batch
+                   workers in a real scan)
+  - "all pairs":   every signature compared with every other, vectorized
+  - "lsh":         TextIndex.top_pairs, which only compares LSH candidates
+
+Reports the time of each, and how many planted copies each finds above
+--min-similarity, along with the exact Jaccard overlap of their shingles.
+
+Usage:
+    python benchmarks/bench_text_similarity.py [--docs 3000] [--words 600] [--copies 30]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from modules.batch.text_index import TextIndex, DEFAULT_MIN_SIMILARITY
+from modules.minhash import shingle_hashes, text_signature
+
+
+def _make_texts(n_docs, n_words, copies, seed=0):
+    """Random essays; the last `copies` are edited copies of earlier ones. Returns (texts, planted)."""
+    rng = random.Random(seed)
+    vocabulary = [f"w{i}" for i in range(20000)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    texts = [rng.choices(vocabulary, weights, k=n_words) for _ in range(n_docs - copies)]
+    planted = []
+    for _ in range(copies):
+        original = rng.randrange(len(texts))
+        words = list(texts[original])
+        for i in rng.sample(range(n_words), int(n_words * rng.uniform(0.01, 0.05))):
+            words[i] = rng.choice(vocabulary)
+        planted.append((original, len(texts)))
+        texts.append(words)
+    return [" ".join(words) for words in texts], planted
+
+
+def _all_pairs(signatures, min_similarity):
+    matrix = np.array(signatures, dtype=np.uint32)
+    found = set()
+    for a in range(len(matrix)):
+        similarity = (matrix[a + 1:] == matrix[a]).mean(axis=1)
+        found.update((a, a + 1 + int(b)) for b in np.flatnonzero(similarity >= min_similarity))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--docs", type=int, default=3000)
+    parser.add_argument("--words", type=int, default=600)
+    parser.add_argument("--copies", type=int, default=30)
+    parser.add_argument("--min-similarity", type=float, default=DEFAULT_MIN_SIMILARITY)
+    args = parser.parse_args()
+
+    texts, planted = _make_texts(args.docs, args.words, args.copies)
+
+    start = time.perf_counter()
+    signals = [text_signature(text) for text in texts]
+    signing = time.perf_counter() - start
+
+    start = time.perf_counter()
+    brute = _all_pairs([s["signature"] for s in signals], args.min_similarity)
+    all_pairs = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = TextIndex()
+    for i, signal in enumerate(signals):
+        index.add(i, signal)
+    lsh = {(p.document_a, p.document_b) for p in index.top_pairs(len(texts), args.min_similarity)}
+    lsh_time = time.perf_counter() - start
+
+    exact = []
+    for a, b in planted:
+        sa, sb = set(shingle_hashes(texts[a]).tolist()), set(shingle_hashes(texts[b]).tolist())
+        exact.append(len(sa & sb) / len(sa | sb))
+
+    print(f"Docs: {args.docs}  words/doc: {args.words}  planted copies: {args.copies} "
+          f"(exact overlap {min(exact):.0%}-{max(exact):.0%})")
+    print(f"  signatures: {signing:8.3f} s  ({signing / len(texts) * 1000:.2f} ms/doc)")
+    print(f"  all pairs:  {all_pairs:8.3f} s  found {len(brute & set(planted))}/{len(planted)} planted, "
+          f"{len(brute)} pairs in all")
+    print(f"  lsh:        {lsh_time:8.3f} s  found {len(lsh & set(planted))}/{len(planted)} planted, "
+          f"{len(lsh)} pairs in all")
+    print(f"  speedup:    {all_pairs / lsh_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
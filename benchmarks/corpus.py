@@ -0,0 +1,331 @@
+"""
+Synthetic corpus generator for the benchmarks.
+
+Writes .docx packages from scratch (no python-docx needed) and minimal text
+PDFs, with every knob the analyzers react to:
+
+  .docx: paragraph count, RSID sessions (settings.xml list + rsidR/rsidRPr
+         on paragraphs and runs), tracked insertions/deletions, comments,
+         embedded PNG images, and a Google-Docs-style export (app.xml
+         Application "Google Docs", no RSIDs anywhere)
+  .pdf:  page count and lines per page, plus an Info dictionary
+
+Usage:
+    python benchmarks/corpus.py OUT_DIR [--docx 20] [--pdf 2] [--paragraphs 500]
+        [--sessions 8] [--tracked-changes 10] [--comments 5] [--images 2]
+        [--google-docs] [--pages 50] [--seed 0]
+"""
+
+import argparse
+import os
+import random
+import struct
+import zipfile
+import zlib
+from xml.sax.saxutils import escape
+
+
+_WORDS = (
+    "the of and to in is that for it as was with be by on not he this are or his from at which "
+    "but have an they you were her she there been one all we their has would when if so no will "
+    "analysis evidence argument history theory data results method however therefore student "
+    "essay research source significant approach during between example structure process"
+).split()
+
+_W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+_R = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+_DOC_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+
+def _sentence(rng, words):
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _png(rng, side):
+    """A side x side RGB PNG of random noise (incompressible, like a photo)."""
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    raw = b"".join(b"\x00" + bytes(rng.getrandbits(8) for _ in range(side * 3)) for _ in range(side))
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", side, side, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw))
+            + chunk(b"IEND", b""))
+
+
+def write_docx(path, paragraphs=200, sessions=5, tracked_changes=0, comments=0, images=0,
+               google_docs=False, image_side=64, headers=0, header_paragraphs=20, footnotes=0, seed=0):
+    """
+    Write a synthetic .docx.
+
+    Args:
+        path (str): Output path.
+        paragraphs (int): Body paragraphs (8-40 words each).
+        sessions (int): Distinct RSIDs, listed in settings.xml and spread over
+                        paragraphs and runs. Ignored when google_docs is set.
+        tracked_changes (int): Tracked changes, alternating w:ins and w:del.
+        comments (int): Comments in word/comments.xml, anchored in the body.
+        images (int): PNGs in word/media, each referenced by an inline drawing.
+        google_docs (bool): Mimic a Google Docs export: app.xml names Google
+                            Docs and there are no RSIDs.
+        image_side (int): Image width/height in pixels.
+        headers (int): Header parts (word/headerN.xml), each referenced from
+                       the document relationships.
+        header_paragraphs (int): Paragraphs in each header.
+        footnotes (int): One-paragraph footnotes in word/footnotes.xml.
+        seed (int): Random seed; the same arguments always give the same file.
+    """
+    rng = random.Random(seed)
+    rsids = [] if google_docs else [f"{rng.getrandbits(32):08X}" for _ in range(max(sessions, 1))]
+
+    def rsid_attrs(i):
+        if not rsids:
+            return ""
+        return f' w:rsidR="{rsids[i % len(rsids)]}" w:rsidRPr="{rsids[(i * 7) % len(rsids)]}"'
+
+    # Spread the special elements evenly over the body
+    def spots(count):
+        return {round(k * paragraphs / count) for k in range(count)} if count and paragraphs else set()
+    change_at, comment_at, image_at = spots(tracked_changes), spots(comments), spots(images)
+
+    body = []
+    change = comment = image = 0
+    for i in range(paragraphs):
+        run_rsid = f' w:rsidR="{rsids[i % len(rsids)]}"' if rsids else ""
+        runs = [f'<w:r{run_rsid}><w:t xml:space="preserve">{escape(_sentence(rng, rng.randint(8, 40)))}</w:t></w:r>']
+        if i in change_at:
+            kind, tag = ("ins", "t") if change % 2 == 0 else ("del", "delText")
+            runs.append(f'<w:{kind} w:id="{1000 + change}" w:author="Student" w:date="2024-03-01T10:00:00Z">'
+                        f'<w:r><w:{tag} xml:space="preserve"> {escape(_sentence(rng, 5))}</w:{tag}></w:r></w:{kind}>')
+            change += 1
+        if i in comment_at:
+            runs.insert(0, f'<w:commentRangeStart w:id="{comment}"/>')
+            runs.append(f'<w:commentRangeEnd w:id="{comment}"/>'
+                        f'<w:r><w:commentReference w:id="{comment}"/></w:r>')
+            comment += 1
+        if i in image_at:
+            image += 1
+            runs.append(
+                '<w:r><w:drawing><wp:inline xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing">'
+                f'<wp:extent cx="914400" cy="914400"/><wp:docPr id="{image}" name="Picture {image}"/>'
+                '<a:graphic xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+                '<a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+                '<pic:pic xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+                f'<pic:blipFill><a:blip r:embed="rIdImage{image}"/></pic:blipFill>'
+                '</pic:pic></a:graphicData></a:graphic></wp:inline></w:drawing></w:r>'
+            )
+        style = '<w:pPr><w:pStyle w:val="Heading1"/></w:pPr>' if i % 25 == 0 else ""
+        body.append(f'<w:p{rsid_attrs(i)}>{style}{"".join(runs)}</w:p>')
+
+    sect_rsid = f' w:rsidR="{rsids[0]}"' if rsids else ""
+    document = (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<w:document {_W} {_R}><w:body>'
+                + "".join(body)
+                + f'<w:sectPr{sect_rsid}><w:pgSz w:w="12240" w:h="15840"/></w:sectPr></w:body></w:document>')
+
+    settings_rsids = ""
+    if rsids:
+        settings_rsids = (f'<w:rsids><w:rsidRoot w:val="{rsids[0]}"/>'
+                          + "".join(f'<w:rsid w:val="{r}"/>' for r in sorted(rsids)) + '</w:rsids>')
+    settings = (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<w:settings {_W}>'
+                f'<w:zoom w:percent="100"/><w:defaultTabStop w:val="720"/>{settings_rsids}</w:settings>')
+
+    styles = (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<w:styles {_W}>'
+              '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/></w:style>'
+              '<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/></w:style>'
+              '</w:styles>')
+
+    application = "Google Docs" if google_docs else "Microsoft Office Word"
+    app = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+           '<Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties">'
+           f'<Application>{application}</Application>'
+           + ("" if google_docs else "<AppVersion>16.0000</AppVersion>")
+           + f'<Pages>{max(1, paragraphs // 12)}</Pages></Properties>')
+
+    revision = 1 if google_docs else rng.randint(2, 40)
+    core = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
+            'xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:dcterms="http://purl.org/dc/terms/" '
+            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+            f'<dc:title>Essay {seed}</dc:title><dc:creator>Student {seed}</dc:creator>'
+            '<cp:lastModifiedBy>Student</cp:lastModifiedBy>'
+            f'<cp:revision>{revision}</cp:revision>'
+            '<dcterms:created xsi:type="dcterms:W3CDTF">2024-03-01T09:00:00Z</dcterms:created>'
+            '<dcterms:modified xsi:type="dcterms:W3CDTF">2024-03-03T21:30:00Z</dcterms:modified>'
+            '</cp:coreProperties>')
+
+    comment_xml = None
+    if comments:
+        comment_xml = (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<w:comments {_W}>'
+                       + "".join(f'<w:comment w:id="{k}" w:author="Reviewer" w:date="2024-03-02T12:00:00Z">'
+                                 f'<w:p><w:r><w:t>{escape(_sentence(rng, 10))}</w:t></w:r></w:p></w:comment>'
+                                 for k in range(comment))
+                       + '</w:comments>')
+
+    def story_paragraph(i):
+        run_rsid = f' w:rsidR="{rsids[i % len(rsids)]}"' if rsids else ""
+        return (f'<w:p{rsid_attrs(i)}><w:r{run_rsid}><w:t xml:space="preserve">'
+                f'{escape(_sentence(rng, rng.randint(8, 40)))}</w:t></w:r></w:p>')
+
+    header_xml = [f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<w:hdr {_W}>'
+                  + "".join(story_paragraph(i) for i in range(header_paragraphs)) + '</w:hdr>'
+                  for _ in range(headers)]
+    footnote_xml = None
+    if footnotes:
+        footnote_xml = (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<w:footnotes {_W}>'
+                        + "".join(f'<w:footnote w:id="{k + 1}">{story_paragraph(k)}</w:footnote>'
+                                  for k in range(footnotes))
+                        + '</w:footnotes>')
+
+    doc_rels = [f'<Relationship Id="rIdStyles" Type="{_DOC_REL}/styles" Target="styles.xml"/>',
+                f'<Relationship Id="rIdSettings" Type="{_DOC_REL}/settings" Target="settings.xml"/>']
+    if comment_xml:
+        doc_rels.append(f'<Relationship Id="rIdComments" Type="{_DOC_REL}/comments" Target="comments.xml"/>')
+    doc_rels += [f'<Relationship Id="rIdImage{k}" Type="{_DOC_REL}/image" Target="media/image{k}.png"/>'
+                 for k in range(1, image + 1)]
+    doc_rels += [f'<Relationship Id="rIdHeader{k}" Type="{_DOC_REL}/header" Target="header{k}.xml"/>'
+                 for k in range(1, headers + 1)]
+    if footnote_xml:
+        doc_rels.append(f'<Relationship Id="rIdFootnotes" Type="{_DOC_REL}/footnotes" Target="footnotes.xml"/>')
+
+    overrides = {
+        "/word/document.xml": "application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml",
+        "/word/styles.xml": "application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml",
+        "/word/settings.xml": "application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml",
+        "/docProps/core.xml": "application/vnd.openxmlformats-package.core-properties+xml",
+        "/docProps/app.xml": "application/vnd.openxmlformats-officedocument.extended-properties+xml",
+    }
+    if comment_xml:
+        overrides["/word/comments.xml"] = "application/vnd.openxmlformats-officedocument.wordprocessingml.comments+xml"
+    for k in range(1, headers + 1):
+        overrides[f"/word/header{k}.xml"] = "application/vnd.openxmlformats-officedocument.wordprocessingml.header+xml"
+    if footnote_xml:
+        overrides["/word/footnotes.xml"] = "application/vnd.openxmlformats-officedocument.wordprocessingml.footnotes+xml"
+    content_types = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                     '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                     '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                     '<Default Extension="xml" ContentType="application/xml"/>'
+                     '<Default Extension="png" ContentType="image/png"/>'
+                     + "".join(f'<Override PartName="{name}" ContentType="{kind}"/>' for name, kind in overrides.items())
+                     + '</Types>')
+
+    package_rels = (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<Relationships xmlns="{_PKG_REL}">'
+                    f'<Relationship Id="rId1" Type="{_DOC_REL}/officeDocument" Target="word/document.xml"/>'
+                    f'<Relationship Id="rId2" Type="{_PKG_REL}/metadata/core-properties" Target="docProps/core.xml"/>'
+                    f'<Relationship Id="rId3" Type="{_DOC_REL}/extended-properties" Target="docProps/app.xml"/>'
+                    '</Relationships>')
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("[Content_Types].xml", content_types)
+        z.writestr("_rels/.rels", package_rels)
+        z.writestr("docProps/core.xml", core)
+        z.writestr("docProps/app.xml", app)
+        z.writestr("word/document.xml", document)
+        z.writestr("word/styles.xml", styles)
+        z.writestr("word/settings.xml", settings)
+        z.writestr("word/_rels/document.xml.rels",
+                   f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<Relationships xmlns="{_PKG_REL}">'
+                   + "".join(doc_rels) + '</Relationships>')
+        if comment_xml:
+            z.writestr("word/comments.xml", comment_xml)
+        for k, xml in enumerate(header_xml, 1):
+            z.writestr(f"word/header{k}.xml", xml)
+        if footnote_xml:
+            z.writestr("word/footnotes.xml", footnote_xml)
+        for k in range(1, image + 1):
+            # PNG data is already compressed
+            z.writestr(f"word/media/image{k}.png", _png(rng, image_side), compress_type=zipfile.ZIP_STORED)
+
+
+def write_pdf(path, pages, lines_per_page=40):
+    """Write a minimal text PDF with Helvetica lines on every page and an Info dictionary."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in once the page object numbers are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Producer (benchmarks corpus) /Author (Student) /Creator (Microsoft Word) >>",
+    ]
+    kids = []
+    for page in range(pages):
+        lines = [f"Page {page + 1} line {i}: lorem ipsum dolor sit amet consectetur" for i in range(lines_per_page)]
+        text = "".join(f"({line}) Tj T* " for line in lines)
+        content = f"BT /F1 10 Tf 12 TL 50 780 Td {text}ET".encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+        content_ref = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_ref
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [" + b" ".join(kids) + b"] /Count %d >>" % pages
+
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4\n")
+        offsets = []
+        for number, body in enumerate(objects, 1):
+            offsets.append(f.tell())
+            f.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+        xref = f.tell()
+        f.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+        for offset in offsets:
+            f.write(b"%010d 00000 n \n" % offset)
+        f.write(b"trailer\n<< /Size %d /Root 1 0 R /Info 4 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+                % (len(objects) + 1, xref))
+
+
+def make_corpus(folder, docx=20, pdf=2, paragraphs=500, sessions=8, tracked_changes=10,
+                comments=5, images=2, google_docs=False, pages=50, seed=0):
+    """
+    Write a corpus of .docx and .pdf files into `folder` and return their paths.
+
+    With google_docs set, every fourth .docx is a Google-Docs-style export;
+    the rest keep their Word RSIDs, as in a real class.
+    """
+    os.makedirs(folder, exist_ok=True)
+    paths = []
+    for i in range(docx):
+        path = os.path.join(folder, f"essay_{i:04d}.docx")
+        write_docx(path, paragraphs, sessions, tracked_changes, comments, images,
+                   google_docs=google_docs and i % 4 == 0, seed=seed + i)
+        paths.append(path)
+    for i in range(pdf):
+        path = os.path.join(folder, f"thesis_{i:04d}.pdf")
+        write_pdf(path, pages)
+        paths.append(path)
+    return paths
+
+
+def add_corpus_arguments(parser):
+    """Corpus options shared by corpus.py and suite.py."""
+    parser.add_argument("--docx", type=int, default=20, help=".docx files (default: 20)")
+    parser.add_argument("--pdf", type=int, default=2, help=".pdf files (default: 2)")
+    parser.add_argument("--paragraphs", type=int, default=500)
+    parser.add_argument("--sessions", type=int, default=8, help="RSID sessions per .docx")
+    parser.add_argument("--tracked-changes", type=int, default=10)
+    parser.add_argument("--comments", type=int, default=5)
+    parser.add_argument("--images", type=int, default=2)
+    parser.add_argument("--google-docs", action="store_true",
+                        help="make every fourth .docx a Google-Docs-style export")
+    parser.add_argument("--pages", type=int, default=50, help="pages per .pdf")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def corpus_options(args):
+    return {
+        "docx": args.docx, "pdf": args.pdf, "paragraphs": args.paragraphs,
+        "sessions": args.sessions, "tracked_changes": args.tracked_changes,
+        "comments": args.comments, "images": args.images, "google_docs": args.google_docs,
+        "pages": args.pages, "seed": args.seed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("out_dir")
+    add_corpus_arguments(parser)
+    args = parser.parse_args()
+    paths = make_corpus(args.out_dir, **corpus_options(args))
+    print(f"Wrote {len(paths)} file(s) to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
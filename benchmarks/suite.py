@@ -0,0 +1,275 @@
+"""
+Benchmark suite: every checker and the full pipeline over a synthetic corpus.
+
+Generates a corpus with benchmarks/corpus.py (or uses an existing folder) and
+runs three phases, each in a fresh process so its peak RSS is its own:
+  - "checkers":  each checker alone, on a fresh package/document per file,
+                 so shared parses are charged to every checker that needs them
+  - "pipeline":  analyze_file on each file in turn (the single-file path)
+  - "batch":     iter_batch with --jobs workers and no cache (the scan path)
+
+For each it reports files/sec, p50/p95 per-file latency and peak RSS.
+--json writes the results for later comparison; --compare OLD.json prints
+each metric next to the same metric from an earlier run.
+
+Usage:
+    python benchmarks/suite.py [--docx 20] [--pdf 2] [--paragraphs 500] ...
+        [--corpus DIR] [--repeat 3] [--jobs N] [--json OUT.json] [--compare OLD.json]
+
+See benchmarks/corpus.py for the corpus options.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import add_corpus_arguments, corpus_options, make_corpus
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# --- Measurements ---
+
+def _percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * p // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _summarize(latencies, elapsed=None):
+    """files/sec and latency percentiles (ms) for one timed loop."""
+    latencies = sorted(latencies)
+    elapsed = sum(latencies) if elapsed is None else elapsed
+    return {
+        "files": len(latencies),
+        "seconds": round(elapsed, 4),
+        "files_per_sec": round(len(latencies) / elapsed, 2) if elapsed else None,
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 3) if latencies else None,
+        "p95_ms": round(_percentile(latencies, 95) * 1000, 3) if latencies else None,
+    }
+
+
+def _peak_rss_mb(include_children=False):
+    """Peak resident set size of this process (and optionally its children) in MB."""
+    if resource is None:
+        return None
+    scale = 1 if sys.platform == "darwin" else 1024  # ru_maxrss: bytes on macOS, KB on Linux
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if include_children:
+        peak = max(peak, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return round(peak * scale / 1e6, 1)
+
+
+# --- Phases (each runs in its own process) ---
+
+def _docx_checkers():
+    from modules.content.comment_extractor import extract_comments
+    from modules.content.formatting_checker import check_formatting
+    from modules.content.stats_checker import check_stats
+    from modules.content.track_changes_checker import check_track_changes
+    from modules.metadata.app_checker import check_app_properties
+    from modules.metadata.author_checker import check_author
+    from modules.metadata.core_properties import read_core_properties
+    from modules.metadata.gdocs_checker import check_gdocs
+    from modules.metadata.keyword_checker import check_keywords
+    from modules.metadata.revision_checker import check_revision
+    from modules.metadata.scrape_detector import check_scrape_indicators
+    from modules.metadata.timestamp_checker import check_timestamps
+    from modules.package_listing import check_package_listing
+    from modules.rsid_scraper import scrape_rsids
+
+    # name -> fn(package, props); props are read outside the timed call
+    return {
+        "core_properties": lambda package, props: read_core_properties(package),
+        "app_properties": lambda package, props: check_app_properties(package),
+        "gdocs": lambda package, props: check_gdocs(package),
+        "scrape_indicators": lambda package, props: check_scrape_indicators(package, props),
+        "keywords": lambda package, props: check_keywords(props),
+        "revision": lambda package, props: check_revision(props),
+        "timestamps": lambda package, props: check_timestamps(props),
+        "author": lambda package, props: check_author(props),
+        "rsids": lambda package, props: scrape_rsids(package),
+        "stats": lambda package, props: check_stats(package),
+        "track_changes": lambda package, props: check_track_changes(package),
+        "comments": lambda package, props: extract_comments(package),
+        "formatting": lambda package, props: check_formatting(package),
+        "package_listing": lambda package, props: check_package_listing(package),
+    }
+
+
+def _pdf_checkers():
+    from modules.pdf.content_checker import check_pdf_content
+    from modules.pdf.metadata_checker import check_pdf_metadata
+    return {
+        "pdf_metadata": check_pdf_metadata,
+        "pdf_content": check_pdf_content,
+    }
+
+
+def _run_checkers(paths, repeat):
+    from modules.docx_package import DocxPackage
+    from modules.metadata.core_properties import read_core_properties
+    from modules.pdf import PdfDocument
+
+    docx = [p for p in paths if p.endswith(".docx")]
+    pdf = [p for p in paths if p.endswith(".pdf")]
+    results = {}
+    for name, check in _docx_checkers().items():
+        latencies = []
+        for _ in range(repeat):
+            for path in docx:
+                with DocxPackage(path) as package:
+                    props = read_core_properties(package) if name != "core_properties" else None
+                    start = time.perf_counter()
+                    check(package, props)
+                    latencies.append(time.perf_counter() - start)
+        if latencies:
+            results[name] = _summarize(latencies)
+    for name, check in _pdf_checkers().items():
+        latencies = []
+        for _ in range(repeat):
+            for path in pdf:
+                document = PdfDocument(path, page_workers=1)
+                start = time.perf_counter()
+                check(document)
+                latencies.append(time.perf_counter() - start)
+        if latencies:
+            results[name] = _summarize(latencies)
+    return {"checkers": results, "peak_rss_mb": _peak_rss_mb()}
+
+
+def _run_pipeline(paths, repeat):
+    from modules.file_analyzer import analyze_file
+
+    latencies = []
+    for _ in range(repeat):
+        for path in paths:
+            start = time.perf_counter()
+            analyze_file(path)
+            latencies.append(time.perf_counter() - start)
+    return dict(_summarize(latencies), peak_rss_mb=_peak_rss_mb())
+
+
+def _run_batch(paths, repeat, jobs):
+    from modules.batch import iter_batch
+
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _result in iter_batch(paths, max_workers=jobs):
+            pass
+        runs.append(time.perf_counter() - start)
+    best = min(runs)
+    return {
+        "files": len(paths),
+        "jobs": jobs,
+        "seconds": round(best, 4),
+        "files_per_sec": round(len(paths) / best, 2) if best else None,
+        "peak_rss_mb": _peak_rss_mb(include_children=True),
+    }
+
+
+def _in_fresh_process(fn, *args):
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(fn, *args).result()
+
+
+# --- Reporting ---
+
+def _print_report(results, previous=None):
+    def compare(new, old, higher_is_better):
+        if old in (None, 0) or new is None:
+            return ""
+        ratio = new / old if higher_is_better else old / new
+        return f"  ({ratio:5.2f}x vs. previous)"
+
+    def row(name, stats, old):
+        old = old or {}
+        rss = f"  peak RSS {stats['peak_rss_mb']} MB" if stats.get("peak_rss_mb") is not None else ""
+        print(f"  {name:<18} {stats['files_per_sec'] or 0:10.1f} files/s  "
+              f"p50 {stats['p50_ms'] or 0:9.3f} ms  p95 {stats['p95_ms'] or 0:9.3f} ms{rss}"
+              + compare(stats["p50_ms"], old.get("p50_ms"), higher_is_better=False))
+
+    prev_checkers = (previous or {}).get("checkers", {}).get("checkers", {})
+    print(f"Checkers (peak RSS {results['checkers']['peak_rss_mb']} MB):")
+    for name, stats in results["checkers"]["checkers"].items():
+        row(name, stats, prev_checkers.get(name))
+
+    print("Pipeline (analyze_file):")
+    row("analyze_file", results["pipeline"], (previous or {}).get("pipeline"))
+
+    batch = results.get("batch")
+    if batch:
+        old = ((previous or {}).get("batch") or {}).get("files_per_sec")
+        print(f"Batch (iter_batch, {batch['jobs']} worker(s)):")
+        print(f"  {batch['files_per_sec'] or 0:.1f} files/s  ({batch['seconds']:.3f} s)  "
+              f"peak RSS {batch['peak_rss_mb']} MB" + compare(batch["files_per_sec"], old, higher_is_better=True))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_corpus_arguments(parser)
+    parser.add_argument("--corpus", metavar="DIR",
+                        help="analyze the .docx/.pdf files in DIR instead of generating a corpus")
+    parser.add_argument("--repeat", type=int, default=3, help="passes over the corpus per phase (default: 3)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="batch workers (default: one per CPU core; 0 skips the batch phase)")
+    parser.add_argument("--json", metavar="OUT", help="write the results as JSON")
+    parser.add_argument("--compare", metavar="OLD", help="compare against a JSON file from an earlier run")
+    args = parser.parse_args()
+
+    from modules.batch.cache import analyzer_version
+    from modules.batch.engine import default_workers
+
+    jobs = default_workers() if args.jobs is None else args.jobs
+    with tempfile.TemporaryDirectory() as folder:
+        if args.corpus:
+            paths = sorted(os.path.join(args.corpus, name) for name in os.listdir(args.corpus)
+                           if name.lower().endswith((".docx", ".pdf")))
+            config = {"corpus": os.path.abspath(args.corpus)}
+        else:
+            config = corpus_options(args)
+            paths = make_corpus(folder, **config)
+        config.update(repeat=args.repeat, jobs=jobs)
+        print(f"Corpus: {len(paths)} file(s), {sum(os.path.getsize(p) for p in paths) / 1e6:.1f} MB")
+
+        results = {
+            "config": config,
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpus": os.cpu_count(),
+                "analyzer_version": analyzer_version(),
+            },
+            "checkers": _in_fresh_process(_run_checkers, paths, args.repeat),
+            "pipeline": _in_fresh_process(_run_pipeline, paths, args.repeat),
+            "batch": _in_fresh_process(_run_batch, paths, args.repeat, jobs) if jobs > 0 else None,
+        }
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+    _print_report(results, previous)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
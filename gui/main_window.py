@@ -4,35 +4,46 @@ import platform
 import ctypes
 import customtkinter
 from tkinter import filedialog
-from modules.file_analyzer import analyze_file
-
-
-# Maps line prefixes to color tag names
-_PREFIX_TO_TAG = {
-    "[KEYWORD]":   "keyword",
-    "[SCRAPE]":    "scrape",
-    "[APP]":       "app",
-    "[RSID]":      "rsid",
-    "[TIMESTAMP]": "timestamp",
-    "[REVISION]":  "revision",
-    "[AUTHOR]":    "author",
-    "[CONTENT]":   "content",
-    "[TRACK]":     "track",
-    "[COMMENT]":   "comment",
-    "[FORMAT]":    "format",
-    "[GDOCS]":     "gdocs",
+from modules.batch import (
+    RsidIndex, TextIndex, cluster_findings, default_store_path, discover_files, is_failure,
+    similarity_findings, text_similarity_findings,
+)
+from modules.findings import HEADER, format_finding
+from gui.report_view import ReportView, StoredReport, PAGE_FILES
+from gui.worker import AnalysisJob
+
+
+# Milliseconds between polls of a running analysis
+_POLL_MS = 100
+
+
+# Maps finding categories to color tag names
+_CATEGORY_TO_TAG = {
+    HEADER:      "header",
+    "KEYWORD":   "keyword",
+    "SCRAPE":    "scrape",
+    "APP":       "app",
+    "RSID":      "rsid",
+    "TIMESTAMP": "timestamp",
+    "REVISION":  "revision",
+    "AUTHOR":    "author",
+    "CONTENT":   "content",
+    "TRACK":     "track",
+    "COMMENT":   "comment",
+    "FORMAT":    "format",
+    "GDOCS":     "gdocs",
+    "SHARED":    "shared",
 }
 
 
-def _get_tag(line):
-    """Return the color tag name for a result line, or None for plain text."""
-    stripped = line.strip()
-    if stripped.startswith("---") or stripped.startswith("==="):
-        return "header"
-    for prefix, tag in _PREFIX_TO_TAG.items():
-        if stripped.startswith(prefix):
-            return tag
-    return None
+def _report_lines(findings):
+    """Render findings to (line, color tag) pairs; tag is None for plain text."""
+    return [(format_finding(f), _CATEGORY_TO_TAG.get(f.category)) for f in findings]
+
+
+def _banner(title):
+    sep = "=" * 60
+    return [(sep, "header"), (f"=== {title} ===", "header"), (sep, "header")]
 
 
 def create_and_run_gui():
@@ -60,66 +71,205 @@ def create_and_run_gui():
     frame_top.grid_columnconfigure(0, weight=1)
     frame_top.grid_columnconfigure(1, weight=1)
 
-    # Tracks the last set of result strings (used by save + clipboard)
-    current_results = []
-
-    # --- Helper: render results into the text area with color tags ---
-    def _display_results(results):
-        result_text.configure(state="normal")
-        result_text.delete("1.0", "end")
-        for line in results:
-            tag = _get_tag(line)
-            if tag:
-                result_text.insert("end", line + "\n", tag)
+    # The running analysis as {"job", "pending", "failures", "errors", "shown", ...}; empty when idle
+    active = {}
+
+    # --- Background analysis: the worker thread posts to a queue polled from the Tk loop ---
+    def _start_analysis(file_paths, file_lines, finish, max_workers=None, store_path=None):
+        """
+        Analyze file_paths off the UI thread, streaming each file's report into the view.
+
+        Args:
+            file_paths (list | iterable): Paths to analyze; a generator is read
+                                   as the analysis runs (see AnalysisJob).
+            file_lines (callable): file_lines(result) -> (line, tag) pairs for one
+                                   FileResult. Files are shown in input order as
+                                   soon as every earlier file has finished.
+            finish (callable): finish(signals, analyzed, found) -> extra (line, tag)
+                               pairs appended when the job ends; signals yields
+                               (path, signals) per analyzed file in input order,
+                               and analyzed < found if Cancel skipped files.
+            max_workers (int): See AnalysisJob.
+            store_path (str): Optional ResultStore file (see AnalysisJob). With a
+                              store only the first page streams in live; the
+                              whole report is read back from the store page by
+                              page once the job ends, so no Finding lists pile
+                              up in memory.
+        """
+        job = AnalysisJob(file_paths, max_workers, store_path=store_path)
+        active.update(job=job, file_lines=file_lines, finish=finish, store=None,
+                      pending={}, failures={}, signals={}, errors=[], shown=0, analyzed=0)
+        view.set_lines([])
+        browse_button.configure(state="disabled")
+        batch_button.configure(state="disabled")
+        cancel_button.configure(state="normal")
+        progress_bar.set(0)
+        label_progress.configure(text=job.progress_text())
+        job.start()
+        app.after(_POLL_MS, _poll, job)
+
+    def _take_messages(job):
+        """Move queued messages into `active`; returns True once the job reported done."""
+        finished = False
+        for kind, payload in job.poll():
+            if kind == "result":
+                active["analyzed"] += 1
+                if active["store"] is None:
+                    # No store: the summary needs every file's signals
+                    active["signals"][payload.index] = (payload.path, payload.signals)
+                elif is_failure(payload):
+                    # Never stored, so kept here for the pages read back from the store
+                    active["failures"][payload.index] = payload
+                if active["store"] is None or payload.index < PAGE_FILES:
+                    active["pending"][payload.index] = payload
+            elif kind == "store":
+                active["store"] = payload
+            elif kind == "error":
+                active["errors"].append(payload)
             else:
-                result_text.insert("end", line + "\n")
-        result_text.configure(state="disabled")
+                finished = True
+        return finished
+
+    def _show_ready(skip_missing=False):
+        """Append the reports of the finished files that follow the ones already shown."""
+        pending = active["pending"]
+        found = active["job"].found
+        if active["store"] is not None:
+            found = min(found, PAGE_FILES)
+        lines = []
+        while active["shown"] < found:
+            result = pending.pop(active["shown"], None)
+            if result is None and not skip_missing:
+                break
+            if result is not None:
+                lines.extend(active["file_lines"](result))
+            active["shown"] += 1
+        if lines:
+            view.extend(lines)
+
+    def _poll(job):
+        finished = _take_messages(job)
+        _show_ready()
+        total = job.total if job.total is not None else job.found
+        progress_bar.set(job.done / total if total else 0)
+        label_progress.configure(text=job.progress_text())
+        if finished:
+            _finish_analysis()
+        else:
+            app.after(_POLL_MS, _poll, job)
+
+    def _finish_analysis():
+        job = active["job"]
+        store_path = active["store"]
+        lines = []
+        if store_path is None:
+            _show_ready(skip_missing=True)
+            signals = (active["signals"][index] for index in sorted(active["signals"]))
+            lines.extend(active["finish"](signals, active["analyzed"], job.found))
+        else:
+            # The worker closed its store before "done": read the run back from it
+            report = StoredReport(store_path, job.found, active["file_lines"], active["failures"])
+            lines.extend(active["finish"](report.iter_signals(), active["analyzed"], job.found))
+        lines.extend((f"Error: analysis failed: {e}", None) for e in active["errors"])
+        if store_path is None:
+            view.extend(lines)
+        else:
+            report.tail = lines
+            view.set_source(report)
+        active.clear()
+        browse_button.configure(state="normal")
+        batch_button.configure(state="normal")
+        cancel_button.configure(state="disabled")
+        if job.cancelled:
+            label_progress.configure(text=f"Cancelled at {job.progress_text()}")
+
+    # --- Cancel: stop the worker and keep whatever finished so far ---
+    def cancel_analysis():
+        job = active.get("job")
+        if job is None:
+            return
+        # The job still posts "done" once its store is flushed; the poll finishes up then
+        job.cancel()
+        cancel_button.configure(state="disabled")
+        label_progress.configure(text="Cancelling...")
 
     # --- Browse single file ---
     def browse_file():
         filepath = filedialog.askopenfilename(
-            title="Select a .docx, .pdf, or .xml file",
-            filetypes=(("Supported Files", "*.docx *.pdf *.xml"), ("Word Documents", "*.docx"), ("PDF Files", "*.pdf"), ("XML Files", "*.xml"), ("All files", "*.*"))
+            title="Select a .docx, .pdf, .xml or .zip file",
+            filetypes=(("Supported Files", "*.docx *.pdf *.xml *.zip"), ("Word Documents", "*.docx"), ("PDF Files", "*.pdf"), ("XML Files", "*.xml"), ("Submission Archives", "*.zip"), ("All files", "*.*"))
         )
         if not filepath:
             return
-        results = analyze_file(filepath)
-        current_results.clear()
-        current_results.extend(results)
-        _display_results(current_results)
-        label_file.configure(text=f"Analyzed: {os.path.basename(filepath)}")
+        if filepath.lower().endswith(".zip"):
+            # An LMS download: analyze its members as a batch, straight from the archive
+            _analyze_batch(filepath, os.path.dirname(filepath), "archive")
+            return
+
+        def file_lines(result):
+            return _report_lines(result.findings)
+
+        def finish(signals, analyzed, found):
+            status = "Analyzed" if analyzed else "Cancelled"
+            label_file.configure(text=f"{status}: {os.path.basename(filepath)}")
+            return []
+
+        label_file.configure(text=f"Analyzing: {os.path.basename(filepath)}")
+        # One file: analyze in the worker thread itself, no process pool to start
+        _start_analysis([filepath], file_lines, finish, max_workers=1)
 
     # --- Browse folder (batch) ---
     def browse_folder():
         folder = filedialog.askdirectory(title="Select Folder Containing .docx Files")
-        if not folder:
-            return
-        supported_files = sorted(
-            f for f in os.listdir(folder)
-            if f.lower().endswith('.docx') or f.lower().endswith('.pdf')
-        )
-        if not supported_files:
-            current_results.clear()
-            current_results.append("No .docx or .pdf files found in the selected folder.")
-            _display_results(current_results)
-            label_file.configure(text="No files found.")
-            return
-        combined = []
-        for fname in supported_files:
-            sep = "=" * 60
-            combined.append(sep)
-            combined.append(f"=== FILE: {fname} ===")
-            combined.append(sep)
-            combined.extend(analyze_file(os.path.join(folder, fname)))
-            combined.append("")
-        current_results.clear()
-        current_results.extend(combined)
-        _display_results(current_results)
-        label_file.configure(text=f"Analyzed {len(supported_files)} file(s) from folder.")
+        if folder:
+            _analyze_batch(folder, folder, "folder")
+
+    def _analyze_batch(path, root, kind):
+        """
+        Analyze every file found in a folder tree or .zip archive; paths are shown relative to root.
+
+        Results go to a run store kept per folder or archive, so an interrupted
+        run (Cancel, or the window closed mid-batch) resumes where it stopped.
+        """
+
+        def file_lines(result):
+            lines = _banner(f"FILE: {os.path.relpath(result.path, root)}")
+            lines.extend(_report_lines(result.findings))
+            lines.append(("", None))
+            return lines
+
+        def finish(signals, analyzed, found):
+            lines = []
+            if not found:
+                label_file.configure(text="No files found.")
+                return [(f"No .docx or .pdf files found in the selected {kind}.", None)]
+            rsid_index = RsidIndex()
+            text_index = TextIndex()
+            for file_path, file_signals in signals:
+                label = os.path.relpath(file_path, root)
+                if "rsids" in file_signals:
+                    rsid_index.add(label, file_signals["rsids"])
+                text_index.add(label, file_signals.get("minhash"))
+            if len(rsid_index) > 1 or len(text_index) > 1:
+                lines.extend(_banner("BATCH SUMMARY"))
+            if len(rsid_index) > 1:
+                lines.extend(_report_lines(cluster_findings(rsid_index.clusters(), rsid_index.template_rsids())))
+                lines.extend(_report_lines(similarity_findings(rsid_index.top_pairs(10))))
+            if len(text_index) > 1:
+                lines.extend(_report_lines(text_similarity_findings(text_index.top_pairs(10))))
+            if analyzed < found:
+                label_file.configure(text=f"Cancelled: analyzed {analyzed} of {found} file(s) found in {kind}.")
+            else:
+                label_file.configure(text=f"Analyzed {found} file(s) from {kind}.")
+            return lines
+
+        label_file.configure(text=f"Analyzing files in {kind}...")
+        # Discovery is a generator: the first file is analyzed while the rest is still being found
+        _start_analysis(discover_files([path]), file_lines, finish, store_path=default_store_path(path))
 
     # --- Save report ---
     def save_report():
-        if not current_results:
+        if view.empty:
             return
         filepath = filedialog.asksaveasfilename(
             title="Save Report",
@@ -129,14 +279,15 @@ def create_and_run_gui():
         if not filepath:
             return
         with open(filepath, "w", encoding="utf-8") as f:
-            f.write("\n".join(current_results))
+            # Page by page: a stored report is never in memory all at once
+            f.writelines(line + "\n" for line, _ in view.iter_lines())
 
     # --- Copy to clipboard ---
     def copy_to_clipboard():
-        if not current_results:
+        if view.empty:
             return
         app.clipboard_clear()
-        app.clipboard_append("\n".join(current_results))
+        app.clipboard_append("\n".join(line for line, _ in view.iter_lines()))
 
     # --- Buttons (2 x 2 grid) ---
     browse_button = customtkinter.CTkButton(
@@ -160,11 +311,42 @@ def create_and_run_gui():
     clipboard_button.grid(row=1, column=1, padx=10, pady=(5, 10), sticky="ew")
 
     label_file = customtkinter.CTkLabel(frame_top, text="No file selected", text_color="gray")
-    label_file.grid(row=2, column=0, columnspan=2, padx=10, pady=(0, 10))
+    label_file.grid(row=2, column=0, columnspan=2, padx=10, pady=(0, 5))
+
+    # --- Progress (files done, files/s, ETA) and cancel ---
+    progress_bar = customtkinter.CTkProgressBar(frame_top)
+    progress_bar.set(0)
+    progress_bar.grid(row=3, column=0, columnspan=2, padx=10, pady=(0, 5), sticky="ew")
+
+    label_progress = customtkinter.CTkLabel(frame_top, text="", text_color="gray")
+    label_progress.grid(row=4, column=0, padx=10, pady=(0, 10), sticky="w")
+
+    cancel_button = customtkinter.CTkButton(
+        frame_top, text="Cancel", command=cancel_analysis, state="disabled"
+    )
+    cancel_button.grid(row=4, column=1, padx=10, pady=(0, 10), sticky="ew")
 
     # --- Results text area ---
     result_text = customtkinter.CTkTextbox(app, wrap="word", state="disabled")
-    result_text.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="nsew")
+    result_text.grid(row=1, column=0, padx=20, pady=(0, 5), sticky="nsew")
+
+    # --- Pager for very long reports ---
+    frame_pager = customtkinter.CTkFrame(app, fg_color="transparent")
+    frame_pager.grid(row=2, column=0, padx=20, pady=(0, 15), sticky="ew")
+    frame_pager.grid_columnconfigure(1, weight=1)
+
+    prev_button = customtkinter.CTkButton(frame_pager, text="< Previous", width=100)
+    prev_button.grid(row=0, column=0, sticky="w")
+
+    label_page = customtkinter.CTkLabel(frame_pager, text="", text_color="gray")
+    label_page.grid(row=0, column=1)
+
+    next_button = customtkinter.CTkButton(frame_pager, text="Next >", width=100)
+    next_button.grid(row=0, column=2, sticky="e")
+
+    view = ReportView(app, result_text, label_page, prev_button, next_button)
+    prev_button.configure(command=view.previous_page)
+    next_button.configure(command=view.next_page)
 
     # --- Color tags ---
     result_text.tag_config("header",    foreground="#888888")
@@ -180,5 +362,6 @@ def create_and_run_gui():
     result_text.tag_config("comment",   foreground="#DDA0DD")
     result_text.tag_config("format",    foreground="#5FA8F2")
     result_text.tag_config("gdocs",     foreground="#4285F4")
+    result_text.tag_config("shared",    foreground="#FF4500")
 
     app.mainloop()
@@ -0,0 +1,228 @@
+from modules.batch import ResultStore
+from modules.batch.store import STAT
+
+
+# Lines inserted per Tk event-loop turn; small enough to keep the window responsive
+_CHUNK_LINES = 2000
+
+# Lines shown per page; longer reports get Previous/Next controls
+_PAGE_LINES = 20000
+
+# Files per page of a report read back from a ResultStore
+PAGE_FILES = 100
+
+
+def _tag_runs(lines):
+    """
+    Merge consecutive (line, tag) pairs with the same tag into (text, tag) runs.
+
+    A report is mostly long stretches of one colour, so this turns thousands of
+    per-line insert calls into a few dozen.
+    """
+    runs = []
+    texts = []
+    current = None
+    for line, tag in lines:
+        if tag != current and texts:
+            runs.append(("\n".join(texts) + "\n", current))
+            texts = []
+        current = tag
+        texts.append(line)
+    if texts:
+        runs.append(("\n".join(texts) + "\n", current))
+    return runs
+
+
+class ReportView:
+    """
+    Renders a report of (line, tag) pairs into a CTkTextbox.
+
+    Lines are inserted a chunk at a time from the Tk event loop, as coalesced
+    tag runs, so appending tens of thousands of lines never blocks the window.
+    Only one page of at most _PAGE_LINES lines is in the textbox at a time.
+
+    The report is either held in `lines` (set_lines, extend) or read from a
+    page source (set_source), which builds each page on demand, e.g. from a
+    ResultStore, so only the page shown is in memory. A source has:
+        page_count          number of pages
+        page(n)             the (line, tag) pairs of page n
+        describe(n)         pager label text for page n
+        close()             release it once replaced
+    iter_lines() yields the whole report either way (used by save and clipboard).
+    """
+
+    def __init__(self, app, textbox, page_label, prev_button, next_button, page_lines=_PAGE_LINES):
+        self.lines = []
+        self._source = None
+        self._source_page = (None, [])  # (page number, lines) last read from the source
+        self._app = app
+        self._textbox = textbox
+        self._page_label = page_label
+        self._prev_button = prev_button
+        self._next_button = next_button
+        self._page_lines = page_lines
+        self._page = 0
+        self._rendered = 0  # lines of the current page already in the textbox
+        self._scheduled = None
+        self._update_pager()
+
+    @property
+    def page_count(self):
+        if self._source is not None:
+            return max(1, self._source.page_count)
+        return max(1, -(-len(self.lines) // self._page_lines))
+
+    @property
+    def empty(self):
+        return self._source is None and not self.lines
+
+    def _drop_source(self):
+        if self._source is not None:
+            self._source.close()
+        self._source = None
+        self._source_page = (None, [])
+
+    def set_lines(self, lines):
+        """Replace the whole report and show its first page."""
+        self._drop_source()
+        self.lines = list(lines)
+        self.show_page(0)
+
+    def set_source(self, source, page=0):
+        """Replace the report with one read page by page from `source`, showing `page`."""
+        self._drop_source()
+        self.lines = []
+        self._source = source
+        self.show_page(page)
+
+    def iter_lines(self):
+        """Every (line, tag) pair of the report, page by page."""
+        if self._source is None:
+            yield from self.lines
+            return
+        for page in range(self._source.page_count):
+            yield from self._source.page(page)
+
+    def _page_span(self):
+        """(lines, start, end): the displayed page is lines[start:end]."""
+        if self._source is not None:
+            if self._source_page[0] != self._page:
+                self._source_page = (self._page, self._source.page(self._page))
+            lines = self._source_page[1]
+            return lines, 0, len(lines)
+        start = self._page * self._page_lines
+        return self.lines, start, min(len(self.lines), start + self._page_lines)
+
+    def extend(self, lines):
+        """Append to the report; lines landing on the displayed page appear shortly."""
+        self.lines.extend(lines)
+        self._update_pager()
+        self._schedule()
+
+    def show_page(self, page):
+        self._page = min(max(page, 0), self.page_count - 1)
+        self._rendered = 0
+        self._textbox.configure(state="normal")
+        self._textbox.delete("1.0", "end")
+        self._textbox.configure(state="disabled")
+        self._update_pager()
+        self._schedule()
+
+    def next_page(self):
+        self.show_page(self._page + 1)
+
+    def previous_page(self):
+        self.show_page(self._page - 1)
+
+    def _schedule(self):
+        if self._scheduled is None:
+            self._scheduled = self._app.after_idle(self._render_chunk)
+
+    def _render_chunk(self):
+        self._scheduled = None
+        lines, page_start, page_end = self._page_span()
+        start = page_start + self._rendered
+        end = min(page_end, start + _CHUNK_LINES)
+        if end <= start:
+            return
+        self._textbox.configure(state="normal")
+        for text, tag in _tag_runs(lines[start:end]):
+            self._textbox.insert("end", text, tag)
+        self._textbox.configure(state="disabled")
+        self._rendered += end - start
+        if end < page_end:
+            # Yield to the event loop (input, redraws) before the next chunk
+            self._scheduled = self._app.after(1, self._render_chunk)
+
+    def _update_pager(self):
+        pages = self.page_count
+        if pages == 1:
+            self._page_label.configure(text="")
+        elif self._source is not None:
+            self._page_label.configure(text=self._source.describe(self._page))
+        else:
+            first = self._page * self._page_lines + 1
+            last = min(len(self.lines), (self._page + 1) * self._page_lines)
+            self._page_label.configure(
+                text=f"Page {self._page + 1} of {pages}  (lines {first:,}-{last:,} of {len(self.lines):,})"
+            )
+        self._prev_button.configure(state="normal" if self._page > 0 else "disabled")
+        self._next_button.configure(state="normal" if self._page < pages - 1 else "disabled")
+
+
+class StoredReport:
+    """
+    A ReportView page source over the latest run of a ResultStore.
+
+    Page n holds the files at input positions [n * files_per_page,
+    (n + 1) * files_per_page), read from the store when the page is shown;
+    the last page ends with `tail`. The store is opened with resume=STAT,
+    which reads the latest run without writing to it, on the calling (Tk)
+    thread: SQLite connections cannot be shared across threads.
+    """
+
+    def __init__(self, store_path, total, file_lines, extra=None, files_per_page=PAGE_FILES):
+        """
+        Args:
+            store_path (str): ResultStore file written by the finished job.
+            total (int): Number of input files, stored or not.
+            file_lines (callable): file_lines(result) -> (line, tag) pairs.
+            extra (dict): {index: FileResult} for results the store does not
+                          hold (timeouts, crashes, out of memory); merged
+                          in by index.
+        """
+        self._store = ResultStore(store_path, resume=STAT)
+        self._total = total
+        self._file_lines = file_lines
+        self._extra = extra or {}
+        self.tail = []  # (line, tag) pairs ending the last page, e.g. the batch summary
+        self._files_per_page = files_per_page
+
+    @property
+    def page_count(self):
+        return max(1, -(-self._total // self._files_per_page))
+
+    def page(self, n):
+        start = n * self._files_per_page
+        stop = start + self._files_per_page
+        results = list(self._store.iter_results(start, stop))
+        results.extend(result for index, result in self._extra.items() if start <= index < stop)
+        results.sort(key=lambda result: result.index)
+        lines = []
+        for result in results:
+            lines.extend(self._file_lines(result))
+        if n == self.page_count - 1:
+            lines.extend(self.tail)
+        return lines
+
+    def iter_signals(self):
+        """(path, signals) for every stored file, in input order (see ResultStore.iter_signals)."""
+        return self._store.iter_signals()
+
+    def describe(self, n):
+        first = n * self._files_per_page + 1
+        last = min(self._total, (n + 1) * self._files_per_page)
+        return f"Page {n + 1} of {self.page_count}  (files {first:,}-{last:,} of {self._total:,})"
+
+    def close(self):
+        self._store.close()
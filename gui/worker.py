@@ -0,0 +1,155 @@
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from modules.batch import ResultStore, iter_batch, last_run_unfinished, open_default_cache, prune_run_stores
+from modules.batch.store import STAT
+
+
+class AnalysisJob:
+    """
+    Runs a batch analysis on a background thread so the Tk event loop stays responsive.
+
+    The worker thread only ever talks to the UI through `messages`, a queue the
+    UI drains from an `app.after` poll; Tk widgets must not be touched from any
+    other thread. Messages are (kind, payload) tuples:
+        ("store", str | None)   first: the run store results are recorded in,
+                                or None if there is none (see store_path)
+        ("result", FileResult)  one per finished file, in completion order
+        ("error", str)          the batch itself failed
+        ("done", None)          always last
+    """
+
+    def __init__(self, file_paths, max_workers=None, store_path=None):
+        """
+        Args:
+            file_paths (list | iterable): Paths to analyze. A generator (e.g.
+                               discover_files over a folder tree) is drained on
+                               a discovery thread of its own, so analysis starts
+                               on the first file while `found` and `total` catch
+                               up with the rest.
+            max_workers (int): Worker process count (see iter_batch). Use 1 for a
+                               single file to skip the process pool start-up.
+            store_path (str): Optional ResultStore file. Every result is
+                              recorded there as it arrives, so the report can
+                              be read back from it instead of kept in memory.
+                              If the last run recorded there never finished,
+                              it is resumed: files already done are not
+                              analyzed again. Old stores in the cache folder are pruned
+                              (see prune_run_stores).
+        """
+        if isinstance(file_paths, (list, tuple)):
+            self.file_paths = list(file_paths)
+            self.total = len(self.file_paths)
+        else:
+            self.file_paths = file_paths
+            self.total = None       # set once discovery finishes
+        self.found = self.total or 0
+        self.done = 0
+        self.messages = queue.Queue()
+        self.started = None
+        self._max_workers = max_workers
+        self._store_path = store_path
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="analysis", daemon=True)
+
+    def start(self):
+        self.started = time.monotonic()
+        self._thread.start()
+
+    def cancel(self):
+        """Ask the worker to stop; queued files are dropped and no further results are posted."""
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def _discover(self, paths, found):
+        """Discovery thread: move paths into the `found` queue, counting them, until cancelled."""
+        try:
+            for path in paths:
+                if self._cancel.is_set():
+                    break
+                found.put(path)
+                self.found += 1
+        finally:
+            self.total = self.found
+            found.put(None)
+
+    def _discovered(self):
+        """Paths in discovery order; started on first use, from the analysis thread."""
+        found = queue.Queue()
+        threading.Thread(target=self._discover, args=(self.file_paths, found),
+                         name="discovery", daemon=True).start()
+        while True:
+            path = found.get()
+            if path is None:
+                return
+            yield path
+
+    def _open_store(self):
+        """The run store for this job, or None if there is none or it cannot be opened."""
+        if self._store_path is None:
+            return None
+        try:
+            os.makedirs(os.path.dirname(self._store_path), exist_ok=True)
+            # One store per folder scanned: drop the ones not used for longest
+            prune_run_stores(keep=self._store_path)
+            resume = STAT if last_run_unfinished(self._store_path) else None
+            return ResultStore(self._store_path, resume=resume)
+        except (OSError, sqlite3.Error):
+            return None
+
+    def _run(self):
+        # The result cache and store are SQLite, whose connections belong to
+        # the thread that opened them, so they are opened here rather than by the UI
+        cache = open_default_cache()
+        store = self._open_store()
+        self.messages.put(("store", store.path if store is not None else None))
+        paths = self.file_paths if self.total is not None else self._discovered()
+        try:
+            for result in iter_batch(paths, self._max_workers, cache, cancel=self._cancel, store=store):
+                self.messages.put(("result", result))
+            if store is not None and not self._cancel.is_set():
+                store.finish()
+        except Exception as e:
+            self.messages.put(("error", str(e)))
+        finally:
+            if cache is not None:
+                cache.close()
+            if store is not None:
+                store.close()
+            self.messages.put(("done", None))
+
+    def poll(self, limit=200):
+        """
+        Take up to `limit` messages without blocking (called from the Tk thread).
+
+        Results are counted towards `done` as they are taken.
+        """
+        taken = []
+        for _ in range(limit):
+            try:
+                kind, payload = self.messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "result":
+                self.done += 1
+            taken.append((kind, payload))
+        return taken
+
+    def progress_text(self):
+        """e.g. '12 / 40 files  |  3.1 files/s  |  ETA 0:09', or '12 / 40+ files' while still discovering."""
+        elapsed = time.monotonic() - self.started if self.started is not None else 0.0
+        if self.total is None:
+            return f"{self.done} / {self.found}+ files"
+        text = f"{self.done} / {self.total} files"
+        if self.done and elapsed > 0:
+            rate = self.done / elapsed
+            remaining = round((self.total - self.done) / rate)
+            text += f"  |  {rate:.1f} files/s  |  ETA {remaining // 60}:{remaining % 60:02d}"
+        return text
@@ -0,0 +1,114 @@
+
+import hashlib
+import io
+import threading
+import zipfile
+
+from .docx_package import MAX_PART_BYTES, MAX_RATIO, RATIO_MIN_BYTES, OversizePart
+
+
+# Separates an archive's path from a member's path inside it, e.g.
+# "submissions.zip::Jane Doe_1234/essay.docx". Never part of a Windows path,
+# and vanishingly rare in POSIX file names.
+MEMBER_SEP = "::"
+
+ARCHIVE_EXTENSIONS = ('.zip',)
+
+# One open archive per thread, so members of the same archive analyzed one
+# after another reuse its central directory
+_local = threading.local()
+
+
+def member_path(archive_path, member):
+    """The path reported for `member` of the archive at `archive_path`."""
+    return f"{archive_path}{MEMBER_SEP}{member}"
+
+
+def split_member(path):
+    """
+    Split an archive member path into (archive path, member name).
+
+    Returns:
+        tuple: (archive_path, member), or None for an ordinary file path.
+    """
+    archive_path, sep, member = path.partition(MEMBER_SEP)
+    if not sep or not archive_path.lower().endswith(ARCHIVE_EXTENSIONS):
+        return None
+    return archive_path, member
+
+
+def list_members(archive_path, extensions):
+    """
+    Names of the archive members whose names end in one of `extensions`, in
+    archive order. Folders inside the archive are included; only the central
+    directory is read.
+    """
+    with zipfile.ZipFile(archive_path) as archive:
+        return [zi.filename for zi in archive.infolist()
+                if not zi.is_dir() and zi.filename.lower().endswith(extensions)]
+
+
+def _archive(archive_path):
+    cached = getattr(_local, "archive", None)
+    if cached is not None and cached[0] == archive_path:
+        return cached[1]
+    if cached is not None:
+        cached[1].close()
+    _local.archive = None
+    archive = zipfile.ZipFile(archive_path)
+    _local.archive = (archive_path, archive)
+    return archive
+
+
+def close_archives():
+    """
+    Close the archive this thread kept open for member reads, if any.
+
+    Called once a batch is over, so the .zip is not held open (and, on
+    Windows, locked against deletion) for the rest of the process.
+    """
+    cached = getattr(_local, "archive", None)
+    _local.archive = None
+    if cached is not None:
+        cached[1].close()
+
+
+def _member_info(path):
+    archive_path, member = split_member(path)
+    archive = _archive(archive_path)
+    return archive, archive.getinfo(member)
+
+
+def open_member(path):
+    """
+    Read an archive member into memory and return it as a binary file object.
+
+    Nothing is written to disk: zipfile and pypdf both read from the returned
+    BytesIO. The member is held under the same size and compression-ratio
+    limits as the parts of a .docx.
+
+    Raises:
+        KeyError: If the member is not in the archive.
+        zipfile.BadZipFile: If the archive cannot be read.
+        OversizePart: If the member is over the limits.
+    """
+    archive, zi = _member_info(path)
+    ratio = zi.file_size / max(zi.compress_size, 1)
+    if zi.file_size > MAX_PART_BYTES:
+        raise OversizePart(zi.filename, f"{zi.filename} was not analyzed: {zi.file_size:,} bytes uncompressed, "
+                                        f"over the {MAX_PART_BYTES:,}-byte limit.")
+    if zi.file_size >= RATIO_MIN_BYTES and ratio > MAX_RATIO:
+        raise OversizePart(zi.filename, f"{zi.filename} was not analyzed: compressed {ratio:,.0f}:1, "
+                                        f"over the {MAX_RATIO}:1 limit.")
+    with archive.open(zi) as member:
+        return io.BytesIO(member.read(MAX_PART_BYTES + 1))
+
+
+def member_digest(path):
+    """
+    Stand-in for a content hash of an archive member, from the central
+    directory alone: its CRC-32 and sizes. Lets cached results be found
+    without decompressing the member.
+    """
+    _, zi = _member_info(path)
+    return hashlib.sha256(f"zip:{zi.CRC:08x}:{zi.file_size}:{zi.compress_size}".encode()).hexdigest()
@@ -0,0 +1,7 @@
+
+from .engine import analyze_batch, iter_batch, is_failure
+from .cache import ResultCache, open_default_cache
+from .store import ResultStore, default_store_path, last_run_unfinished, prune_run_stores
+from .discovery import discover_files
+from .rsid_index import RsidIndex, cluster_findings, similarity_findings, write_pairs_csv
+from .text_index import TextIndex, text_similarity_findings, write_text_pairs_csv
@@ -0,0 +1,249 @@
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+import zipfile
+
+from ..archive import split_member, member_digest
+from ..findings import to_dict, from_dict
+from ..keywords import fingerprint as keyword_fingerprint
+
+
+_DIST_NAME = "docx-integrity-checker"
+
+# Default on-disk budget for cached results
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Writes are committed in groups rather than per file, but never held for long
+# so other processes sharing the cache are not locked out
+_COMMIT_EVERY = 200
+_COMMIT_INTERVAL = 1.0
+
+_HASH_CHUNK = 1024 * 1024
+
+# Remembered (size, mtime) -> content hash entries; past this the oldest are dropped
+_MAX_STAT_ROWS = 100_000
+
+# Bumped whenever the stored record layout changes; older cache files are emptied on open
+_FORMAT_VERSION = 5
+
+
+def analyzer_version():
+    """
+    Return the analyzer version, from installed package metadata or, when running
+    from a source checkout, from pyproject.toml. Cached results from any other
+    version are never reused.
+    """
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+        try:
+            return version(_DIST_NAME)
+        except PackageNotFoundError:
+            pass
+    except ImportError:
+        pass
+
+    pyproject = os.path.join(os.path.dirname(__file__), "..", "..", "pyproject.toml")
+    try:
+        with open(pyproject, encoding="utf-8") as f:
+            match = re.search(r'^version\s*=\s*"([^"]+)"', f.read(), re.MULTILINE)
+        if match:
+            return match.group(1)
+    except OSError:
+        pass
+    return "unknown"
+
+
+def default_cache_dir():
+    """Per-user cache folder (override with DOCX_INTEGRITY_CACHE_DIR)."""
+    override = os.environ.get("DOCX_INTEGRITY_CACHE_DIR")
+    if override:
+        return override
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, _DIST_NAME)
+
+
+def file_digest(file_path):
+    """SHA-256 of the file's bytes, as a hex string."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    On-disk cache of analysis results, keyed by file content hash + analyzer version.
+
+    Stored in SQLite. When the total stored size exceeds max_bytes the least
+    recently used entries are evicted.
+
+    Each file's hash is remembered with its size and modification time (the
+    `stats` table), so a file that has not changed since it was last keyed is
+    looked up without reading it, as ResultStore resumes a run. Only new or
+    changed files are hashed.
+    """
+
+    def __init__(self, path=None, max_bytes=DEFAULT_MAX_BYTES, version=None):
+        if path is None:
+            folder = default_cache_dir()
+            os.makedirs(folder, exist_ok=True)
+            path = os.path.join(folder, "results.sqlite3")
+        self.path = path
+        self.max_bytes = max_bytes
+        self.version = version or analyzer_version()
+
+        self._db = sqlite3.connect(path, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        if self._db.execute("PRAGMA user_version").fetchone()[0] != _FORMAT_VERSION:
+            self._db.execute("DROP TABLE IF EXISTS results")
+            self._db.execute("DROP TABLE IF EXISTS stats")
+            self._db.execute(f"PRAGMA user_version = {_FORMAT_VERSION}")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY,"
+            " findings TEXT NOT NULL,"
+            " signals TEXT NOT NULL DEFAULT '{}',"
+            " size INTEGER NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS stats ("
+            " path TEXT PRIMARY KEY,"
+            " size INTEGER NOT NULL,"
+            " mtime_ns INTEGER NOT NULL,"
+            " digest TEXT NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_lru ON results(last_used)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS stats_lru ON stats(last_used)")
+        self._total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        self._stat_rows = self._db.execute("SELECT COUNT(*) FROM stats").fetchone()[0]
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+
+    def key_for(self, file_path, level="full"):
+        """
+        Return the cache key for a file analyzed at `level`, or None if it cannot be read.
+
+        Archive members are keyed from the archive's central directory (see
+        archive.member_digest), so looking them up decompresses nothing. A
+        file whose size and modification time match the last time it was
+        keyed reuses that hash instead of being read again.
+        """
+        try:
+            digest = member_digest(file_path) if split_member(file_path) else self._file_digest(file_path)
+        except (OSError, KeyError, zipfile.BadZipFile):
+            return None
+        # Results also depend on the keyword list and whether body text is scanned
+        return f"{digest}:{self.version}:{level}:{keyword_fingerprint()}"
+
+    def _file_digest(self, file_path):
+        """file_digest(file_path), from the stats table while the file's size and mtime are unchanged."""
+        path = os.path.abspath(file_path)
+        st = os.stat(path)
+        row = self._db.execute("SELECT size, mtime_ns, digest FROM stats WHERE path = ?", (path,)).fetchone()
+        if row is not None and row[:2] == (st.st_size, st.st_mtime_ns):
+            self._db.execute("UPDATE stats SET last_used = ? WHERE path = ?", (time.time(), path))
+            self._maybe_commit()
+            return row[2]
+        digest = file_digest(path)
+        self._db.execute(
+            "INSERT OR REPLACE INTO stats (path, size, mtime_ns, digest, last_used) VALUES (?, ?, ?, ?, ?)",
+            (path, st.st_size, st.st_mtime_ns, digest, time.time()),
+        )
+        if row is None:
+            self._stat_rows += 1
+            if self._stat_rows > _MAX_STAT_ROWS:
+                # Trim to 90% so this does not run on every new file
+                excess = self._stat_rows - int(_MAX_STAT_ROWS * 0.9)
+                self._db.execute(
+                    "DELETE FROM stats WHERE path IN (SELECT path FROM stats ORDER BY last_used LIMIT ?)", (excess,)
+                )
+                self._stat_rows -= excess
+        self._maybe_commit()
+        return digest
+
+    def get(self, key):
+        """Return cached (findings, signals) for `key`, or None on a miss."""
+        row = self._db.execute("SELECT findings, signals FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self._db.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+        self._maybe_commit()
+        return [from_dict(item) for item in json.loads(row[0])], json.loads(row[1])
+
+    def put(self, key, findings, signals=None):
+        """Store findings and batch signals under `key`, evicting least recently used entries if over budget."""
+        payload = json.dumps([to_dict(f) for f in findings], ensure_ascii=False, default=str)
+        signals_payload = json.dumps(signals or {})
+        size = len(payload) + len(signals_payload)
+        old = self._db.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+        self._db.execute(
+            "INSERT OR REPLACE INTO results (key, findings, signals, size, last_used) VALUES (?, ?, ?, ?, ?)",
+            (key, payload, signals_payload, size, time.time()),
+        )
+        self._total += size - (old[0] if old else 0)
+        if self._total > self.max_bytes:
+            self._evict()
+        self._maybe_commit()
+
+    def _evict(self):
+        # Trim to 90% of the budget so eviction does not run on every put
+        target = self.max_bytes * 0.9
+        rows = self._db.execute("SELECT key, size FROM results ORDER BY last_used")
+        doomed = []
+        for key, size in rows:
+            if self._total <= target:
+                break
+            doomed.append((key,))
+            self._total -= size
+        rows.close()
+        self._db.executemany("DELETE FROM results WHERE key = ?", doomed)
+
+    def clear(self):
+        self._db.execute("DELETE FROM results")
+        self._db.execute("DELETE FROM stats")
+        self._total = 0
+        self._stat_rows = 0
+        self.flush()
+
+    def _maybe_commit(self):
+        self._uncommitted += 1
+        if (self._uncommitted >= _COMMIT_EVERY
+                or time.monotonic() - self._last_commit >= _COMMIT_INTERVAL):
+            self.flush()
+
+    def flush(self):
+        self._db.commit()
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+
+    def close(self):
+        self.flush()
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def open_default_cache():
+    """Open the per-user ResultCache, or return None if it cannot be created (e.g. read-only home)."""
+    try:
+        return ResultCache()
+    except (OSError, sqlite3.Error):
+        return None
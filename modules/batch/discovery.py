@@ -0,0 +1,159 @@
+
+import fnmatch
+import os
+import re
+import zipfile
+
+from ..archive import ARCHIVE_EXTENSIONS, list_members, member_path
+
+
+# Files analyzed when none are named
+DOCUMENT_EXTENSIONS = ('.docx', '.pdf')
+
+# Skipped unless the caller says otherwise: Word lock files (~$essay.docx),
+# hidden files and folders (.git, macOS ._ resource forks) and the
+# __MACOSX folder that Finder adds to zip archives
+DEFAULT_EXCLUDE = ('~$*', '.*', '__MACOSX')
+
+
+def _compile(patterns):
+    """One regex matching any of the glob patterns, or None for no patterns."""
+    if not patterns:
+        return None
+    flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+    return re.compile('|'.join(fnmatch.translate(p) for p in patterns), flags)
+
+
+def _matches(regex, name, relative):
+    return regex is not None and (regex.match(name) is not None or regex.match(relative) is not None)
+
+
+def _archive_members(archive_path, relative, extensions, include, exclude):
+    """Member paths of a .zip found by discovery, filtered like files in a folder."""
+    try:
+        members = list_members(archive_path, extensions)
+    except (OSError, zipfile.BadZipFile):
+        # Yielded as is, so the analysis reports the unreadable archive
+        yield archive_path
+        return
+    for member in members:
+        parts = member.split('/')
+        member_relative = relative + '/' + member
+        if any(_matches(exclude, part, member_relative) for part in parts):
+            continue
+        if include is not None and not _matches(include, parts[-1], member_relative):
+            continue
+        yield member_path(archive_path, member)
+
+
+def discover_files(paths, extensions=DOCUMENT_EXTENSIONS, include=(), exclude=DEFAULT_EXCLUDE,
+                   follow_symlinks=True, archives=True):
+    """
+    Yield the files to analyze under `paths`, walking folders recursively.
+
+    Files are yielded as they are found, so a batch can start on the first
+    one while the rest of the tree is still being read. Each folder is read
+    with os.scandir and its entries sorted by name; files come before the
+    subfolders, which are then walked depth-first in name order. Only one
+    folder's listing is held at a time.
+
+    A file reached twice (given twice, hard-linked, or through a symlink) is
+    yielded once, and a folder reached twice (e.g. a symlink to its parent)
+    is walked once.
+
+    A .zip archive (given, or found in a folder) stands for its members: each
+    member with a matching extension is yielded as "archive.zip::path/in/zip"
+    (see archive.member_path), to be read from memory by analyze_file.
+
+    Args:
+        paths (iterable): Files and folders. Files are yielded as given (even
+                          if missing, so the analysis can report them); only
+                          duplicates are dropped.
+        extensions (tuple): Lower-case suffixes of the files to yield from folders.
+        include (iterable): Glob patterns; if any are given, a file found in a
+                            folder must match one. Patterns are matched against
+                            the file name and its path relative to the folder
+                            given (with '/' separators), e.g. '*.docx' or
+                            'week3/*'.
+        exclude (iterable): Glob patterns for files and folders to skip, matched
+                            the same way. An excluded folder is not entered.
+        follow_symlinks (bool): Walk into symlinked folders and yield symlinked files.
+        archives (bool): Expand .zip archives into their members.
+
+    Yields:
+        str: File paths.
+    """
+    include = _compile(tuple(include))
+    exclude = _compile(tuple(exclude))
+    seen_files = set()
+    seen_dirs = set()
+
+    def first_visit(seen, key):
+        # Inode 0 means the platform gave none; such entries are never merged
+        if key[1] == 0:
+            return True
+        if key in seen:
+            return False
+        seen.add(key)
+        return True
+
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            yield path
+            continue
+        if not os.path.isdir(path):
+            if first_visit(seen_files, (st.st_dev, st.st_ino)):
+                if archives and path.lower().endswith(ARCHIVE_EXTENSIONS):
+                    yield from _archive_members(path, os.path.basename(path), extensions, include, exclude)
+                else:
+                    yield path
+            continue
+        if not first_visit(seen_dirs, (st.st_dev, st.st_ino)):
+            continue
+
+        # Folders still to walk: (path, path relative to the root, device)
+        stack = [(path, '', st.st_dev)]
+        while stack:
+            folder, relative, device = stack.pop()
+            try:
+                with os.scandir(folder) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError:
+                continue  # unreadable or vanished; skip it like the rest of the walk
+
+            subfolders = []
+            for entry in entries:
+                name = entry.name
+                entry_relative = relative + name
+                if _matches(exclude, name, entry_relative):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=follow_symlinks):
+                        st = entry.stat()
+                        if first_visit(seen_dirs, (st.st_dev, st.st_ino)):
+                            subfolders.append((entry.path, entry_relative + '/', st.st_dev))
+                        continue
+                    is_archive = archives and name.lower().endswith(ARCHIVE_EXTENSIONS)
+                    if not ((is_archive or name.lower().endswith(extensions))
+                            and entry.is_file(follow_symlinks=follow_symlinks)):
+                        continue
+                    if not is_archive and include is not None and not _matches(include, name, entry_relative):
+                        continue
+                    if entry.is_symlink() or os.name == 'nt':
+                        st = entry.stat()
+                        key = (st.st_dev, st.st_ino)
+                    else:
+                        # A plain file lives on its folder's device; inode() needs no extra syscall
+                        key = (device, entry.inode())
+                except OSError:
+                    continue
+                if not first_visit(seen_files, key):
+                    continue
+                if is_archive:
+                    yield from _archive_members(entry.path, entry_relative, extensions, include, exclude)
+                else:
+                    yield entry.path
+
+            stack.extend(reversed(subfolders))
@@ -0,0 +1,254 @@
+
+import os
+from collections import deque
+from typing import NamedTuple
+
+from ..archive import close_archives
+from ..file_analyzer import analyze_file, FULL
+from ..findings import Finding, FAILURE, ERROR, error
+from ..profiling import recording
+from .supervisor import SupervisedPool, TIMEOUT, CRASH, MEMORY
+
+
+# Futures kept in flight per worker; bounds memory when the input is a long generator
+_QUEUE_DEPTH = 4
+
+# Seconds between checks of the cancel event while waiting on workers
+_CANCEL_POLL = 0.1
+
+
+class FileResult(NamedTuple):
+    """One analyzed file: its input position, path, findings and batch signals (see analyze_file)."""
+    index: int
+    path: str
+    findings: list
+    signals: dict
+
+
+def default_workers():
+    """Number of worker processes used when none is given: one per CPU core."""
+    return os.cpu_count() or 1
+
+
+def _analyze_one(file_path, level=FULL, profile=None, page_workers=None):
+    """
+    Worker entry point: returns (findings, signals, failure), with failure None
+    or MEMORY if the file ran out of memory. Never raises, so one bad file
+    cannot fail the batch.
+    """
+    signals = {}
+    try:
+        if profile is None:
+            return analyze_file(file_path, signals, level, page_workers), signals, None
+        with recording(profile) as recorded:
+            try:
+                return analyze_file(file_path, signals, level, page_workers), signals, None
+            finally:
+                signals["profile"] = recorded.records
+    except MemoryError:
+        return None, {}, MEMORY
+    except Exception as e:
+        return [error("ERROR", f"An unexpected error occurred during analysis: {e}", str(e))], signals, None
+
+
+def _failure_findings(failure, detail):
+    """
+    Findings for a file whose worker was killed (TIMEOUT), died (CRASH) or
+    ran out of memory (MEMORY, detail = the worker's cap in bytes or None).
+    """
+    if failure == MEMORY:
+        limit = f" (the limit is {detail / (1024 * 1024):,.0f} MB)" if detail else ""
+        return [Finding(FAILURE, ERROR, "memory", detail,
+                        f"Analysis stopped: the file needed more memory than the worker is allowed{limit}. "
+                        "It may be malformed or built to exhaust memory.")]
+    if failure == TIMEOUT:
+        return [Finding(FAILURE, ERROR, "timeout", detail,
+                        f"Analysis stopped: the file was still being analyzed after {detail:g} seconds. "
+                        "It may be malformed or built to stall the analyzer.")]
+    return [Finding(FAILURE, ERROR, "crash", detail,
+                    f"Analysis failed: the worker process analyzing this file crashed (exit code {detail}). "
+                    "The file may be malformed.")]
+
+
+def is_failure(result):
+    """
+    Whether a FileResult is a timeout, crash or memory failure from iter_batch.
+    Such results are never cached or stored.
+    """
+    findings = result.findings
+    return (len(findings) == 1 and findings[0].category == FAILURE
+            and findings[0].key in (TIMEOUT, CRASH, MEMORY))
+
+
+def _lookup(paths, cache, store, level):
+    """
+    Yield (index, file_path, cache_key, cached, stored) with cached = (findings, signals),
+    or None on a miss. `stored` is True when the result came from the run store.
+    """
+    for index, file_path in paths:
+        if store is not None:
+            stored = store.lookup(index, file_path, level)
+            if stored is not None:
+                yield index, file_path, None, stored, True
+                continue
+        key = cache.key_for(file_path, level) if cache is not None else None
+        cached = cache.get(key) if key is not None else None
+        yield index, file_path, key, cached, False
+
+
+def iter_batch(file_paths, max_workers=None, cache=None, cancel=None, level=FULL, profile=None,
+               timeout=None, memory_limit=None, store=None, page_workers=None):
+    """
+    Analyzes files across a pool of worker processes, yielding each result as it finishes.
+
+    Results arrive in completion order, not input order; use the yielded index
+    to put them back in place. With max_workers=1 and no timeout or memory
+    limit the files are analyzed in this process, one at a time, with no pool
+    start-up cost.
+
+    Worker processes are supervised: a file that runs past `timeout`, or whose
+    worker crashes, gets a single "timeout" or "crash" error finding, and a
+    fresh worker carries on with the rest of the batch. A file that runs out
+    of memory gets a "memory" error finding. None of these are cached or
+    stored, so a later run (perhaps with other limits) tries the file again.
+
+    Args:
+        file_paths (iterable): Paths to analyze. May be a generator.
+        max_workers (int): Worker process count. Defaults to one per CPU core.
+        cache (ResultCache): Optional result cache. Hits are yielded without
+                             opening the file's ZIP/PDF structure; misses are
+                             stored once analyzed.
+        cancel (threading.Event): Optional. Once set, no further results are
+                                  yielded, queued files are dropped and files
+                                  still running are stopped.
+        level (str): Analysis level, FULL or TRIAGE (see analyze_file).
+        profile (str): Optional profiling mode (profiling.TIME or MEMORY). Each
+                       result's signals then carry "profile": the per-checker
+                       records for that file. The cache is bypassed so every
+                       file is measured.
+        timeout (float): Optional. Seconds one file may take before its worker
+                         is killed.
+        memory_limit (int): Optional. Bytes each worker may allocate beyond its
+                            start-up size; past it the file gets an error
+                            finding (POSIX only, ignored elsewhere).
+        store (ResultStore): Optional run store. Every result is recorded in
+                             it as it arrives; when the store is resuming, files
+                             it already holds are yielded from it unanalyzed.
+                             Timeouts, crashes and memory failures are not
+                             recorded, so a resumed run tries those files again.
+        page_workers (int): Optional. Processes extracting the page text of
+                            each large PDF (see PdfDocument). Only used when
+                            files are analyzed in this process (max_workers=1
+                            with no timeout or memory limit): pool workers may
+                            not start processes of their own.
+
+    Yields:
+        FileResult: One per input path.
+    """
+    if profile is not None:
+        cache = None
+    workers = max_workers or default_workers()
+    jobs = _lookup(enumerate(file_paths), cache, store, level)
+
+    def _record(index, file_path, findings, signals):
+        if store is not None:
+            store.put(index, file_path, level, findings, signals)
+        return FileResult(index, file_path, findings, signals)
+
+    if workers == 1 and not timeout and not memory_limit:
+        try:
+            for index, file_path, key, cached, stored in jobs:
+                if cancel is not None and cancel.is_set():
+                    return
+                if stored:
+                    yield FileResult(index, file_path, *cached)
+                    continue
+                if cached is None:
+                    findings, signals, failure = _analyze_one(file_path, level, profile, page_workers)
+                    if failure is not None:
+                        yield FileResult(index, file_path, _failure_findings(failure, memory_limit), {})
+                        continue
+                    cached = findings, signals
+                    if key is not None:
+                        cache.put(key, *cached)
+                yield _record(index, file_path, *cached)
+        finally:
+            close_archives()
+        return
+
+    pool = SupervisedPool(workers, timeout, memory_limit)
+    try:
+        ready = deque()
+        limit = workers * _QUEUE_DEPTH
+
+        def _fill():
+            """Queue work up to the in-flight limit. Returns True once the input is exhausted."""
+            for index, file_path, key, cached, stored in jobs:
+                if stored:
+                    ready.append(FileResult(index, file_path, *cached))
+                elif cached is not None:
+                    ready.append(_record(index, file_path, *cached))
+                else:
+                    pool.submit((index, file_path, key), _analyze_one, file_path, level, profile)
+                if pool.pending >= limit or len(ready) >= limit:
+                    return False
+            return True
+
+        exhausted = False
+        while cancel is None or not cancel.is_set():
+            if not exhausted:
+                exhausted = _fill()
+            while ready:
+                yield ready.popleft()
+            if not pool.pending:
+                if exhausted:
+                    break
+                continue
+            done = pool.wait(_CANCEL_POLL if cancel is not None else None)
+            if cancel is not None and cancel.is_set():
+                break
+            for (index, file_path, key), value, failure, detail in done:
+                if failure is None:
+                    findings, signals, failure = value
+                    detail = memory_limit
+                if failure is not None:
+                    yield FileResult(index, file_path, _failure_findings(failure, detail), {})
+                    continue
+                if key is not None:
+                    cache.put(key, findings, signals)
+                yield _record(index, file_path, findings, signals)
+    finally:
+        # Also reached when cancelled or when the consumer stops iterating early:
+        # drop queued work and stop the workers rather than waiting for them.
+        # Cache and store lookups read archive members in this thread
+        pool.shutdown()
+        close_archives()
+
+
+def analyze_batch(file_paths, max_workers=None, on_result=None, cache=None, level=FULL, profile=None,
+                  timeout=None, memory_limit=None, store=None):
+    """
+    Analyzes a list of files in parallel and returns the results in input order.
+
+    Args:
+        file_paths (list): Paths to analyze.
+        max_workers (int): Worker process count. Defaults to one per CPU core.
+        on_result (callable): Optional callback(FileResult), called as each file finishes.
+        cache (ResultCache): Optional result cache (see iter_batch).
+        level (str): Analysis level, FULL or TRIAGE (see analyze_file).
+        profile (str): Optional profiling mode (see iter_batch).
+        timeout (float): Optional per-file time limit in seconds (see iter_batch).
+        memory_limit (int): Optional per-worker memory cap in bytes (see iter_batch).
+        store (ResultStore): Optional run store (see iter_batch).
+
+    Returns:
+        list: One FileResult per input path, in the same order as file_paths.
+    """
+    file_paths = list(file_paths)
+    results = [None] * len(file_paths)
+    for result in iter_batch(file_paths, max_workers, cache, level=level, profile=profile,
+                             timeout=timeout, memory_limit=memory_limit, store=store):
+        results[result.index] = result
+        if on_result is not None:
+            on_result(result)
+    return results
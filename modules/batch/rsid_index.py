@@ -0,0 +1,443 @@
+
+import csv
+from array import array
+from typing import List, NamedTuple
+
+from ..findings import header, info, notice, warning
+
+# numpy is imported inside the methods that use it: this module is loaded by
+# every scan and every worker process, but only batch summaries need numpy.
+
+
+_DOC_BITS = 32
+_DOC_MASK = (1 << _DOC_BITS) - 1
+
+# RSIDs are random 32-bit values, so across thousands of documents a few single
+# RSIDs collide by chance; requiring two shared sessions filters that noise out
+DEFAULT_MIN_SHARED = 2
+
+# An RSID found in more than this share of the batch (and in at least
+# TEMPLATE_MIN_DOCS documents) comes from a file everyone was given, such as a
+# template. It links no one in particular, so it is reported, not clustered on.
+TEMPLATE_SHARE = 0.5
+TEMPLATE_MIN_DOCS = 10
+
+# Document pairs expanded per block of the co-occurrence product (bounds its
+# temporary arrays to a few tens of MB whatever the class size)
+_BLOCK_PAIRS = 1 << 21
+
+# Jaccard overlap at or above which a pair is reported as a warning
+HIGH_OVERLAP = 0.5
+
+
+class RsidCluster(NamedTuple):
+    """Documents connected by shared RSID sessions."""
+    documents: List[str]
+    shared_rsids: List[int]
+
+
+class SimilarPair(NamedTuple):
+    """Two documents and the overlap of their RSID sets."""
+    document_a: str
+    document_b: str
+    shared: int
+    rsids_a: int
+    rsids_b: int
+    jaccard: float
+
+
+class RsidIndex:
+    """
+    Batch-level inverted index from RSID to the documents that contain it.
+
+    Two submissions sharing an RSID value means one was started from (or pasted
+    from) the other's file. Each posting is stored as one 64-bit integer
+    (rsid << 32 | doc_id) in a flat array, so 10k documents with ~100 RSIDs each
+    take 8 MB and are grouped by a single vectorized sort.
+    """
+
+    def __init__(self):
+        self.labels = []
+        self._postings = array('Q')
+
+    def __len__(self):
+        return len(self.labels)
+
+    def add(self, label, rsids):
+        """
+        Add one document. Add documents in input order: reports break ties by it.
+
+        Args:
+            label (str): Name reported for the document (usually its path).
+            rsids (iterable): Integer RSIDs (see rsid_scraper.collect_rsid_set).
+
+        Returns:
+            int: The document id.
+        """
+        doc_id = len(self.labels)
+        self.labels.append(label)
+        self._postings.extend((rsid << _DOC_BITS) | doc_id for rsid in set(rsids))
+        return doc_id
+
+    def _shared_groups(self, max_docs=None, ignore=()):
+        """
+        Sort the postings and find the RSIDs held by two or more documents.
+
+        Returns:
+            tuple: (rsids, starts, sizes, doc_ids, doc_sizes) -- one entry per
+                   kept RSID in the first three arrays; doc_ids covers all
+                   sorted postings, so group g is
+                   doc_ids[starts[g]:starts[g] + sizes[g]]. doc_sizes counts
+                   each document's RSIDs left after max_docs and ignore, the
+                   set sizes the Jaccard scores are taken over.
+        """
+        import numpy as np
+
+        keys = np.sort(np.frombuffer(self._postings, dtype=np.uint64))
+        rsids = keys >> np.uint64(_DOC_BITS)
+        doc_ids = (keys & np.uint64(_DOC_MASK)).astype(np.int64)
+
+        # Group boundaries; RSIDs over max_docs or ignored are dropped altogether
+        starts = np.flatnonzero(np.concatenate(([True], rsids[1:] != rsids[:-1])))
+        sizes = np.diff(np.append(starts, len(keys)))
+        group_rsids = rsids[starts]
+        dropped = np.zeros(len(starts), dtype=bool)
+        if max_docs is not None:
+            dropped |= sizes > max_docs
+        ignore = np.fromiter(ignore, dtype=np.uint64)
+        if len(ignore):
+            dropped |= np.isin(group_rsids, ignore)
+        doc_sizes = np.bincount(doc_ids[~np.repeat(dropped, sizes)], minlength=len(self.labels))
+
+        # Only groups of two or more documents link anyone
+        keep = ~dropped & (sizes > 1)
+        return group_rsids[keep], starts[keep], sizes[keep], doc_ids, doc_sizes
+
+    def template_limit(self):
+        """
+        Default max_docs for clusters() and top_pairs(): the most documents an
+        RSID may appear in before it is treated as a template session.
+        """
+        return max(TEMPLATE_MIN_DOCS, int(len(self.labels) * TEMPLATE_SHARE))
+
+    def template_rsids(self, max_docs=None):
+        """
+        RSIDs found in more than `max_docs` documents (default: template_limit()).
+
+        Returns:
+            list: (rsid, document count) tuples, most widespread first.
+        """
+        if not self._postings:
+            return []
+        import numpy as np
+
+        limit = self.template_limit() if max_docs is None else max_docs
+        rsids = np.sort(np.frombuffer(self._postings, dtype=np.uint64)) >> np.uint64(_DOC_BITS)
+        values, counts = np.unique(rsids, return_counts=True)
+        wide = counts > limit
+        return sorted(zip(values[wide].tolist(), counts[wide].tolist()), key=lambda item: (-item[1], item[0]))
+
+    def shared(self, max_docs=None, ignore=()):
+        """
+        Yield (rsid, doc_ids) for every RSID found in two or more documents.
+
+        Args:
+            max_docs (int): Skip RSIDs found in more documents than this, e.g. the
+                            sessions of a template every student was given.
+            ignore (iterable): Integer RSIDs to skip outright.
+        """
+        if not self._postings:
+            return
+        rsids, starts, sizes, doc_ids, _ = self._shared_groups(max_docs, ignore)
+        for rsid, start, size in zip(rsids.tolist(), starts.tolist(), sizes.tolist()):
+            yield rsid, doc_ids[start:start + size].tolist()
+
+    def _cooccurrence(self, max_docs=None, ignore=()):
+        """
+        Sparse product of the document x RSID incidence matrix with itself.
+
+        Only the nonzero entries are ever formed: each document's kept
+        postings are joined with the other holders of the same RSID, a block
+        of documents at a time (at most _BLOCK_PAIRS joined postings per
+        block), and counted with np.unique. Memory follows the pairs that
+        actually share an RSID, never n_docs x n_rsids or the full
+        expansion of a large group.
+
+        Args:
+            max_docs (int), ignore (iterable): See shared().
+
+        Returns:
+            tuple: (doc_sizes, blocks) -- doc_sizes from _shared_groups, and an
+                   iterator of (first, second, shared) int64 arrays per block,
+                   first < second, each pair once.
+        """
+        import numpy as np
+
+        n_docs = len(self.labels)
+        if not self._postings:
+            return np.zeros(n_docs, dtype=np.int64), iter(())
+        _, starts, sizes, doc_ids, doc_sizes = self._shared_groups(max_docs, ignore)
+
+        # Kept postings by RSID group (column-major): group g holds
+        # members[bounds[g]:bounds[g] + sizes[g]], sorted by document
+        bounds = np.cumsum(sizes) - sizes
+        members = doc_ids[np.repeat(starts - bounds, sizes) + np.arange(int(sizes.sum()))]
+        groups = np.repeat(np.arange(len(sizes)), sizes)
+
+        # The same postings by document (row-major), with the join cost of each document
+        order = np.argsort(members, kind="stable")
+        rows, cols = members[order], groups[order]
+        row_starts = np.searchsorted(rows, np.arange(n_docs + 1))
+        cost = np.cumsum(np.append(0, sizes[cols]))[row_starts]
+
+        def blocks():
+            first = 0
+            while first < n_docs:
+                last = int(np.searchsorted(cost, cost[first] + _BLOCK_PAIRS, side="right")) - 1
+                last = min(max(last, first + 1), n_docs)
+                block_rows = rows[row_starts[first]:row_starts[last]]
+                block_cols = cols[row_starts[first]:row_starts[last]]
+                first = last
+                if not len(block_rows):
+                    continue
+                # Join every posting with the later holders of its RSID
+                lengths = sizes[block_cols]
+                offsets = np.repeat(bounds[block_cols] - (np.cumsum(lengths) - lengths), lengths)
+                partners = members[offsets + np.arange(int(lengths.sum()))]
+                owners = np.repeat(block_rows, lengths)
+                later = partners > owners
+                pairs, shared = np.unique(owners[later] * n_docs + partners[later], return_counts=True)
+                yield pairs // n_docs, pairs % n_docs, shared
+
+        return doc_sizes, blocks()
+
+    def clusters(self, min_shared=DEFAULT_MIN_SHARED, max_docs=None, ignore=()):
+        """
+        Group documents that share RSID sessions (transitively).
+
+        Linked pairs come from the sparse co-occurrence product (see
+        _cooccurrence) a block at a time and are merged into components as
+        they arrive, so neither the pairs of a large group nor all linked
+        pairs are ever held at once. RSIDs in more than `max_docs` documents
+        are left out.
+
+        Args:
+            min_shared (int): Minimum number of RSIDs two documents must share
+                              to be linked directly.
+            max_docs (int): Skip RSIDs found in more documents than this
+                            (default: template_limit(); see template_rsids()).
+            ignore (iterable): Integer RSIDs to skip outright.
+
+        Returns:
+            list: RsidCluster objects, largest first.
+        """
+        import numpy as np
+
+        if max_docs is None:
+            max_docs = self.template_limit()
+        shared = list(self.shared(max_docs, ignore))
+        parent = np.arange(len(self.labels))
+
+        if min_shared <= 1:
+            # One shared RSID is enough: link every holder to the first
+            firsts = [docs[0] for _, docs in shared for _ in docs[1:]]
+            others = [doc for _, docs in shared for doc in docs[1:]]
+            _merge(parent, np.array(firsts, dtype=np.int64), np.array(others, dtype=np.int64))
+        else:
+            _, blocks = self._cooccurrence(max_docs, ignore)
+            for first, second, counts in blocks:
+                linked = counts >= min_shared
+                _merge(parent, first[linked], second[linked])
+
+        roots = parent.tolist()
+        members = {}
+        for doc, root in enumerate(roots):
+            members.setdefault(root, []).append(doc)
+
+        cluster_rsids = {}
+        for rsid, docs in shared:
+            root = roots[docs[0]]
+            if all(roots[doc] == root for doc in docs):
+                cluster_rsids.setdefault(root, []).append(rsid)
+
+        clusters = [
+            RsidCluster([self.labels[d] for d in docs], cluster_rsids.get(root, []))
+            for root, docs in members.items() if len(docs) > 1
+        ]
+        clusters.sort(key=lambda c: (-len(c.documents), -len(c.shared_rsids)))
+        return clusters
+
+    def jaccard_matrix(self, max_docs=None, ignore=()):
+        """
+        Jaccard overlap of the RSID sets of every pair of documents.
+
+        Args:
+            max_docs (int), ignore (iterable): See shared(). Dropped RSIDs are
+                            left out of both the intersections and the set
+                            sizes.
+
+        Returns:
+            numpy.ndarray: n x n float32 matrix; the diagonal is 1 for documents
+                           with any RSIDs left.
+        """
+        import numpy as np
+
+        n_docs = len(self.labels)
+        result = np.zeros((n_docs, n_docs), dtype=np.float32)
+        doc_sizes, blocks = self._cooccurrence(max_docs, ignore)
+        result[np.diag_indices(n_docs)] = doc_sizes > 0
+        for first, second, shared in blocks:
+            jaccard = shared / (doc_sizes[first] + doc_sizes[second] - shared)
+            result[first, second] = jaccard
+            result[second, first] = jaccard
+        return result
+
+    def top_pairs(self, k=20, min_shared=DEFAULT_MIN_SHARED, max_docs=None, ignore=()):
+        """
+        The k document pairs with the highest RSID Jaccard overlap.
+
+        Pairs are scored a block at a time from the sparse co-occurrence
+        product (see _cooccurrence), keeping only the best k candidates
+        between blocks, so memory never grows with n^2.
+
+        Jaccard scores and the reported set sizes are taken over the RSIDs
+        left after `max_docs` and `ignore`, the same ones `shared` counts, so
+        template sessions neither raise nor dilute a score.
+
+        Args:
+            k (int): Number of pairs to return.
+            min_shared (int): Ignore pairs sharing fewer RSIDs than this.
+            max_docs (int): Skip RSIDs found in more documents than this
+                            (default: template_limit(); see template_rsids()).
+            ignore (iterable): Integer RSIDs to skip outright.
+
+        Returns:
+            list: SimilarPair objects, most similar first.
+        """
+        import numpy as np
+
+        if max_docs is None:
+            max_docs = self.template_limit()
+        if k < 1 or len(self.labels) < 2:
+            return []
+
+        best = np.empty((0, 4), dtype=np.float64)  # row, column, shared, jaccard
+        doc_sizes, blocks = self._cooccurrence(max_docs, ignore)
+        for first, second, shared in blocks:
+            linked = shared >= max(min_shared, 1)
+            first, second, shared = first[linked], second[linked], shared[linked]
+            jaccard = shared / (doc_sizes[first] + doc_sizes[second] - shared)
+            best = np.concatenate((best, np.column_stack((first, second, shared, jaccard))))
+            if len(best) > k:
+                best = best[np.argpartition(-best[:, 3], k - 1)[:k]]
+
+        # Ties are broken by input order so reports are stable between runs
+        best = best[np.lexsort((best[:, 1], best[:, 0], -best[:, 2], -best[:, 3]))]
+        return [
+            SimilarPair(self.labels[a], self.labels[b], int(shared),
+                        int(doc_sizes[a]), int(doc_sizes[b]), round(float(score), 4))
+            for a, b, shared, score in ((int(r[0]), int(r[1]), r[2], r[3]) for r in best)
+        ]
+
+
+def _merge(parent, first, second):
+    """
+    Union-find over numpy arrays: join the components of each (first, second) pair.
+
+    `parent` maps every document to the lowest document of its component and
+    is kept fully compressed, so it doubles as the component label. Each
+    round hooks the higher root of every unjoined pair onto the lower one;
+    rounds repeat until all pairs are joined, a few at most in practice.
+    """
+    import numpy as np
+
+    while len(first):
+        a, b = parent[first], parent[second]
+        apart = a != b
+        first, second, a, b = first[apart], second[apart], a[apart], b[apart]
+        if not len(first):
+            return
+        np.minimum.at(parent, np.maximum(a, b), np.minimum(a, b))
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent[:] = grand
+
+
+def cluster_findings(clusters, templates=()):
+    """
+    Render RSID clusters as report findings.
+
+    Args:
+        clusters (list): RsidCluster objects from RsidIndex.clusters().
+        templates (list): (rsid, document count) tuples from
+                          RsidIndex.template_rsids(), left out of the clusters.
+
+    Returns:
+        list: SHARED findings.
+    """
+    findings = [header("Shared RSID Sessions Across Submissions")]
+    if templates:
+        listed = ", ".join(f"{rsid:08X} ({count})" for rsid, count in templates[:5])
+        findings.append(notice(
+            "SHARED", "template_rsids", [{"rsid": f"{rsid:08X}", "documents": count} for rsid, count in templates],
+            f"{len(templates)} RSID session(s) appear in most submissions and were treated as a shared "
+            f"template, not as links between them: {listed}{', ...' if len(templates) > 5 else ''}"
+        ))
+    if not clusters:
+        findings.append(info("SHARED", "clusters", None, "No RSID sessions are shared between submissions."))
+        return findings
+
+    for number, cluster in enumerate(clusters, 1):
+        rsids = [f"{rsid:08X}" for rsid in cluster.shared_rsids]
+        findings.append(warning(
+            "SHARED", "cluster", {"documents": cluster.documents, "shared_rsids": rsids},
+            f"Cluster {number}: {len(cluster.documents)} documents share "
+            f"{len(rsids)} RSID session(s) ({', '.join(rsids[:5])}{', ...' if len(rsids) > 5 else ''})"
+        ))
+        for document in cluster.documents:
+            findings.append(info("SHARED", "member", document, f"  {document}"))
+    return findings
+
+
+def similarity_findings(pairs):
+    """
+    Render the most similar document pairs as report findings.
+
+    Args:
+        pairs (list): SimilarPair objects from RsidIndex.top_pairs().
+
+    Returns:
+        list: SHARED findings.
+    """
+    findings = [header("Most Similar Submissions by RSID Overlap")]
+    if not pairs:
+        findings.append(info("SHARED", "pairs", None, "No submissions have overlapping RSID sets."))
+        return findings
+
+    for rank, pair in enumerate(pairs, 1):
+        make = warning if pair.jaccard >= HIGH_OVERLAP else notice
+        findings.append(make(
+            "SHARED", "pair", pair._asdict(),
+            f"#{rank}: {pair.jaccard:.0%} overlap ({pair.shared} shared RSIDs of "
+            f"{pair.rsids_a} / {pair.rsids_b}): {pair.document_a} <-> {pair.document_b}"
+        ))
+    return findings
+
+
+_CSV_FIELDS = ("rank",) + SimilarPair._fields
+
+
+def write_pairs_csv(pairs, out):
+    """
+    Write similar pairs as CSV, one row per pair with a header row.
+
+    Args:
+        pairs (list): SimilarPair objects from RsidIndex.top_pairs().
+        out: Text stream opened with newline="".
+    """
+    writer = csv.writer(out)
+    writer.writerow(_CSV_FIELDS)
+    for rank, pair in enumerate(pairs, 1):
+        writer.writerow((rank,) + tuple(pair))
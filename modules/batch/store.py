@@ -0,0 +1,356 @@
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from ..archive import split_member, member_digest
+from ..findings import Finding
+from ..keywords import fingerprint as keyword_fingerprint
+from .cache import analyzer_version, default_cache_dir, file_digest
+from .engine import FileResult
+
+
+# How a resumed run recognizes a file it has already analyzed
+STAT = "stat"    # same path, size and modification time
+HASH = "hash"    # same path and SHA-256 of the contents
+RESUME_MODES = (STAT, HASH)
+
+# Writes are committed in groups, so a crash loses at most the last group,
+# whose files are simply analyzed again on resume
+_COMMIT_EVERY = 200
+_COMMIT_INTERVAL = 1.0
+
+# Bumped whenever the table layout changes; older store files are emptied on open
+_FORMAT_VERSION = 2
+
+# Per-folder stores kept in the cache folder (see prune_run_stores); past
+# either limit the least recently used are deleted
+MAX_RUN_STORES = 20
+MAX_RUN_STORE_BYTES = 256 * 1024 * 1024
+
+# SQLite keeps a store's WAL and shared-memory index next to it
+_STORE_SUFFIXES = ("", "-wal", "-shm")
+
+
+def _runs_dir():
+    return os.path.join(default_cache_dir(), "runs")
+
+
+def default_store_path(source):
+    """
+    Store file for batch runs over `source` (a folder or archive) in the user
+    cache folder, so the window can resume an interrupted run of the same folder.
+    """
+    name = hashlib.sha256(os.path.abspath(source).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(_runs_dir(), f"{name}.sqlite3")
+
+
+def prune_run_stores(keep=None, max_stores=MAX_RUN_STORES, max_bytes=MAX_RUN_STORE_BYTES):
+    """
+    Delete the least recently used stores made by default_store_path, beyond
+    `max_stores` files or `max_bytes` in total, as ResultCache evicts old
+    results. `keep` (a store path) is never deleted. Files another process
+    still has open are skipped.
+
+    Returns:
+        int: Stores deleted.
+    """
+    folder = _runs_dir()
+    try:
+        names = [name for name in os.listdir(folder) if name.endswith(".sqlite3")]
+    except OSError:
+        return 0
+    stores = []
+    for name in names:
+        path = os.path.join(folder, name)
+        sizes, used = 0, 0.0
+        for suffix in _STORE_SUFFIXES:
+            try:
+                st = os.stat(path + suffix)
+            except OSError:
+                continue
+            sizes += st.st_size
+            used = max(used, st.st_mtime)
+        stores.append((used, sizes, path))
+    stores.sort(reverse=True)
+
+    keep = os.path.abspath(keep) if keep else None
+    deleted = 0
+    total = 0
+    for count, (_, size, path) in enumerate(stores, 1):
+        total += size
+        if os.path.abspath(path) == keep or (count <= max_stores and total <= max_bytes):
+            continue
+        try:
+            for suffix in _STORE_SUFFIXES:
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+        except OSError:
+            continue
+        total -= size
+        deleted += 1
+    return deleted
+
+
+def last_run_unfinished(path):
+    """
+    Whether the store at `path` holds a run that never called finish(), e.g.
+    one interrupted by a crash or cancelled. False if there is no such store.
+    """
+    if not os.path.exists(path):
+        return False
+    try:
+        db = sqlite3.connect(path, timeout=30)
+        try:
+            if db.execute("PRAGMA user_version").fetchone()[0] != _FORMAT_VERSION:
+                return False
+            row = db.execute("SELECT finished_at FROM runs ORDER BY run DESC LIMIT 1").fetchone()
+        finally:
+            db.close()
+    except sqlite3.Error:
+        return False
+    return row is not None and row[0] is None
+
+
+class ResultStore:
+    """
+    SQLite file holding the results of a batch run, one row per file plus
+    one row per finding, written as each file finishes.
+
+    Unlike the ResultCache (keyed by content, shared by every run, evicted
+    when full), a store belongs to one run: it records which file at which
+    path produced which findings, so an interrupted run can pick up where it
+    stopped, and the report can be rebuilt from it at any time without
+    holding every result in memory. The findings table can also be queried
+    directly, e.g. SELECT path, message FROM findings JOIN files ON
+    files.id = file_id WHERE severity = 'warning'.
+
+    Each run gets a number; rows are stamped with the run that produced or
+    last reused them, and reports read only the current run. A run that
+    completes is marked with finish(), so an interrupted one can be told
+    apart (see last_run_unfinished).
+    """
+
+    def __init__(self, path, resume=None, version=None):
+        """
+        Args:
+            path (str): The store file; created if missing.
+            resume (str): None starts a new run. STAT or HASH continues the
+                          latest run, reusing the stored result of every file
+                          whose identity still matches.
+            version (str): Analyzer version; results from other versions are
+                           never reused. Defaults to analyzer_version() plus
+                           the keyword settings (keywords.fingerprint), which
+                           also change the findings.
+        """
+        self.path = path
+        self.resume = resume
+        self.version = version or f"{analyzer_version()}:{keyword_fingerprint()}"
+
+        self._db = sqlite3.connect(path, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("PRAGMA foreign_keys=ON")
+        if self._db.execute("PRAGMA user_version").fetchone()[0] != _FORMAT_VERSION:
+            self._db.execute("DROP TABLE IF EXISTS findings")
+            self._db.execute("DROP TABLE IF EXISTS files")
+            self._db.execute("DROP TABLE IF EXISTS runs")
+            self._db.execute(f"PRAGMA user_version = {_FORMAT_VERSION}")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " id INTEGER PRIMARY KEY,"
+            " path TEXT NOT NULL UNIQUE,"
+            " run INTEGER NOT NULL,"
+            " position INTEGER NOT NULL,"
+            " level TEXT NOT NULL,"
+            " version TEXT NOT NULL,"
+            " size INTEGER,"
+            " mtime_ns INTEGER,"
+            " digest TEXT,"
+            " signals TEXT NOT NULL DEFAULT '{}',"
+            " analyzed_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS findings ("
+            " file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,"
+            " seq INTEGER NOT NULL,"
+            " category TEXT NOT NULL,"
+            " severity TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " value TEXT,"
+            " message TEXT NOT NULL,"
+            " PRIMARY KEY (file_id, seq)) WITHOUT ROWID"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            " run INTEGER PRIMARY KEY,"
+            " started_at REAL NOT NULL,"
+            " finished_at REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS files_run ON files(run, position)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS findings_severity ON findings(severity, category)")
+
+        latest = self._db.execute(
+            "SELECT MAX(COALESCE((SELECT MAX(run) FROM files), 0), COALESCE((SELECT MAX(run) FROM runs), 0))"
+        ).fetchone()[0]
+        self.run = latest if resume and latest else latest + 1
+        self._started = False
+        self._identities = {}
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+
+    # --- Identity ---
+
+    def _identity(self, file_path):
+        """(size, mtime_ns, digest) of a file; the digest is only computed when resuming by hash."""
+        if split_member(file_path):
+            # An archive member is identified by its central-directory entry
+            return None, None, member_digest(file_path)
+        st = os.stat(file_path)
+        digest = file_digest(file_path) if self.resume == HASH else None
+        return st.st_size, st.st_mtime_ns, digest
+
+    def _unchanged(self, stored, identity):
+        """Whether a stored (size, mtime_ns, digest) matches a file's current identity."""
+        if identity[2] is not None:
+            return stored[2] == identity[2]
+        return stored[0] is not None and stored[:2] == identity[:2]
+
+    # --- Writing ---
+
+    def _start(self):
+        """Record the current run as started (and not finished) on its first write."""
+        if not self._started:
+            self._started = True
+            self._db.execute(
+                "INSERT INTO runs (run, started_at) VALUES (?, ?)"
+                " ON CONFLICT (run) DO UPDATE SET finished_at = NULL", (self.run, time.time())
+            )
+            self._db.commit()
+
+    def lookup(self, index, file_path, level):
+        """
+        Return the stored (findings, signals) for a file a resumed run can skip, or None.
+
+        A hit is moved into the current run at `index`. On a miss the file's
+        identity is remembered for put().
+        """
+        self._start()
+        try:
+            identity = self._identity(file_path)
+        except Exception:
+            identity = None
+        self._identities[file_path] = identity
+        if not self.resume or identity is None:
+            return None
+
+        row = self._db.execute(
+            "SELECT id, size, mtime_ns, digest, signals FROM files WHERE path = ? AND level = ? AND version = ?",
+            (file_path, level, self.version),
+        ).fetchone()
+        if row is None or not self._unchanged(tuple(row[1:4]), identity):
+            return None
+
+        del self._identities[file_path]
+        self._db.execute("UPDATE files SET run = ?, position = ? WHERE id = ?", (self.run, index, row[0]))
+        self._maybe_commit()
+        return self._findings(row[0]), json.loads(row[4])
+
+    def put(self, index, file_path, level, findings, signals=None):
+        """Record a file's result in the current run, replacing any earlier result for its path."""
+        self._start()
+        identity = self._identities.pop(file_path, None)
+        if identity is None:
+            try:
+                identity = self._identity(file_path)
+            except Exception:
+                identity = (None, None, None)
+        self._db.execute("DELETE FROM files WHERE path = ?", (file_path,))
+        file_id = self._db.execute(
+            "INSERT INTO files (path, run, position, level, version, size, mtime_ns, digest, signals, analyzed_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (file_path, self.run, index, level, self.version, *identity,
+             json.dumps(signals or {}), time.time()),
+        ).lastrowid
+        self._db.executemany(
+            "INSERT INTO findings (file_id, seq, category, severity, key, value, message) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(file_id, seq, f.category, f.severity, f.key,
+              json.dumps(f.value, ensure_ascii=False, default=str), f.message)
+             for seq, f in enumerate(findings)],
+        )
+        self._maybe_commit()
+
+    # --- Reading ---
+
+    def _findings(self, file_id):
+        rows = self._db.execute(
+            "SELECT category, severity, key, value, message FROM findings WHERE file_id = ? ORDER BY seq",
+            (file_id,),
+        )
+        return [Finding(category, severity, key, json.loads(value), message)
+                for category, severity, key, value, message in rows]
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM files WHERE run = ?", (self.run,)).fetchone()[0]
+
+    def iter_results(self, start=0, stop=None):
+        """
+        Yield a FileResult for every file of the current run, in input order.
+        Rows are read as they are yielded.
+
+        Args:
+            start, stop (int): Only files whose input position is in
+                               [start, stop); stop None means no upper bound.
+        """
+        rows = self._db.execute(
+            "SELECT id, position, path, signals FROM files WHERE run = ? AND position >= ? AND position < ?"
+            " ORDER BY position", (self.run, start, stop if stop is not None else 2 ** 62)
+        )
+        for file_id, position, path, signals in rows:
+            yield FileResult(position, path, self._findings(file_id), json.loads(signals))
+
+    def iter_signals(self):
+        """Yield (path, signals) for every file of the current run, in input order, without findings."""
+        rows = self._db.execute(
+            "SELECT path, signals FROM files WHERE run = ? ORDER BY position", (self.run,)
+        )
+        for path, signals in rows:
+            yield path, json.loads(signals)
+
+    def rsid_sets(self):
+        """Yield (path, rsids) for every .docx of the current run with RSID signals."""
+        for path, signals in self.iter_signals():
+            rsids = signals.get("rsids")
+            if rsids is not None:
+                yield path, rsids
+
+    # --- Lifecycle ---
+
+    def _maybe_commit(self):
+        self._uncommitted += 1
+        if (self._uncommitted >= _COMMIT_EVERY
+                or time.monotonic() - self._last_commit >= _COMMIT_INTERVAL):
+            self.flush()
+
+    def finish(self):
+        """Mark the current run as complete and commit."""
+        self._start()
+        self._db.execute("UPDATE runs SET finished_at = ? WHERE run = ?", (time.time(), self.run))
+        self.flush()
+
+    def flush(self):
+        self._db.commit()
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+
+    def close(self):
+        self.flush()
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
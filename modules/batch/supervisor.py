@@ -0,0 +1,228 @@
+
+import multiprocessing
+import os
+import signal
+import time
+from collections import deque
+from multiprocessing.connection import wait as wait_connections
+from typing import Any, NamedTuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Outcomes of a task that did not return
+TIMEOUT = "timeout"
+CRASH = "crash"
+
+# Outcome of a task that ran out of memory under the worker's cap. The task
+# reports it itself (see engine._analyze_one); the worker survives.
+MEMORY = "memory"
+
+
+class Outcome(NamedTuple):
+    """
+    How one submitted task ended.
+
+    Attributes:
+        tag:            The tag given to submit().
+        value:          The task's return value, or None if it failed.
+        failure (str):  None on success, TIMEOUT or CRASH otherwise.
+        detail:         Seconds allowed (TIMEOUT) or the worker's exit code (CRASH).
+    """
+    tag: Any
+    value: Any
+    failure: str
+    detail: Any
+
+
+def _limit_memory(memory_limit):
+    """
+    Cap this process's address space at its current size plus `memory_limit` bytes.
+
+    Allocations past the cap fail with MemoryError instead of exhausting the
+    machine. Needs the POSIX resource module; elsewhere this does nothing.
+    """
+    if resource is None or not memory_limit:
+        return
+    base = 0
+    try:
+        with open("/proc/self/statm") as f:
+            base = int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        pass
+    limit = base + memory_limit
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ValueError, OSError):
+        pass
+
+
+def _serve(conn, memory_limit):
+    """Worker process: run (fn, args) tasks from `conn` until it closes, sending back each result."""
+    # Ctrl-C is handled by the supervisor, which stops the workers itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _limit_memory(memory_limit)
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        fn, args = task
+        conn.send(fn(*args))
+
+
+class _Worker:
+    """One worker process and the task it is running, if any."""
+
+    def __init__(self, context, memory_limit):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child_conn, memory_limit), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.tag = None
+        self.deadline = None
+
+    @property
+    def busy(self):
+        return self.deadline is not None
+
+    def run(self, tag, fn, args, timeout):
+        self.conn.send((fn, args))
+        self.tag = tag
+        self.deadline = time.monotonic() + timeout if timeout else float("inf")
+
+    def finish(self):
+        tag, self.tag, self.deadline = self.tag, None, None
+        return tag
+
+    def stop(self, kill=False):
+        """End the process: an idle worker exits once its pipe closes, a busy one is killed."""
+        self.conn.close()
+        if not (kill or self.busy):
+            self.process.join(1)
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+
+
+class SupervisedPool:
+    """
+    Worker processes that each run one task at a time under a wall-clock
+    timeout and an optional memory cap.
+
+    A task that runs past its timeout has its worker killed; a worker that
+    dies mid-task (segfault, killed by the OS) is noticed through its process
+    sentinel. Either way the task is reported as failed and a fresh worker
+    takes the dead one's place, so the remaining tasks carry on. A worker
+    that died while idle is found when a task is sent to it, and replaced
+    before the task runs.
+
+    Tasks are functions at module level (they are pickled by name), called as
+    fn(*args); they should catch their own exceptions.
+    """
+
+    def __init__(self, max_workers, timeout=None, memory_limit=None):
+        """
+        Args:
+            max_workers (int): Worker process count.
+            timeout (float): Seconds a task may run before its worker is killed.
+                             None or 0 means no limit.
+            memory_limit (int): Bytes each worker may allocate beyond its size at
+                                start-up (POSIX only). None means no limit.
+        """
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self._context = multiprocessing.get_context()
+        self._workers = [_Worker(self._context, memory_limit) for _ in range(max_workers)]
+        self._queue = deque()
+        self._ended = []  # Outcomes of tasks that failed before reaching a worker
+
+    @property
+    def pending(self):
+        """Tasks submitted but not yet returned by wait() (queued, running or ended)."""
+        return len(self._queue) + len(self._ended) + sum(worker.busy for worker in self._workers)
+
+    def submit(self, tag, fn, *args):
+        """Queue fn(*args). `tag` identifies the task in the Outcome."""
+        self._queue.append((tag, fn, args))
+        self._dispatch()
+
+    def _dispatch(self):
+        for index in range(len(self._workers)):
+            if not self._queue:
+                return
+            if self._workers[index].busy:
+                continue
+            tag, fn, args = self._queue.popleft()
+            for _ in range(2):
+                worker = self._workers[index]
+                try:
+                    worker.run(tag, fn, args, self.timeout)
+                    break
+                except OSError:
+                    # Died while idle (e.g. the OOM killer): the task never
+                    # reached it, so it goes to a fresh worker instead
+                    self._replace(worker)
+            else:
+                # The fresh worker was dead on arrival too
+                self._ended.append(Outcome(tag, None, CRASH, worker.process.exitcode))
+
+    def _replace(self, worker):
+        worker.stop(kill=True)
+        index = self._workers.index(worker)
+        self._workers[index] = _Worker(self._context, self.memory_limit)
+
+    def wait(self, timeout=None):
+        """
+        Wait until at least one task ends, or `timeout` seconds pass.
+
+        Returns:
+            list: Outcome for each task that ended (empty on timeout).
+        """
+        outcomes, self._ended = self._ended, []
+        give_up = time.monotonic() + timeout if timeout is not None else float("inf")
+        while not outcomes:
+            busy = [worker for worker in self._workers if worker.busy]
+            if not busy:
+                break
+            now = time.monotonic()
+            until = min(give_up, min(worker.deadline for worker in busy))
+            waitables = [worker.conn for worker in busy] + [worker.process.sentinel for worker in busy]
+            ready = set(wait_connections(waitables, None if until == float("inf") else max(until - now, 0)))
+
+            for worker in busy:
+                if worker.conn in ready:
+                    try:
+                        value = worker.conn.recv()
+                    except (EOFError, OSError):
+                        # Died while sending its result
+                        worker.process.join()
+                        outcomes.append(Outcome(worker.finish(), None, CRASH, worker.process.exitcode))
+                        self._replace(worker)
+                        continue
+                    outcomes.append(Outcome(worker.finish(), value, None, None))
+                elif worker.process.sentinel in ready:
+                    worker.process.join()
+                    outcomes.append(Outcome(worker.finish(), None, CRASH, worker.process.exitcode))
+                    self._replace(worker)
+                elif time.monotonic() >= worker.deadline:
+                    outcomes.append(Outcome(worker.finish(), None, TIMEOUT, self.timeout))
+                    self._replace(worker)
+
+            self._dispatch()
+            if time.monotonic() >= give_up:
+                break
+        return outcomes
+
+    def shutdown(self):
+        """Stop every worker at once. Queued and running tasks are dropped."""
+        self._queue.clear()
+        for worker in self._workers:
+            worker.stop()
+        self._workers = []
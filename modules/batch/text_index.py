@@ -0,0 +1,197 @@
+
+import csv
+from array import array
+from typing import NamedTuple
+
+from ..findings import header, info, notice, warning
+from ..minhash import NUM_PERM
+
+# numpy is imported inside the methods that use it, as in rsid_index
+
+
+# LSH banding of the signature: documents whose signatures agree on all rows
+# of any band become a candidate pair. 32 bands of 4 rows catch about 87% of
+# pairs at 50% overlap and over 99% at 65%, while pairs below 20% almost never
+# become candidates.
+_BANDS = 32
+
+# Estimated Jaccard overlap below which candidate pairs are dropped
+DEFAULT_MIN_SIMILARITY = 0.5
+
+# Documents with fewer shingles than this are left out: a title page or an
+# empty template matches every other one
+DEFAULT_MIN_SHINGLES = 20
+
+# Share of the shorter document's text at or above which a pair is a warning
+HIGH_CONTAINMENT = 0.8
+
+# Candidate pairs compared per vectorized step
+_COMPARE_BLOCK = 65536
+
+
+class TextPair(NamedTuple):
+    """Two documents and the estimated overlap of their text."""
+    document_a: str
+    document_b: str
+    shingles_a: int
+    shingles_b: int
+    similarity: float     # estimated Jaccard overlap of the shingle sets
+    containment: float    # estimated share of the shorter document found in the other
+
+
+class TextIndex:
+    """
+    Batch-level near-duplicate text detection with MinHash and locality-sensitive hashing.
+
+    Each document is added as its MinHash signature (minhash.text_signature,
+    computed by the worker that analyzed it), stored in one flat uint32 array.
+    Candidate pairs come from hashing bands of every signature and grouping
+    equal band hashes with a vectorized sort, so only documents that collide
+    in some band are ever compared: the work grows with the number of
+    documents plus the number of similar pairs, not with every pair.
+    """
+
+    def __init__(self, min_shingles=DEFAULT_MIN_SHINGLES):
+        self.min_shingles = min_shingles
+        self.labels = []
+        self._shingles = array('I')
+        self._signatures = array('I')
+
+    def __len__(self):
+        return len(self.labels)
+
+    def add(self, label, minhash):
+        """
+        Add one document. Add documents in input order: reports break ties by it.
+
+        Args:
+            label (str): Name reported for the document (usually its path).
+            minhash (dict): The "minhash" signal from analyze_file, or None.
+
+        Returns:
+            bool: False if the document has too little text to compare.
+        """
+        if not minhash or minhash["shingles"] < self.min_shingles or len(minhash["signature"]) != NUM_PERM:
+            return False
+        self.labels.append(label)
+        self._shingles.append(minhash["shingles"])
+        self._signatures.extend(minhash["signature"])
+        return True
+
+    def _matrix(self):
+        import numpy as np
+
+        return np.frombuffer(self._signatures, dtype=np.uint32).reshape(len(self.labels), NUM_PERM)
+
+    def candidate_pairs(self, bands=_BANDS):
+        """
+        Document pairs that agree on every row of at least one band.
+
+        Returns:
+            tuple: (first, second) int64 arrays with first < second, each pair once.
+        """
+        import numpy as np
+
+        n_docs = len(self.labels)
+        if n_docs < 2:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        matrix = self._matrix().astype(np.uint64)
+        rows = NUM_PERM // bands
+        found = []
+        for band in range(bands):
+            keys = np.zeros(n_docs, dtype=np.uint64)
+            for column in range(band * rows, (band + 1) * rows):
+                keys = keys * np.uint64(0x100000001B3) ^ matrix[:, column]
+
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            starts = np.flatnonzero(np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1])))
+            sizes = np.diff(np.append(starts, n_docs))
+            for start, size in zip(starts[sizes > 1], sizes[sizes > 1]):
+                members = np.sort(order[start:start + size])
+                first, second = np.triu_indices(size, 1)
+                found.append(members[first] * n_docs + members[second])
+
+        if not found:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        pairs = np.unique(np.concatenate(found))
+        return pairs // n_docs, pairs % n_docs
+
+    def top_pairs(self, k=20, min_similarity=DEFAULT_MIN_SIMILARITY):
+        """
+        The k most similar document pairs, by estimated Jaccard overlap of their text.
+
+        Args:
+            k (int): Maximum number of pairs returned.
+            min_similarity (float): Pairs estimated below this overlap are dropped.
+
+        Returns:
+            list: TextPair objects, most similar first.
+        """
+        import numpy as np
+
+        first, second = self.candidate_pairs()
+        if k < 1 or not len(first):
+            return []
+
+        matrix = self._matrix()
+        similarity = np.empty(len(first), dtype=np.float64)
+        for start in range(0, len(first), _COMPARE_BLOCK):
+            stop = start + _COMPARE_BLOCK
+            similarity[start:stop] = (matrix[first[start:stop]] == matrix[second[start:stop]]).mean(axis=1)
+
+        keep = similarity >= min_similarity
+        first, second, similarity = first[keep], second[keep], similarity[keep]
+        # Ties are broken by input order so reports are stable between runs
+        best = np.lexsort((second, first, -similarity))[:k]
+
+        shingles = np.frombuffer(self._shingles, dtype=np.uint32)
+        pairs = []
+        for i in best:
+            a, b, jaccard = int(first[i]), int(second[i]), float(similarity[i])
+            size_a, size_b = int(shingles[a]), int(shingles[b])
+            # |A & B| = J * (|A| + |B|) / (1 + J), as a share of the smaller set
+            containment = min(1.0, jaccard * (size_a + size_b) / (1 + jaccard) / min(size_a, size_b))
+            pairs.append(TextPair(self.labels[a], self.labels[b], size_a, size_b,
+                                  round(jaccard, 4), round(containment, 4)))
+        return pairs
+
+
+def text_similarity_findings(pairs):
+    """
+    Render near-duplicate text pairs as report findings.
+
+    Args:
+        pairs (list): TextPair objects from TextIndex.top_pairs().
+
+    Returns:
+        list: SHARED findings.
+    """
+    findings = [header("Most Similar Submissions by Text")]
+    if not pairs:
+        findings.append(info("SHARED", "text_pairs", None, "No submissions have substantially overlapping text."))
+        return findings
+
+    for rank, pair in enumerate(pairs, 1):
+        make = warning if pair.containment >= HIGH_CONTAINMENT else notice
+        findings.append(make(
+            "SHARED", "text_pair", pair._asdict(),
+            f"#{rank}: ~{pair.similarity:.0%} of their text in common (~{pair.containment:.0%} of the "
+            f"shorter one): {pair.document_a} <-> {pair.document_b}"
+        ))
+    return findings
+
+
+def write_text_pairs_csv(pairs, out):
+    """
+    Write near-duplicate text pairs as CSV, one row per pair with a header row.
+
+    Args:
+        pairs (list): TextPair objects from TextIndex.top_pairs().
+        out: Text stream opened with newline="".
+    """
+    writer = csv.writer(out)
+    writer.writerow(("rank",) + TextPair._fields)
+    for rank, pair in enumerate(pairs, 1):
+        writer.writerow((rank,) + tuple(pair))
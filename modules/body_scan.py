@@ -0,0 +1,373 @@
+
+from collections import Counter
+
+from .ooxml import w, iterparse, rsid_to_int, MC_NS
+
+
+_BODY   = w('body')
+_P      = w('p')
+_R      = w('r')
+_T      = w('t')
+_DEL_TEXT = w('delText')
+_PSTYLE = w('pStyle')
+_VAL    = w('val')
+
+_RSID_R   = w('rsidR')
+_RSID_RPR = w('rsidRPr')
+_RSID_P   = w('rsidP')
+_RSID_DEL = w('rsidDel')
+
+# Run children that python-docx renders as whitespace in paragraph text
+_BREAKS = {w('tab'): '\t', w('br'): '\n', w('cr'): '\n'}
+
+# Elements passed to element hooks. RSID attributes (rsidR, rsidRPr, rsidDel,
+# rsidP, ...) are only defined on paragraphs, runs, table rows and section
+# properties; w:ins/w:del mark tracked changes.
+ELEMENT_TAGS = frozenset(w(name) for name in ('p', 'r', 'tr', 'sectPr', 'ins', 'del'))
+
+# Block-level containers that may sit directly under a story container; each is freed as it closes
+_BLOCKS = frozenset(w(name) for name in ('p', 'tbl', 'sdt', 'sectPr', 'customXml'))
+
+# Elements whose child blocks are the text of a story: the document body, a
+# header or footer, one footnote or endnote, or a glossary building block
+_CONTAINERS = frozenset(w(name) for name in ('body', 'hdr', 'ftr', 'footnote', 'endnote', 'docPartBody'))
+
+# Word saves each text box twice: as DrawingML (mc:Choice) and again as a VML
+# copy for older readers (mc:Fallback). Only the first is scanned.
+_FALLBACK = f'{{{MC_NS}}}Fallback'
+
+# The only tags iterparse reports; everything else stays in C
+_SCAN_TAGS = sorted(ELEMENT_TAGS | _BLOCKS | {_T, _DEL_TEXT, _PSTYLE, _FALLBACK} | set(_BREAKS))
+
+
+class RsidCollector:
+    """
+    Counts elements carrying a w:rsidR attribute, per RSID value, and records
+    every distinct session seen in w:rsidR, w:rsidRPr or w:rsidP.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+        self._other = set()
+
+    def element(self, elem):
+        get = elem.get
+        rsid = get(_RSID_R)
+        if rsid:
+            self.counts[rsid] += 1
+        value = get(_RSID_RPR)
+        if value:
+            self._other.add(value)
+        value = get(_RSID_P)
+        if value:
+            self._other.add(value)
+
+    @property
+    def sessions(self):
+        """Set of every RSID value referenced in the body."""
+        return self._other.union(self.counts)
+
+    def merge(self, other):
+        self.counts.update(other.counts)
+        self._other |= other._other
+
+
+class SessionTextCollector:
+    """
+    Measures how much body text each RSID session contributed, keyed by the
+    integer RSID (ooxml.rsid_to_int):
+      added_chars / added_words: text of runs created in the session (the
+                                 run's w:rsidR, else its paragraph's)
+      formatted_chars:           text whose run formatting was last changed
+                                 in the session (w:rsidRPr)
+      deleted_chars:             tracked-deleted text removed in the session
+                                 (w:delText in a run with w:rsidDel)
+      names:                     the RSID string of each key, as written
+
+    Tabs and breaks count as one character. A word split across runs is
+    counted once, in the run where it starts.
+    """
+
+    def __init__(self):
+        self.added_chars     = {}
+        self.added_words     = {}
+        self.formatted_chars = {}
+        self.deleted_chars   = {}
+        self.names           = {}
+        self._ids = {}
+        self._paragraph = None
+        self._in_word = False
+
+    def _id(self, value):
+        rsid = self._ids.get(value)
+        if rsid is None:
+            rsid = self._ids[value] = rsid_to_int(value)
+            self.names.setdefault(rsid, value)
+        return rsid
+
+    def text(self, value, deleted, run, paragraph):
+        if deleted:
+            value_rsid = run.get(_RSID_DEL) if run is not None else None
+            if value_rsid:
+                rsid = self._id(value_rsid)
+                self.deleted_chars[rsid] = self.deleted_chars.get(rsid, 0) + len(value)
+            return
+
+        if paragraph is not self._paragraph:
+            self._paragraph = paragraph
+            self._in_word = False
+        words = len(value.split())
+        if words and self._in_word and not value[0].isspace():
+            words -= 1
+        self._in_word = not value[-1].isspace()
+
+        get = run.get if run is not None else None
+        value_rsid = get(_RSID_R) if get else None
+        if not value_rsid and paragraph is not None:
+            value_rsid = paragraph.get(_RSID_R)
+        chars = len(value)
+        if value_rsid:
+            rsid = self._id(value_rsid)
+            self.added_chars[rsid] = self.added_chars.get(rsid, 0) + chars
+            self.added_words[rsid] = self.added_words.get(rsid, 0) + words
+        value_rsid = get(_RSID_RPR) if get else None
+        if value_rsid:
+            rsid = self._id(value_rsid)
+            self.formatted_chars[rsid] = self.formatted_chars.get(rsid, 0) + chars
+
+    def merge(self, other):
+        for mine, theirs in ((self.added_chars, other.added_chars), (self.added_words, other.added_words),
+                             (self.formatted_chars, other.formatted_chars),
+                             (self.deleted_chars, other.deleted_chars)):
+            for rsid, count in theirs.items():
+                mine[rsid] = mine.get(rsid, 0) + count
+        for rsid, name in other.names.items():
+            self.names.setdefault(rsid, name)
+
+
+class TextCollector:
+    """
+    The document's final text (tracked deletions excluded), including text in
+    tables and text boxes, with a newline between paragraphs.
+    """
+
+    def __init__(self):
+        self._parts = []
+        self._paragraph = None
+
+    def text(self, value, deleted, run, paragraph):
+        if deleted:
+            return
+        if paragraph is not self._paragraph:
+            self._paragraph = paragraph
+            self._parts.append('\n')
+        self._parts.append(value)
+
+    @property
+    def full_text(self):
+        return ''.join(self._parts)
+
+    def merge(self, other):
+        self._parts.extend(other._parts)
+        self._paragraph = None
+
+
+_INS = w('ins')
+_DEL = w('del')
+
+
+class TrackChangesCollector:
+    """Counts tracked insertions (w:ins) and deletions (w:del)."""
+
+    def __init__(self):
+        self.insertions = 0
+        self.deletions  = 0
+
+    def element(self, elem):
+        tag = elem.tag
+        if tag == _INS:
+            self.insertions += 1
+        elif tag == _DEL:
+            self.deletions += 1
+
+    def merge(self, other):
+        self.insertions += other.insertions
+        self.deletions  += other.deletions
+
+
+class WordCountCollector:
+    """Records the word count of every non-empty body paragraph."""
+
+    def __init__(self):
+        self.word_counts = []
+
+    def paragraph(self, text, style_id):
+        text = text.strip()
+        if text:
+            self.word_counts.append(len(text.split()))
+
+    def merge(self, other):
+        self.word_counts.extend(other.word_counts)
+
+
+class StyleCollector:
+    """Counts the paragraph style id of every non-empty body paragraph (None = default style)."""
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def paragraph(self, text, style_id):
+        if text.strip():
+            self.counts[style_id] += 1
+
+    def merge(self, other):
+        self.counts.update(other.counts)
+
+
+def scan_xml(stream, collectors):
+    """
+    Makes one streaming pass over a WordprocessingML part and feeds each collector.
+
+    Collectors subscribe by defining either hook:
+      - element(elem):            called once per ELEMENT_TAGS element as it opens,
+                                   in document order (tag and attributes only;
+                                   children and text may not be parsed yet)
+      - paragraph(text, style_id): called once per paragraph directly under w:body,
+                                   with its text (tabs/breaks as whitespace) and
+                                   its w:pStyle value, or None
+      - text(value, deleted, run, paragraph):
+                                   called once per piece of run text in document
+                                   order: each non-empty w:t, tab or break
+                                   (deleted=False) and each w:delText (deleted=True),
+                                   with the enclosing w:r and w:p (or None)
+
+    Any story part can be scanned: the main document, a header or footer, the
+    footnotes, endnotes or glossary. Paragraph hooks only see w:body paragraphs,
+    so they describe the main document alone. The VML copy of each text box
+    (mc:Fallback) is skipped, so its text and RSIDs are not counted twice.
+
+    Only the tags the collectors need are reported by the parser (iterparse's
+    tag filter), so most elements never become Python objects. Each top-level
+    block of a story is cleared as soon as it closes, so peak memory depends on
+    the largest paragraph or table, not on the document length.
+
+    Args:
+        stream: A binary file-like object for the XML part.
+        collectors (list): Collector objects.
+    """
+    element_hooks   = [c.element for c in collectors if hasattr(c, 'element')]
+    paragraph_hooks = [c.paragraph for c in collectors if hasattr(c, 'paragraph')]
+    text_hooks      = [c.text for c in collectors if hasattr(c, 'text')]
+
+    # One entry per open w:p; nested paragraphs (text boxes) keep their own text
+    texts      = []
+    styles     = []
+    paragraphs = []
+    runs       = []
+    # Depth of open mc:Fallback elements; everything inside them is ignored
+    fallback   = 0
+
+    for event, elem in iterparse(stream, events=('start', 'end'), tag=_SCAN_TAGS):
+        tag = elem.tag
+        if tag == _FALLBACK:
+            fallback += 1 if event == 'start' else -1
+            continue
+        if fallback:
+            continue
+        if event == 'start':
+            if tag in ELEMENT_TAGS:
+                for hook in element_hooks:
+                    hook(elem)
+                if tag == _P:
+                    texts.append([])
+                    styles.append(None)
+                    paragraphs.append(elem)
+                elif tag == _R:
+                    runs.append(elem)
+            continue
+
+        # Text-level elements are left for their enclosing block to free
+        if tag == _T:
+            value = elem.text
+            if value:
+                if texts:
+                    texts[-1].append(value)
+                for hook in text_hooks:
+                    hook(value, False, runs[-1] if runs else None, paragraphs[-1] if paragraphs else None)
+            continue
+        if tag in _BREAKS:
+            value = _BREAKS[tag]
+            if texts:
+                texts[-1].append(value)
+            for hook in text_hooks:
+                hook(value, False, runs[-1] if runs else None, paragraphs[-1] if paragraphs else None)
+            continue
+        if tag == _DEL_TEXT:
+            value = elem.text
+            if value:
+                for hook in text_hooks:
+                    hook(value, True, runs[-1] if runs else None, paragraphs[-1] if paragraphs else None)
+            continue
+        if tag == _R:
+            if runs:
+                runs.pop()
+            continue
+        if tag == _PSTYLE:
+            if styles:
+                styles[-1] = elem.get(_VAL)
+            continue
+        if tag not in _BLOCKS:
+            continue
+
+        parent = elem.getparent()
+        top_level = parent is not None and parent.tag in _CONTAINERS
+
+        if tag == _P:
+            text  = ''.join(texts.pop())
+            style = styles.pop()
+            paragraphs.pop()
+            if top_level and parent.tag == _BODY:
+                for hook in paragraph_hooks:
+                    hook(text, style)
+
+        if top_level:
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del parent[0]
+
+
+class BodyScan:
+    """Results of the default collectors after one pass over a story part."""
+
+    def __init__(self):
+        self.rsids         = RsidCollector()
+        self.track_changes = TrackChangesCollector()
+        self.word_counts   = WordCountCollector()
+        self.styles        = StyleCollector()
+        self.session_text  = SessionTextCollector()
+        self.text          = TextCollector()
+
+    @property
+    def collectors(self):
+        return [self.rsids, self.track_changes, self.word_counts, self.styles, self.session_text, self.text]
+
+    def merge(self, other):
+        """Add another part's results to this one; its text follows this part's text."""
+        for mine, theirs in zip(self.collectors, other.collectors):
+            mine.merge(theirs)
+
+
+def scan_document(stream):
+    """
+    Runs the default collectors over a story part in a single streaming pass.
+
+    Args:
+        stream: A binary file-like object for word/document.xml or another
+                story part (see docx_package.DocxPackage.story_parts).
+
+    Returns:
+        BodyScan: The populated collectors.
+    """
+    scan = BodyScan()
+    scan_xml(stream, scan.collectors)
+    return scan
@@ -0,0 +1,325 @@
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+
+from .batch import (
+    iter_batch, open_default_cache, discover_files, ResultStore, RsidIndex, cluster_findings,
+    similarity_findings, write_pairs_csv, TextIndex, text_similarity_findings, write_text_pairs_csv,
+)
+from .batch.discovery import DEFAULT_EXCLUDE
+from .batch.rsid_index import DEFAULT_MIN_SHARED, TEMPLATE_MIN_DOCS
+from .batch.text_index import DEFAULT_MIN_SIMILARITY
+from .batch.store import STAT, RESUME_MODES
+from .file_analyzer import FULL, LEVELS
+from .findings import format_finding, to_dict
+from .keywords import KEYWORDS_ENV, BODY_ENV, load_keywords
+from .profiling import TIME, MEMORY, summarize, format_summary
+
+
+SUPPORTED_EXTENSIONS = ('.docx', '.pdf', '.xml')
+
+
+def _write_jsonl(out, index, file_path, findings):
+    record = {"index": index, "path": file_path, "findings": [to_dict(f) for f in findings]}
+    out.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+
+def _write_text(out, index, file_path, findings):
+    sep = "=" * 60
+    title = f"FILE: {file_path}" if file_path is not None else "BATCH SUMMARY"
+    out.write(f"{sep}\n=== {title} ===\n{sep}\n")
+    for finding in findings:
+        out.write(format_finding(finding) + "\n")
+    out.write("\n")
+
+
+_WRITERS = {"jsonl": _write_jsonl, "text": _write_text}
+
+
+def _batch_findings(rsid_index, text_index, args):
+    """Cross-submission findings requested on the command line."""
+    findings = []
+    max_docs = args.max_docs_per_rsid
+    if args.rsid_clusters:
+        clusters = rsid_index.clusters(min_shared=args.min_shared_rsids, max_docs=max_docs)
+        findings.extend(cluster_findings(clusters, rsid_index.template_rsids(max_docs)))
+    if args.rsid_similarity:
+        pairs = rsid_index.top_pairs(args.rsid_similarity, min_shared=args.min_shared_rsids, max_docs=max_docs)
+        findings.extend(similarity_findings(pairs))
+        if args.similarity_csv:
+            with open(args.similarity_csv, "w", newline="", encoding="utf-8") as f:
+                write_pairs_csv(pairs, f)
+    if args.text_similarity:
+        pairs = text_index.top_pairs(args.text_similarity, min_similarity=args.min_text_similarity)
+        findings.extend(text_similarity_findings(pairs))
+        if args.text_similarity_csv:
+            with open(args.text_similarity_csv, "w", newline="", encoding="utf-8") as f:
+                write_text_pairs_csv(pairs, f)
+    return findings
+
+
+def _write_profile(profiles, path):
+    """Per-checker summary of a --profile run: a table on stderr, or JSON when a path is given."""
+    rows = summarize(profiles.values())
+    if path == "-":
+        print("\n".join(format_summary(rows)), file=sys.stderr)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"summary": rows, "files": profiles}, f, indent=2)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="docx-integrity-checker scan",
+        description="Analyze .docx/.pdf/.xml files without the GUI and stream one result per file.",
+    )
+    parser.add_argument("paths", nargs="*", help="Files or folders to analyze. Folders are searched recursively.")
+    parser.add_argument(
+        "--include", action="append", default=[], metavar="GLOB",
+        help="Only analyze files in folders that match this pattern, e.g. '*.docx' or 'week3/*' "
+             "(matched against the file name and its path inside the folder; may be repeated).",
+    )
+    parser.add_argument(
+        "--exclude", action="append", default=[], metavar="GLOB",
+        help="Skip files and folders that match this pattern (may be repeated). Word lock files (~$*), "
+             "hidden files and __MACOSX folders are always skipped.",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="Worker processes (default: one per CPU core; 1 = no pool).",
+    )
+    parser.add_argument(
+        "--page-workers", type=int, default=1, metavar="N",
+        help="With -j 1, extract the page text of each PDF of 64 pages or more in N processes "
+             "(default: 1, in-process). Pool workers never start processes of their own.",
+    )
+    parser.add_argument(
+        "-f", "--format", choices=sorted(_WRITERS), default="jsonl",
+        help="Output format (default: jsonl).",
+    )
+    parser.add_argument(
+        "--level", choices=LEVELS, default=FULL,
+        help="full: every check (default). triage: metadata, settings.xml RSIDs and the "
+             "ZIP listing only, for fast first-pass screening of many files.",
+    )
+    parser.add_argument(
+        "--keywords", metavar="FILE",
+        help="AI keyword list to flag in metadata and comments, one keyword or phrase per line "
+             "(default: the built-in list in modules/ai_keywords.txt).",
+    )
+    parser.add_argument(
+        "--keyword-body", action="store_true",
+        help="Also flag AI keywords in the body text of every document.",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=None, metavar="SECONDS",
+        help="Stop analyzing a file after this many seconds and report it as timed out; "
+             "the rest of the scan carries on (default: no limit).",
+    )
+    parser.add_argument(
+        "--max-memory", type=int, default=None, metavar="MB",
+        help="Memory each worker process may use for one file, in MB (Linux/macOS; default: no limit). "
+             "This caps virtual address space (RLIMIT_AS), not resident memory, so it is reached "
+             "before the process uses that much RAM.",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Ignore and do not update the result cache; re-analyze every file.",
+    )
+    parser.add_argument(
+        "--store", metavar="PATH",
+        help="Record every result in this SQLite file as the scan runs, so an interrupted "
+             "scan can be resumed and its report rebuilt later.",
+    )
+    parser.add_argument(
+        "--resume", nargs="?", const=STAT, default=None, choices=RESUME_MODES,
+        help="With --store, continue the last scan recorded there: files whose results are "
+             "already stored are not analyzed again. A file counts as unchanged if its size and "
+             "modification time match (stat, the default) or its SHA-256 does (hash).",
+    )
+    parser.add_argument(
+        "--report-only", action="store_true",
+        help="With --store, write the report of the last scan recorded there, in input order, "
+             "without analyzing anything. No paths are needed.",
+    )
+    parser.add_argument(
+        "--rsid-clusters", action="store_true",
+        help="After all files, report groups of .docx files that share RSID sessions "
+             "(written as a final record with no path).",
+    )
+    parser.add_argument(
+        "--min-shared-rsids", type=int, default=DEFAULT_MIN_SHARED, metavar="N",
+        help=f"RSIDs two files must share to be grouped or paired (default: {DEFAULT_MIN_SHARED}).",
+    )
+    parser.add_argument(
+        "--max-docs-per-rsid", type=int, default=None, metavar="N",
+        help="RSIDs found in more than N files are treated as template sessions: listed, but not "
+             f"used to group or pair files (default: half the files, at least {TEMPLATE_MIN_DOCS}).",
+    )
+    parser.add_argument(
+        "--rsid-similarity", type=int, nargs="?", const=20, default=None, metavar="K",
+        help="After all files, report the K .docx pairs with the highest RSID overlap "
+             "(Jaccard; default K: 20).",
+    )
+    parser.add_argument(
+        "--similarity-csv", metavar="PATH",
+        help="Also write the most similar pairs to a CSV file (implies --rsid-similarity).",
+    )
+    parser.add_argument(
+        "--text-similarity", type=int, nargs="?", const=20, default=None, metavar="K",
+        help="After all files, report the K pairs of submissions whose text overlaps most "
+             "(estimated with MinHash; default K: 20). Needs --level full.",
+    )
+    parser.add_argument(
+        "--min-text-similarity", type=float, default=DEFAULT_MIN_SIMILARITY, metavar="J",
+        help=f"Smallest estimated text overlap reported, 0-1 (default: {DEFAULT_MIN_SIMILARITY}).",
+    )
+    parser.add_argument(
+        "--text-similarity-csv", metavar="PATH",
+        help="Also write the text-similar pairs to a CSV file (implies --text-similarity).",
+    )
+    parser.add_argument(
+        "--profile", nargs="?", const="-", default=None, metavar="PATH",
+        help="Time every checker on every file (bypasses the cache). Prints a per-checker "
+             "summary table to stderr, or writes a JSON profile to PATH.",
+    )
+    parser.add_argument(
+        "--profile-memory", action="store_true",
+        help="With --profile, also record each checker's peak traced memory (much slower).",
+    )
+    return parser
+
+
+def run_scan(argv=None, out=None):
+    """
+    Entry point for `docx-integrity-checker scan`. Imports nothing from tkinter.
+
+    Results are written as each file finishes, so they arrive in completion
+    order; jsonl records carry the input index to restore the original order.
+
+    Args:
+        argv (list): Arguments after the `scan` subcommand. Defaults to sys.argv[1:].
+        out: Text stream to write to. Defaults to sys.stdout.
+
+    Returns:
+        int: Process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        print("error: --jobs must be at least 1", file=sys.stderr)
+        return 2
+    if args.page_workers < 1:
+        print("error: --page-workers must be at least 1", file=sys.stderr)
+        return 2
+
+    if args.timeout is not None and args.timeout <= 0:
+        print("error: --timeout must be positive", file=sys.stderr)
+        return 2
+    if args.max_memory is not None and args.max_memory < 1:
+        print("error: --max-memory must be at least 1", file=sys.stderr)
+        return 2
+
+    if (args.resume or args.report_only) and not args.store:
+        print("error: --resume and --report-only need --store", file=sys.stderr)
+        return 2
+    if not args.paths and not args.report_only:
+        print("error: no files or folders given", file=sys.stderr)
+        return 2
+
+    if args.similarity_csv and args.rsid_similarity is None:
+        args.rsid_similarity = 20
+    if args.text_similarity_csv and args.text_similarity is None:
+        args.text_similarity = 20
+    if args.keywords:
+        try:
+            load_keywords(args.keywords)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"error: cannot read --keywords {args.keywords}: {e}", file=sys.stderr)
+            return 2
+    if not 0 <= args.min_text_similarity <= 1:
+        print("error: --min-text-similarity must be between 0 and 1", file=sys.stderr)
+        return 2
+    if args.max_docs_per_rsid is not None and args.max_docs_per_rsid < 2:
+        print("error: --max-docs-per-rsid must be at least 2", file=sys.stderr)
+        return 2
+
+    # Set only once every argument has been accepted, and before the store is
+    # opened (its version includes the keyword fingerprint). Read by the
+    # checkers, here and in the worker processes, which inherit the environment
+    if args.keywords:
+        os.environ[KEYWORDS_ENV] = os.path.abspath(args.keywords)
+    if args.keyword_body:
+        os.environ[BODY_ENV] = "1"
+
+    out = out or sys.stdout
+    write = _WRITERS[args.format]
+    cache = None if args.no_cache or args.report_only else open_default_cache()
+    store = None
+    if args.store:
+        try:
+            store = ResultStore(args.store, resume=args.resume or (STAT if args.report_only else None))
+        except sqlite3.Error as e:
+            print(f"error: cannot open --store {args.store}: {e}", file=sys.stderr)
+            return 2
+    rsid_index = RsidIndex() if args.rsid_clusters or args.rsid_similarity else None
+    text_index = TextIndex() if args.text_similarity else None
+    profile = (MEMORY if args.profile_memory else TIME) if args.profile else None
+    memory_limit = args.max_memory * 1024 * 1024 if args.max_memory else None
+    profiles = {}
+    # Batch signals by input position: results arrive in completion order, but
+    # the indexes must be filled in input order for their tie-breaks to be stable
+    batch_signals = []
+    try:
+        if args.report_only:
+            results = store.iter_results()
+        else:
+            paths = discover_files(args.paths, SUPPORTED_EXTENSIONS, args.include,
+                                   DEFAULT_EXCLUDE + tuple(args.exclude))
+            results = iter_batch(paths, args.jobs, cache, level=args.level, profile=profile,
+                                 timeout=args.timeout, memory_limit=memory_limit, store=store,
+                                 page_workers=args.page_workers)
+        for result in results:
+            write(out, result.index, result.path, result.findings)
+            out.flush()
+            if rsid_index is not None or text_index is not None:
+                batch_signals.append((result.index, result.path, result.signals.get("rsids"),
+                                      result.signals.get("minhash")))
+            if profile is not None:
+                profiles[result.path] = result.signals.get("profile", [])
+        if store is not None and not args.report_only:
+            store.finish()
+
+        if rsid_index is not None or text_index is not None:
+            batch_signals.sort(key=lambda entry: entry[0])
+            for _, path, rsids, minhash in batch_signals:
+                if rsid_index is not None and rsids is not None:
+                    rsid_index.add(path, rsids)
+                if text_index is not None:
+                    text_index.add(path, minhash)
+            write(out, None, None, _batch_findings(rsid_index, text_index, args))
+            out.flush()
+
+        if profile is not None:
+            _write_profile(profiles, args.profile)
+    except BrokenPipeError:
+        # Downstream consumer (e.g. `head`) closed the pipe; stop quietly.
+        # Point stdout at devnull so the interpreter's final flush cannot fail again.
+        if out is sys.stdout:
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        if cache is not None:
+            cache.close()
+        if store is not None:
+            store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_scan())
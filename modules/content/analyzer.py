@@ -1,12 +1,14 @@
 
-import docx
+from ..docx_package import open_package, OversizePart
+from ..findings import header, summary, error
 from .stats_checker import check_stats
 from .track_changes_checker import check_track_changes
 from .comment_extractor import extract_comments
 from .formatting_checker import check_formatting
+from .body_keyword_checker import check_body_keywords
 
 
-def analyze_content(file_path):
+def analyze_content(source):
     """
     Analyzes the body content of a .docx file and reports raw findings.
 
@@ -15,26 +17,32 @@ def analyze_content(file_path):
       - Tracked insertions and deletions
       - Inline comment extraction
       - Paragraph style distribution
+      - AI keywords in the body text (only when enabled, see keywords.scan_body)
 
     Args:
-        file_path (str): The path to the .docx file.
+        source (str | DocxPackage): The path to the .docx file, or a shared package.
 
     Returns:
-        list: A list of strings containing the content analysis findings.
+        list: Findings from the content analysis.
     """
-    findings = ["--- Content Analysis ---"]
+    findings = [header("Content Analysis")]
     try:
-        document = docx.Document(file_path)
-
-        findings += check_stats(document)
-        findings += check_track_changes(file_path)
-        findings += extract_comments(file_path)
-        findings += check_formatting(document)
+        with open_package(source) as package:
+            # A part over the package limits stops only the checks that need it
+            skipped = set()
+            for check in (check_stats, check_track_changes, extract_comments, check_formatting,
+                          check_body_keywords):
+                try:
+                    findings += check(package)
+                except OversizePart as e:
+                    if e.name not in skipped:
+                        skipped.add(e.name)
+                        findings.append(error("ERROR", str(e), e.name))
 
         if len(findings) == 1:
-            findings.append("No content characteristics found.")
+            findings.append(summary("No content characteristics found."))
 
     except Exception as e:
-        findings.append(f"An unexpected error occurred during content analysis: {e}")
+        findings.append(error("ERROR", f"An unexpected error occurred during content analysis: {e}", str(e)))
 
     return findings
@@ -0,0 +1,22 @@
+
+from ..keywords import body_findings, scan_body
+from ..profiling import profiled
+
+
+@profiled
+def check_body_keywords(package):
+    """
+    Scans the document's body text for AI-related keywords, when body scanning
+    is enabled (see keywords.scan_body). The text comes from the shared body
+    scan, so it covers headers, footers and notes too, and each part is
+    still read only once.
+
+    Args:
+        package (DocxPackage): The shared package for the .docx file.
+
+    Returns:
+        list: KEYWORD findings, or nothing when body scanning is off.
+    """
+    if not scan_body() or not package.has_part('word/document.xml'):
+        return []
+    return body_findings(package.body_scan().text.full_text)
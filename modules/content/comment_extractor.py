@@ -1,54 +1,73 @@
 
 import zipfile
-import xml.etree.ElementTree as ET
 
+from ..docx_package import OversizePart
+from ..findings import info, notice, warning, error
+from ..keywords import active_matcher
+from ..ooxml import w, xpath
+from ..profiling import profiled
 
-def extract_comments(file_path):
+_COMMENTS = xpath('w:comment')
+_COMMENT_TEXT = xpath('.//w:t/text()')
+_AUTHOR = w('author')
+_DATE = w('date')
+
+
+@profiled
+def extract_comments(package):
     """
     Extracts all inline comments from word/comments.xml inside the .docx ZIP.
-    Each comment reports its author, date, and text content.
+    Each comment reports its author, date, and text content, and a comment
+    whose text contains AI-related keywords (see keywords.py) is flagged.
 
     Args:
-        file_path (str): The path to the .docx file.
+        package (DocxPackage): The shared package for the .docx file.
 
     Returns:
-        list: Finding strings for each comment found, or a "none found" message.
+        list: Findings for each comment found, or a "none found" finding.
     """
     findings = []
     try:
-        with zipfile.ZipFile(file_path, 'r') as z:
-            if 'word/comments.xml' not in z.namelist():
-                findings.append("[COMMENT] No comments found in document.")
-                return findings
-
-            with z.open('word/comments.xml') as comments_xml:
-                root = ET.parse(comments_xml).getroot()
-                w = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
-
-                comments = root.findall(f'{w}comment')
-                if not comments:
-                    findings.append("[COMMENT] No comments found in document.")
-                    return findings
-
-                findings.append(f"[COMMENT] {len(comments)} comment(s) found.")
-                for comment in comments:
-                    author = comment.attrib.get(f'{w}author', 'Unknown')
-                    date   = comment.attrib.get(f'{w}date', '')
-                    if date and 'T' in date:
-                        date = date.split('T')[0]
-
-                    texts = [r.text for r in comment.iter(f'{w}t') if r.text]
-                    body  = ' '.join(texts).strip()
-                    if len(body) > 120:
-                        body = body[:117] + '...'
-
-                    findings.append(
-                        f'[COMMENT] Author: "{author}" | Date: {date} | Text: "{body}"'
-                    )
+        if not package.has_part('word/comments.xml'):
+            findings.append(info("COMMENT", "comments", None, "No comments found in document."))
+            return findings
+
+        comments = _COMMENTS(package.parse_part('word/comments.xml'))
+        if not comments:
+            findings.append(info("COMMENT", "comments", None, "No comments found in document."))
+            return findings
+
+        findings.append(notice("COMMENT", "comments", len(comments), f"{len(comments)} comment(s) found."))
+        matcher = active_matcher()
+        for comment in comments:
+            author = comment.get(_AUTHOR, 'Unknown')
+            date   = comment.get(_DATE, '')
+            if date and 'T' in date:
+                date = date.split('T')[0]
+
+            full_text = ' '.join(_COMMENT_TEXT(comment)).strip()
+            body = full_text
+            if len(body) > 120:
+                body = body[:117] + '...'
+
+            findings.append(info(
+                "COMMENT", "comment", {"author": author, "date": date, "text": body},
+                f'Author: "{author}" | Date: {date} | Text: "{body}"'
+            ))
+            found = matcher.find(full_text)
+            if found:
+                keywords = ", ".join(f"'{k}'" for k in found)
+                findings.append(warning(
+                    "KEYWORD", "comment", {"author": author, "keywords": found},
+                    f'AI keyword(s) {keywords} found in a comment by "{author}".'
+                ))
 
     except zipfile.BadZipFile:
-        findings.append("[COMMENT] Could not read document — file is not a valid .docx.")
+        findings.append(error("COMMENT", "Could not read document — file is not a valid .docx."))
+    except OversizePart:
+        # Reported once per part by analyze_content
+        raise
     except Exception as e:
-        findings.append(f"[COMMENT] Error extracting comments: {e}")
+        findings.append(error("COMMENT", f"Error extracting comments: {e}", str(e)))
 
     return findings
@@ -1,36 +1,77 @@
 
 from collections import Counter
 
+from ..findings import info, notice
+from ..ooxml import w, xpath
+from ..profiling import profiled
+
 
 # Styles that are considered "body" content (not structural headings/lists)
 _HEADING_PREFIXES = ("heading", "title", "subtitle", "toc")
 
+# styles.xml stores some built-in names in lower case; Word shows them capitalised
+_UI_NAMES = {"caption": "Caption", "footer": "Footer", "header": "Header"}
+_UI_NAMES.update({f"heading {i}": f"Heading {i}" for i in range(1, 10)})
+
+_PARAGRAPH_STYLES = xpath("w:style[@w:type='paragraph']")
+_STYLE_NAME = xpath('string(w:name/@w:val)')
+_STYLE_ID = w('styleId')
+_DEFAULT = w('default')
+
+
+def _paragraph_style_names(package):
+    """
+    Maps paragraph style ids to display names using word/styles.xml.
+
+    Returns:
+        tuple: ({style_id: name}, default_name). Unknown or missing ids resolve
+               to the default paragraph style, as in Word.
+    """
+    names = {}
+    default_name = "Normal"
+    if not package.has_part('word/styles.xml'):
+        return names, default_name
+
+    root = package.parse_part('word/styles.xml')
+    for style in _PARAGRAPH_STYLES(root):
+        style_id = style.get(_STYLE_ID)
+        name = _STYLE_NAME(style)
+        name = _UI_NAMES.get(name, name) or style_id
+        names[style_id] = name
+        if style.get(_DEFAULT) in ('1', 'true', 'on'):
+            default_name = name
+    return names, default_name
+
 
-def check_formatting(document):
+@profiled
+def check_formatting(package):
     """
     Reports the distribution of paragraph styles used in the document.
     Flags if all body paragraphs share a single style.
 
     Args:
-        document: A python-docx Document object.
+        package (DocxPackage): The shared package for the .docx file.
 
     Returns:
-        list: Finding strings describing style usage.
+        list: Findings describing style usage.
     """
     findings = []
 
+    names, default_name = _paragraph_style_names(package)
     style_counts = Counter()
-    for para in document.paragraphs:
-        if para.text.strip():
-            style_counts[para.style.name] += 1
+    for style_id, count in package.body_scan().styles.counts.items():
+        style_counts[names.get(style_id, default_name)] += count
 
     if not style_counts:
-        findings.append("[FORMAT] No non-empty paragraphs found for style analysis.")
+        findings.append(info("FORMAT", "style_distribution", None,
+                             "No non-empty paragraphs found for style analysis."))
         return findings
 
-    findings.append("[FORMAT] Paragraph style distribution:")
+    findings.append(info("FORMAT", "style_distribution", dict(style_counts.most_common()),
+                         "Paragraph style distribution:"))
     for style, count in style_counts.most_common():
-        findings.append(f"[FORMAT]   {style}: {count} paragraph(s)")
+        findings.append(info("FORMAT", "style", {"style": style, "count": count},
+                             f"  {style}: {count} paragraph(s)"))
 
     body_styles = {
         s for s in style_counts
@@ -38,8 +79,9 @@ def check_formatting(document):
     }
     if len(body_styles) == 1:
         only_style = next(iter(body_styles))
-        findings.append(
-            f"[FORMAT] All body paragraphs use a single style: '{only_style}'"
-        )
+        findings.append(notice(
+            "FORMAT", "single_body_style", only_style,
+            f"All body paragraphs use a single style: '{only_style}'"
+        ))
 
     return findings
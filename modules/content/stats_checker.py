@@ -1,32 +1,35 @@
 
-def check_stats(document):
+from ..findings import info
+from ..profiling import profiled
+
+
+@profiled
+def check_stats(package):
     """
     Reports basic word and paragraph statistics for the document body.
 
     Args:
-        document: A python-docx Document object.
+        package (DocxPackage): The shared package for the .docx file.
 
     Returns:
-        list: Finding strings with counts and length metrics.
+        list: Findings with counts and length metrics.
     """
     findings = []
 
-    word_counts = []
-    for para in document.paragraphs:
-        text = para.text.strip()
-        if text:
-            word_counts.append(len(text.split()))
+    word_counts = package.body_scan().word_counts.word_counts
 
     total_paragraphs = len(word_counts)
     total_words = sum(word_counts)
 
-    findings.append(f"[CONTENT] Non-empty paragraphs: {total_paragraphs}")
-    findings.append(f"[CONTENT] Total words: {total_words}")
+    findings.append(info("CONTENT", "paragraphs", total_paragraphs, f"Non-empty paragraphs: {total_paragraphs}"))
+    findings.append(info("CONTENT", "words", total_words, f"Total words: {total_words}"))
 
     if total_paragraphs > 0:
         avg = total_words / total_paragraphs
-        findings.append(f"[CONTENT] Average words per paragraph: {avg:.1f}")
-        findings.append(f"[CONTENT] Shortest paragraph: {min(word_counts)} word(s)")
-        findings.append(f"[CONTENT] Longest paragraph: {max(word_counts)} word(s)")
+        shortest, longest = min(word_counts), max(word_counts)
+        findings.append(info("CONTENT", "avg_words_per_paragraph", round(avg, 1),
+                             f"Average words per paragraph: {avg:.1f}"))
+        findings.append(info("CONTENT", "shortest_paragraph", shortest, f"Shortest paragraph: {shortest} word(s)"))
+        findings.append(info("CONTENT", "longest_paragraph", longest, f"Longest paragraph: {longest} word(s)"))
 
     return findings
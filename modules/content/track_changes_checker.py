@@ -1,41 +1,44 @@
 
 import zipfile
-import xml.etree.ElementTree as ET
 
+from ..docx_package import OversizePart
+from ..findings import info, notice, error
+from ..profiling import profiled
 
-def check_track_changes(file_path):
+
+@profiled
+def check_track_changes(package):
     """
     Checks for tracked insertions (w:ins) and deletions (w:del) in the document XML.
 
     Args:
-        file_path (str): The path to the .docx file.
+        package (DocxPackage): The shared package for the .docx file.
 
     Returns:
-        list: Finding strings reporting tracked change counts.
+        list: Findings reporting tracked change counts.
     """
     findings = []
     try:
-        with zipfile.ZipFile(file_path, 'r') as z:
-            if 'word/document.xml' not in z.namelist():
-                findings.append("[TRACK] word/document.xml not found.")
-                return findings
-
-            with z.open('word/document.xml') as doc_xml:
-                root = ET.parse(doc_xml).getroot()
-                w = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+        if not package.has_part('word/document.xml'):
+            findings.append(error("TRACK", "word/document.xml not found."))
+            return findings
 
-                insertions = root.findall(f'.//{w}ins')
-                deletions  = root.findall(f'.//{w}del')
+        track_changes = package.body_scan().track_changes
+        insertions = track_changes.insertions
+        deletions  = track_changes.deletions
 
-                if insertions or deletions:
-                    findings.append(f"[TRACK] Tracked insertions found: {len(insertions)}")
-                    findings.append(f"[TRACK] Tracked deletions found: {len(deletions)}")
-                else:
-                    findings.append("[TRACK] No tracked changes found in document.")
+        if insertions or deletions:
+            findings.append(notice("TRACK", "insertions", insertions, f"Tracked insertions found: {insertions}"))
+            findings.append(notice("TRACK", "deletions", deletions, f"Tracked deletions found: {deletions}"))
+        else:
+            findings.append(info("TRACK", "tracked_changes", None, "No tracked changes found in document."))
 
     except zipfile.BadZipFile:
-        findings.append("[TRACK] Could not read document — file is not a valid .docx.")
+        findings.append(error("TRACK", "Could not read document — file is not a valid .docx."))
+    except OversizePart:
+        # Reported once per part by analyze_content
+        raise
     except Exception as e:
-        findings.append(f"[TRACK] Error checking track changes: {e}")
+        findings.append(error("TRACK", f"Error checking track changes: {e}", str(e)))
 
     return findings
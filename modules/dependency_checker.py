@@ -1,4 +1,6 @@
 
+import importlib
+import importlib.util
 import os
 import sys
 import subprocess
@@ -37,6 +39,20 @@ def get_import_name(package_name):
     # For many packages, the import name is the same as the package name (or similar)
     return package_name.split("==")[0].replace("-", "_")
 
+
+def is_installed(import_name):
+    """
+    Check whether a module can be imported, without importing it.
+
+    importlib.util.find_spec only locates the package on disk, so probing every
+    requirement at startup costs milliseconds instead of loading customtkinter,
+    PIL, lxml, pypdf and numpy up front. The checkers import them when needed.
+    """
+    try:
+        return importlib.util.find_spec(import_name) is not None
+    except (ImportError, ValueError):
+        return False
+
 def check_and_install_dependencies():
     """Check for dependencies from requirements.txt and install them if missing, using a GUI."""
     
@@ -52,13 +68,8 @@ def check_and_install_dependencies():
         _err_root.destroy()
         return False
 
-    missing_dependencies = []
-    for package in required_packages:
-        import_name = get_import_name(package)
-        try:
-            __import__(import_name)
-        except ImportError:
-            missing_dependencies.append(package)
+    missing_dependencies = [package for package in required_packages
+                            if not is_installed(get_import_name(package))]
 
     if not missing_dependencies:
         return True
@@ -89,11 +100,9 @@ def check_and_install_dependencies():
     installer_root.mainloop()
     
     # Final check to see if dependencies were actually installed
+    importlib.invalidate_caches()
     for package in missing_dependencies:
-        import_name = get_import_name(package)
-        try:
-            __import__(import_name)
-        except ImportError:
+        if not is_installed(get_import_name(package)):
             error_root = tk.Tk()
             error_root.withdraw()
             messagebox.showerror("Startup Error", "Could not start the application due to missing dependencies.\nPlease check the installation messages and install them manually.")
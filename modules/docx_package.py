@@ -0,0 +1,355 @@
+
+import os
+import posixpath
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from . import profiling
+
+
+# Limits on what a package may make us decompress. Submissions are untrusted:
+# a few KB of ZIP can declare gigabytes of XML (a "zip bomb").
+MAX_PART_BYTES = 256 * 1024 * 1024     # uncompressed size of any one part
+MAX_TOTAL_BYTES = 512 * 1024 * 1024    # bytes decompressed from one package in total
+MAX_RATIO = 200                        # uncompressed / compressed size of a part...
+RATIO_MIN_BYTES = 1024 * 1024          # ...checked once the part is at least this big
+
+MAIN_DOCUMENT = 'word/document.xml'
+
+# Story parts besides the main document, by the last segment of their
+# relationship type and the end of their content type, in report order
+STORY_KINDS = (
+    ('header',           'wordprocessingml.header+xml'),
+    ('footer',           'wordprocessingml.footer+xml'),
+    ('footnotes',        'wordprocessingml.footnotes+xml'),
+    ('endnotes',         'wordprocessingml.endnotes+xml'),
+    ('glossaryDocument', 'wordprocessingml.document.glossary+xml'),
+)
+
+# Relationship parts that may point at story parts: the main document's and,
+# since building blocks have their own headers and footers, the glossary's
+_STORY_RELS = ('word/_rels/document.xml.rels', 'word/glossary/_rels/document.xml.rels')
+
+# Story parts are parsed on a few threads. Decompression and much of lxml's
+# parsing run outside the GIL; more threads than this only add contention.
+MAX_PART_THREADS = 4
+
+
+class OversizePart(Exception):
+    """
+    A part that the package limits forbid decompressing.
+
+    Raised from DocxPackage.open_part instead of reading the part.
+    """
+
+    def __init__(self, name, message):
+        super().__init__(message)
+        self.name = name
+
+
+class _BoundedStream:
+    """
+    Read-only wrapper around a ZIP member stream that stops at a byte budget.
+
+    Guards against central-directory sizes that understate the real data:
+    reading past the budget raises OversizePart rather than returning more.
+    """
+
+    def __init__(self, stream, name, package, budget):
+        self._stream = stream
+        self._name = name
+        self._package = package
+        self._budget = budget
+
+    def read(self, size=-1):
+        # Ask for one byte past the budget, so overrunning it is noticed
+        limit = self._budget + 1 if size is None or size < 0 else min(size, self._budget + 1)
+        data = self._stream.read(limit)
+        self._budget -= len(data)
+        self._package._spend(len(data))
+        if self._budget < 0:
+            raise OversizePart(self._name, f"{self._name} decompresses to more data than its declared size.")
+        return data
+
+    def close(self):
+        self._stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class DocxPackage:
+    """
+    Shared view of a single .docx ZIP package.
+
+    The archive is opened on first use and each XML part is parsed at most once,
+    so every checker handed the same package reuses one central-directory read
+    and one lxml tree per part.
+
+    Errors from opening the archive (e.g. zipfile.BadZipFile) are raised lazily
+    from the first access, so each checker keeps reporting them in its own words.
+
+    Parts are decompressed under limits (see MAX_PART_BYTES and friends). A part
+    whose declared size or compression ratio is over a limit is never opened,
+    and reading stops once a part or the whole package exceeds its byte budget;
+    both raise OversizePart. oversize_parts() lists the offending parts up front.
+    """
+
+    def __init__(self, file_path, max_part_bytes=MAX_PART_BYTES, max_total_bytes=MAX_TOTAL_BYTES,
+                 max_ratio=MAX_RATIO, part_threads=None):
+        """
+        Args:
+            file_path (str | file): Path to the .docx, or a seekable binary file
+                                    object holding it (e.g. an archive member
+                                    read into memory).
+            part_threads (int): Threads for scanning story parts (see
+                                story_scans). Defaults to MAX_PART_THREADS,
+                                capped at the number of CPUs.
+        """
+        self.file_path = file_path
+        self.part_threads = part_threads or min(MAX_PART_THREADS, os.cpu_count() or 1)
+        self.max_part_bytes = max_part_bytes
+        self.max_total_bytes = max_total_bytes
+        self.max_ratio = max_ratio
+        self._zip = None
+        self._names = None
+        self._oversize = None
+        self._decompressed = 0
+        self._roots = {}
+        self._lock = threading.Lock()
+        self._story_parts = None
+        self._story_scans = None
+        self._story_errors = {}
+        self._body_scan = None
+
+    # --- Archive access ---
+
+    @property
+    def zip(self):
+        """The open zipfile.ZipFile for this package."""
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(self.file_path, 'r')
+        return self._zip
+
+    @property
+    def names(self):
+        """Set of part names in the archive."""
+        if self._names is None:
+            self._names = set(self.zip.namelist())
+        return self._names
+
+    def has_part(self, name):
+        """Return True if the archive contains a part called `name`."""
+        return name in self.names
+
+    def oversize_parts(self):
+        """
+        Parts over the limits, judged from the central directory alone.
+
+        Returns:
+            dict: Part name -> (uncompressed bytes, compression ratio, reason).
+        """
+        if self._oversize is None:
+            self._oversize = {}
+            for zi in self.zip.infolist():
+                ratio = zi.file_size / max(zi.compress_size, 1)
+                if zi.file_size > self.max_part_bytes:
+                    reason = (f"{zi.file_size:,} bytes uncompressed, over the "
+                              f"{self.max_part_bytes:,}-byte limit")
+                elif zi.file_size >= RATIO_MIN_BYTES and ratio > self.max_ratio:
+                    reason = (f"compressed {ratio:,.0f}:1, over the {self.max_ratio}:1 limit "
+                              f"({zi.file_size:,} bytes from {zi.compress_size:,})")
+                else:
+                    continue
+                self._oversize[zi.filename] = (zi.file_size, round(ratio, 1), reason)
+        return self._oversize
+
+    def open_part(self, name):
+        """
+        Open a part of the archive as a binary stream, bounded by the package limits.
+
+        Raises:
+            KeyError: If the part is not present in the archive.
+            OversizePart: If the part is over a limit, or the package has
+                          already used up its decompression budget.
+        """
+        zi = self.zip.getinfo(name)
+        oversize = self.oversize_parts().get(name)
+        if oversize is not None:
+            raise OversizePart(name, f"{name} was not analyzed: {oversize[2]}.")
+        if self._decompressed + zi.file_size > self.max_total_bytes:
+            raise OversizePart(name, f"{name} was not analyzed: the package would decompress to more "
+                                     f"than {self.max_total_bytes:,} bytes in total.")
+        if profiling.is_active():
+            profiling.add_bytes(zi.file_size)
+        return _BoundedStream(self.zip.open(zi), name, self, zi.file_size)
+
+    def _spend(self, nbytes):
+        # Story parts are read on several threads at once
+        with self._lock:
+            self._decompressed += nbytes
+
+    def parse_part(self, name):
+        """
+        Return the parsed (lxml) root element of a part, parsing it only once.
+
+        Raises:
+            KeyError: If the part is not present in the archive.
+        """
+        root = self._roots.get(name)
+        if root is None:
+            # lxml is loaded on first parse, so the limits and OversizePart can
+            # be imported (e.g. by archive.py for a PDF member) without it
+            from .ooxml import parse_xml
+            with self.open_part(name) as part:
+                root = parse_xml(part)
+            self._roots[name] = root
+        return root
+
+    # --- Story parts ---
+
+    def story_parts(self):
+        """
+        The package's story parts: word/document.xml first, then every header,
+        footer, footnotes, endnotes and glossary part in the archive, found
+        from [Content_Types].xml and the document relationships. A part
+        listed in either place is included; text boxes are scanned inside the
+        part that holds them.
+
+        Returns:
+            list: Part names, main document first, then in STORY_KINDS order.
+        """
+        if self._story_parts is None:
+            from .ooxml import xpath
+
+            kinds = {}
+            for override in self._listing('[Content_Types].xml', xpath('ct:Override')):
+                content_type = override.get('ContentType', '')
+                for rank, (_, suffix) in enumerate(STORY_KINDS):
+                    if content_type.endswith(suffix):
+                        kinds.setdefault(override.get('PartName', '').lstrip('/'), rank)
+            relationships = xpath('rel:Relationship')
+            ranks = {name: rank for rank, (name, _) in enumerate(STORY_KINDS)}
+            for rels in _STORY_RELS:
+                base = posixpath.dirname(posixpath.dirname(rels))
+                for rel in self._listing(rels, relationships):
+                    rank = ranks.get(rel.get('Type', '').rsplit('/', 1)[-1])
+                    if rank is None or rel.get('TargetMode') == 'External':
+                        continue
+                    # Targets are relative to the folder holding the _rels folder
+                    target = rel.get('Target', '')
+                    target = target.lstrip('/') if target.startswith('/') else \
+                        posixpath.normpath(posixpath.join(base, target))
+                    kinds.setdefault(target, rank)
+
+            others = sorted((rank, name) for name, rank in kinds.items()
+                            if name != MAIN_DOCUMENT and self.has_part(name))
+            parts = [MAIN_DOCUMENT] if self.has_part(MAIN_DOCUMENT) else []
+            self._story_parts = parts + [name for _, name in others]
+        return self._story_parts
+
+    def _listing(self, name, query):
+        """Elements `query` selects from part `name`; none if the part is missing or unreadable."""
+        if not self.has_part(name):
+            return []
+        try:
+            return query(self.parse_part(name))
+        except Exception as e:
+            self._story_errors[name] = str(e)
+            return []
+
+    def story_scans(self):
+        """
+        Return the collectors from one streaming pass over each story part.
+
+        Parts are independent, so they are scanned concurrently, on up to
+        part_threads threads. A part other than word/document.xml that
+        cannot be read (over the package limits, or malformed) is left out
+        and listed by story_errors().
+
+        Returns:
+            dict: Part name -> BodyScan, in story_parts() order.
+
+        Raises:
+            KeyError: If word/document.xml is not present in the archive.
+            OversizePart: If word/document.xml is over the package limits.
+        """
+        if self._story_scans is None:
+            from .body_scan import scan_document
+
+            self.zip.getinfo(MAIN_DOCUMENT)
+            parts = self.story_parts()
+
+            def scan(name):
+                try:
+                    with self.open_part(name) as part:
+                        return scan_document(part)
+                except Exception as e:
+                    if name == MAIN_DOCUMENT:
+                        raise
+                    self._story_errors[name] = str(e)
+                    return None
+
+            threads = min(len(parts), self.part_threads)
+            if threads > 1:
+                with ThreadPoolExecutor(threads) as pool:
+                    scans = list(pool.map(scan, parts))
+            else:
+                scans = [scan(name) for name in parts]
+            self._story_scans = {name: result for name, result in zip(parts, scans) if result is not None}
+        return self._story_scans
+
+    def story_errors(self):
+        """Story parts story_scans() could not read: part name -> reason."""
+        return dict(self._story_errors)
+
+    def body_scan(self):
+        """
+        Return the collectors for the whole document: word/document.xml plus
+        every other story part (see story_scans), merged. RSIDs, tracked
+        changes, session text and text cover all of them; paragraph counts
+        and styles come from the main document body alone.
+
+        Raises:
+            KeyError: If word/document.xml is not present in the archive.
+        """
+        if self._body_scan is None:
+            from .body_scan import BodyScan
+
+            combined = BodyScan()
+            for scan in self.story_scans().values():
+                combined.merge(scan)
+            self._body_scan = combined
+        return self._body_scan
+
+    # --- Lifecycle ---
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+@contextmanager
+def open_package(source):
+    """
+    Yield a DocxPackage for `source`, which may be a file path or an existing package.
+
+    A package passed in is shared and left open; one created here is closed on exit.
+    """
+    if isinstance(source, DocxPackage):
+        yield source
+        return
+    with DocxPackage(source) as package:
+        yield package
@@ -1,33 +1,104 @@
 
 import os
-from .metadata import scrape_metadata
-from .rsid_scraper import scrape_rsids
-from .content import analyze_content
+import zipfile
+from .archive import split_member, open_member
+from .docx_package import OversizePart
+from .findings import header, summary, error, is_substantive
 
-def analyze_file(file_path):
+# Analysis levels
+FULL = "full"
+TRIAGE = "triage"
+LEVELS = (FULL, TRIAGE)
+
+def analyze_file(file_path, signals=None, level=FULL, page_workers=None):
     """
     Orchestrates the analysis of a file by calling different scrapers.
+
+    Args:
+        file_path (str): Path to the file, or to a member of a .zip archive as
+                         "archive.zip::folder/essay.docx" (see archive.member_path).
+                         A member is read into memory, never extracted to disk.
+        signals (dict): Optional. When given, filled with per-document data used by
+                        batch-level analyses, computed from the same parse:
+                          "rsids": list of integer RSIDs (.docx only)
+                          "minhash": MinHash signature of the main document
+                                     text (not headers, footers or notes), or None
+                                     (see minhash.text_signature; FULL level only)
+        level (str): FULL runs every check. TRIAGE is for first-pass screening:
+                     for .docx it reads only docProps/core.xml, docProps/app.xml,
+                     word/settings.xml and the ZIP listing (never decompressing
+                     word/document.xml or media); for .pdf it reads only the
+                     metadata. RSID signals then come from settings.xml alone.
+        page_workers (int): Optional. Processes extracting the page text of a
+                            large PDF (see PdfDocument); by default it is
+                            extracted in this process.
+
+    Returns:
+        list: Finding records; render them with findings.format_finding.
     """
-    if not os.path.exists(file_path):
-        return ["Error: File not found. Please check the path."]
+    source = file_path
+    if split_member(file_path) is not None:
+        try:
+            source = open_member(file_path)
+        except KeyError:
+            return [error("ERROR", "Error: File not found in the archive.")]
+        except zipfile.BadZipFile:
+            return [error("ERROR", "Error: The archive is not a valid .zip file or it is corrupted.")]
+        except OversizePart as e:
+            return [error("ERROR", str(e), e.name)]
+    elif not os.path.exists(file_path):
+        return [error("ERROR", "Error: File not found. Please check the path.")]
 
     findings = []
     if file_path.lower().endswith('.docx'):
-        findings.extend(scrape_metadata(file_path))
-        findings.extend(scrape_rsids(file_path))
-        findings.extend(analyze_content(file_path))
+        # The .docx checkers (and lxml) are loaded only once a .docx is analyzed,
+        # as the PDF checkers (and pypdf) are below
+        from .docx_package import DocxPackage, MAIN_DOCUMENT
+        from .metadata import scrape_metadata
+        from .rsid_scraper import scrape_rsids, collect_rsid_set
+        from .content import analyze_content
+        from .package_listing import check_package_listing, check_part_limits
+        from .minhash import text_signature
+
+        # One shared package: the ZIP is opened once and each part parsed once
+        include_body = level != TRIAGE
+        with DocxPackage(source) as package:
+            findings.extend(check_part_limits(package))
+            findings.extend(scrape_metadata(package))
+            findings.extend(scrape_rsids(package, include_body))
+            if include_body:
+                findings.extend(analyze_content(package))
+            else:
+                findings.extend(check_package_listing(package))
+            if signals is not None:
+                try:
+                    signals["rsids"] = collect_rsid_set(package, include_body).tolist()
+                except Exception:
+                    pass
+                if include_body:
+                    try:
+                        # The main document alone: headers, footers and notes are
+                        # often a shared course template that would inflate similarity
+                        signals["minhash"] = text_signature(package.story_scans()[MAIN_DOCUMENT].text.full_text)
+                    except Exception:
+                        pass
     elif file_path.lower().endswith('.pdf'):
         from .pdf import analyze_pdf
-        findings.extend(analyze_pdf(file_path))
+        findings.extend(analyze_pdf(source, page_workers, include_content=level != TRIAGE, signals=signals))
+    elif file_path.lower().endswith('.zip'):
+        if not zipfile.is_zipfile(file_path):
+            return [error("ERROR", "Error: The archive is not a valid .zip file or it is corrupted.")]
+        return [error("ERROR", "Error: .zip archives are analyzed file by file; scan the archive as a batch "
+                               "(e.g. with the scan command or the folder button).")]
     elif file_path.lower().endswith('.xml'):
         # For now, we can just have a simple message for XMLs
-        findings.append("--- XML Analysis ---")
-        findings.append("Successfully parsed XML file. (No specific AI/RSID analysis for generic XML)")
+        findings.append(header("XML Analysis"))
+        findings.append(summary("Successfully parsed XML file. (No specific AI/RSID analysis for generic XML)"))
     else:
-        return ["Error: This tool accepts .docx, .pdf, and .xml files only."]
+        return [error("ERROR", "Error: This tool accepts .docx, .pdf, and .xml files only.")]
 
     # Check if any meaningful findings were made besides headers
-    if not any(finding for finding in findings if "---" not in finding and "No " not in finding):
-        return ["No specific AI characteristics or RSID sessions found."]
+    if not any(is_substantive(finding) for finding in findings):
+        return [summary("No specific AI characteristics or RSID sessions found.")]
         
     return findings
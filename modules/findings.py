@@ -0,0 +1,81 @@
+
+from typing import Any, NamedTuple
+
+
+# Severities, lowest to highest
+INFO    = "info"
+NOTICE  = "notice"
+WARNING = "warning"
+ERROR   = "error"
+
+# Categories rendered without a "[CATEGORY]" prefix
+HEADER  = "HEADER"
+SUMMARY = "SUMMARY"
+FAILURE = "ERROR"
+_UNPREFIXED = {HEADER, SUMMARY, FAILURE}
+
+
+class Finding(NamedTuple):
+    """
+    One analysis result.
+
+    Attributes:
+        category (str): Report section, e.g. "RSID", "APP", "KEYWORD" (or HEADER/SUMMARY/ERROR).
+        severity (str): INFO, NOTICE, WARNING or ERROR.
+        key (str):      Stable machine-readable name, e.g. "unique_body_rsids".
+        value:          Typed value (int, float, str, bool, list, dict or None).
+                        Always JSON-native, so it survives caching unchanged.
+                        None marks "nothing found" results.
+        message (str):  Human-readable text, without the category prefix.
+    """
+    category: str
+    severity: str
+    key: str
+    value: Any
+    message: str
+
+
+def info(category, key, value, message):
+    return Finding(category, INFO, key, value, message)
+
+
+def notice(category, key, value, message):
+    return Finding(category, NOTICE, key, value, message)
+
+
+def warning(category, key, value, message):
+    return Finding(category, WARNING, key, value, message)
+
+
+def error(category, message, detail=None):
+    """An error finding; `detail` (usually str(exception)) is kept as the value."""
+    return Finding(category, ERROR, "error", detail, message)
+
+
+def header(title):
+    """A section header, rendered as '--- title ---'."""
+    return Finding(HEADER, INFO, "section", title, f"--- {title} ---")
+
+
+def summary(message):
+    return Finding(SUMMARY, INFO, "summary", None, message)
+
+
+def is_substantive(finding):
+    """True for findings that report something, as opposed to headers and 'nothing found' lines."""
+    return finding.category not in (HEADER, SUMMARY) and finding.value is not None
+
+
+def format_finding(finding):
+    """Render a finding as a single report line, e.g. '[RSID] Unique RSIDs found in document body: 4'."""
+    if finding.category in _UNPREFIXED:
+        return finding.message
+    return f"[{finding.category}] {finding.message}"
+
+
+def to_dict(finding):
+    return finding._asdict()
+
+
+def from_dict(data):
+    return Finding(**data)
@@ -0,0 +1,164 @@
+
+import hashlib
+import os
+import re
+from collections import Counter
+
+from .findings import info, warning
+
+
+# A keyword file to use instead of the built-in list (see ai_keywords.txt)
+KEYWORDS_ENV = "DOCX_INTEGRITY_KEYWORDS"
+
+# Set to 1 to also scan the body text of every document. Off by default:
+# whole-word matches of "ai" or "claude" in an essay's text are rarely a signal.
+BODY_ENV = "DOCX_INTEGRITY_KEYWORD_BODY"
+
+_DEFAULT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ai_keywords.txt")
+
+# Letters and digits on either side of a match mean it is inside a longer word
+_START = r"(?<!\w)"
+_END = r"(?!\w)"
+
+
+def load_keywords(path):
+    """
+    Read a keyword file: one keyword or phrase per line, '#' starts a comment.
+
+    Returns:
+        list: Lower-cased keywords, duplicates removed, in file order.
+    """
+    with open(path, encoding="utf-8") as f:
+        lines = (line.split("#", 1)[0].strip().lower() for line in f)
+        return list(dict.fromkeys(" ".join(line.split()) for line in lines if line))
+
+
+def _trie_pattern(keywords):
+    """
+    Regex source matching any of `keywords`, factored into a trie of shared
+    prefixes so the engine tries each next character once, not once per
+    keyword. Longer keywords are tried first; spaces match any whitespace.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = None
+
+    def build(node):
+        branches = [(r"\s+" if char == " " else re.escape(char)) + build(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            pattern = "(?:" + pattern + ")?"
+        return pattern
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    Finds whole-word keyword matches, case-insensitively, with one compiled
+    regex: a single left-to-right pass per text whatever the number of keywords.
+
+    The text is lower-cased before matching rather than compiling with
+    re.IGNORECASE, which makes the pass about a third faster.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = tuple(dict.fromkeys(" ".join(k.lower().split()) for k in keywords if k.strip()))
+        pattern = _trie_pattern(self.keywords) if self.keywords else "(?!)"
+        self._regex = re.compile(_START + pattern + _END)
+
+    def _matches(self, text):
+        return (" ".join(m.split()) for m in self._regex.findall(text.lower()))
+
+    def find(self, text):
+        """Distinct keywords found in `text`, in order of first appearance."""
+        if not text:
+            return []
+        return list(dict.fromkeys(self._matches(text)))
+
+    def count(self, text):
+        """Counter of keyword -> number of matches in `text`."""
+        if not text:
+            return Counter()
+        return Counter(self._matches(text))
+
+
+_active = None
+
+
+def active_matcher():
+    """
+    The matcher for this process: the file named by DOCX_INTEGRITY_KEYWORDS,
+    or the built-in list. Compiled once per keyword file.
+    """
+    global _active
+    path = os.environ.get(KEYWORDS_ENV) or _DEFAULT_FILE
+    if _active is None or _active[0] != path:
+        _active = (path, KeywordMatcher(load_keywords(path)))
+    return _active[1]
+
+
+def scan_body():
+    """Whether body text is scanned for keywords (DOCX_INTEGRITY_KEYWORD_BODY=1)."""
+    return os.environ.get(BODY_ENV, "").strip().lower() in ("1", "true", "yes")
+
+
+def fingerprint():
+    """
+    Short hash of the active keyword list and body setting. Part of the cache
+    key, so changing either re-analyzes files instead of reusing old results.
+    """
+    try:
+        keywords = active_matcher().keywords
+    except OSError:
+        keywords = ()
+    text = "\n".join(sorted(keywords)) + f"\nbody={scan_body()}"
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+
+
+def _quoted(keywords):
+    return ", ".join(f"'{k}'" for k in keywords)
+
+
+def field_findings(fields, where=""):
+    """
+    Scan named text fields for keywords.
+
+    Args:
+        fields (list): (field_name, value) pairs; empty values are skipped.
+        where (str): Prefix for the field name in messages, e.g. "PDF ".
+
+    Returns:
+        list: One KEYWORD warning per field with a match.
+    """
+    matcher = active_matcher()
+    findings = []
+    for field_name, value in fields:
+        found = matcher.find(value)
+        if found:
+            findings.append(warning("KEYWORD", field_name, value,
+                                    f"AI keyword(s) {_quoted(found)} found in {where}'{field_name}': {value}"))
+    return findings
+
+
+def body_findings(text):
+    """
+    Keyword matches in a document's body text, if body scanning is enabled.
+
+    Returns:
+        list: A KEYWORD warning with each keyword's match count, a KEYWORD info
+              line if nothing matched, or nothing when body scanning is off.
+    """
+    if not scan_body():
+        return []
+    counts = active_matcher().count(text)
+    if not counts:
+        return [info("KEYWORD", "body", None, "No AI keywords found in the body text.")]
+    listed = ", ".join(f"'{k}' ({n})" for k, n in counts.most_common())
+    return [warning("KEYWORD", "body", dict(counts.most_common()), f"AI keywords in the body text: {listed}")]
@@ -1,44 +1,48 @@
 
 import zipfile
-import xml.etree.ElementTree as ET
 
+from ..findings import info, notice, error
+from ..ooxml import xpath
+from ..profiling import profiled
 
-def check_app_properties(file_path):
+APPLICATION = xpath('string(ep:Application)')
+_APP_VERSION = xpath('string(ep:AppVersion)')
+
+
+@profiled
+def check_app_properties(package):
     """
     Reads docProps/app.xml from inside the .docx ZIP to report the
     application that created the document (e.g. 'Google Docs', 'Microsoft Word').
 
     Args:
-        file_path (str): The path to the .docx file.
+        package (DocxPackage): The shared package for the .docx file.
 
     Returns:
-        list: Finding strings with the application name and version, if available.
+        list: Findings with the application name and version, if available.
     """
     findings = []
     try:
-        with zipfile.ZipFile(file_path, 'r') as z:
-            if 'docProps/app.xml' not in z.namelist():
-                findings.append("[APP] docProps/app.xml not found — creating application unknown.")
-                return findings
-
-            with z.open('docProps/app.xml') as app_xml:
-                root = ET.parse(app_xml).getroot()
-                ns = {'ep': 'http://schemas.openxmlformats.org/officeDocument/2006/extended-properties'}
+        if not package.has_part('docProps/app.xml'):
+            findings.append(notice("APP", "application", None,
+                                   "docProps/app.xml not found — creating application unknown."))
+            return findings
 
-                app_elem    = root.find('ep:Application', ns)
-                version_elem = root.find('ep:AppVersion', ns)
+        root = package.parse_part('docProps/app.xml')
+        application = APPLICATION(root)
+        app_version = _APP_VERSION(root)
 
-                if app_elem is not None and app_elem.text:
-                    findings.append(f"[APP] Created with: {app_elem.text}")
-                else:
-                    findings.append("[APP] Application field is blank.")
+        if application:
+            findings.append(info("APP", "application", application, f"Created with: {application}"))
+        else:
+            findings.append(notice("APP", "application", "", "Application field is blank."))
 
-                if version_elem is not None and version_elem.text:
-                    findings.append(f"[APP] App version: {version_elem.text}")
+        if app_version:
+            findings.append(info("APP", "app_version", app_version, f"App version: {app_version}"))
 
     except zipfile.BadZipFile:
-        findings.append("[APP] Could not read app properties — file is not a valid .docx.")
+        findings.append(error("APP", "Could not read app properties — file is not a valid .docx."))
     except Exception as e:
-        findings.append(f"[APP] Error reading app properties: {e}")
+        findings.append(error("APP", f"Error reading app properties: {e}", str(e)))
 
     return findings
@@ -0,0 +1,94 @@
+
+import datetime as dt
+import re
+
+from ..ooxml import xpath
+from ..profiling import profiled
+
+
+# (attribute, element) pairs read as plain text
+_TEXT_FIELDS = tuple((attr, xpath(f'string({tag})')) for attr, tag in (
+    ("author",           "dc:creator"),
+    ("title",            "dc:title"),
+    ("subject",          "dc:subject"),
+    ("comments",         "dc:description"),
+    ("keywords",         "cp:keywords"),
+    ("category",         "cp:category"),
+    ("last_modified_by", "cp:lastModifiedBy"),
+))
+
+_CREATED  = xpath('string(dcterms:created)')
+_MODIFIED = xpath('string(dcterms:modified)')
+_REVISION = xpath('string(cp:revision)')
+
+_OFFSET = re.compile(r'([+-])(\d\d):(\d\d)')
+
+
+class CoreProperties:
+    """
+    The subset of docProps/core.xml used by the metadata checkers.
+
+    Mirrors the attribute names of python-docx's CoreProperties (text fields are
+    "" when absent, timestamps are UTC datetimes or None, revision is an
+    int, 0 when absent) so checkers work with either.
+    """
+
+    def __init__(self):
+        for attr, _ in _TEXT_FIELDS:
+            setattr(self, attr, "")
+        self.created  = None
+        self.modified = None
+        self.revision = 0
+
+
+def _parse_w3cdtf(value):
+    """Parse a W3CDTF timestamp (e.g. '2024-03-01T10:14:55Z') to a UTC datetime, or None."""
+    if not value:
+        return None
+    value = value.strip()
+    stamp, offset = value[:19], value[19:]
+    for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%Y-%m", "%Y"):
+        try:
+            parsed = dt.datetime.strptime(stamp, fmt)
+            break
+        except ValueError:
+            continue
+    else:
+        return None
+
+    match = _OFFSET.search(offset)
+    if match:
+        sign, hours, minutes = match.groups()
+        delta = dt.timedelta(hours=int(hours), minutes=int(minutes))
+        parsed = parsed - delta if sign == '+' else parsed + delta
+    return parsed.replace(tzinfo=dt.timezone.utc)
+
+
+@profiled
+def read_core_properties(package):
+    """
+    Reads docProps/core.xml without building a python-docx Document.
+
+    Args:
+        package (DocxPackage): The shared package for the .docx file.
+
+    Returns:
+        CoreProperties: Parsed properties; all blank if core.xml is absent.
+    """
+    props = CoreProperties()
+    if not package.has_part('docProps/core.xml'):
+        return props
+
+    root = package.parse_part('docProps/core.xml')
+    for attr, field in _TEXT_FIELDS:
+        setattr(props, attr, field(root))
+
+    props.created  = _parse_w3cdtf(_CREATED(root))
+    props.modified = _parse_w3cdtf(_MODIFIED(root))
+
+    try:
+        props.revision = max(int(_REVISION(root)), 0)
+    except ValueError:
+        props.revision = 0
+
+    return props
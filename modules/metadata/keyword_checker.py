@@ -1,21 +1,18 @@
 
-AI_KEYWORDS = [
-    "ai", "artificial intelligence", "chatgpt",
-    "gpt-3", "gpt-4", "dall-e", "midjourney",
-    "stable diffusion", "copilot"
-]
+from ..keywords import field_findings
+from ..profiling import profiled
 
+@profiled
 def check_keywords(props):
     """
-    Scans 7 core property text fields for AI-related keywords.
+    Scans 7 core property text fields for AI-related keywords (see keywords.py).
 
     Args:
-        props: A python-docx CoreProperties object.
+        props (CoreProperties): Parsed docProps/core.xml properties.
 
     Returns:
-        list: A list of finding strings, one per keyword match found.
+        list: One KEYWORD finding per field with a match.
     """
-    findings = []
     fields_to_scan = [
         ("author",           props.author),
         ("last_modified_by", props.last_modified_by),
@@ -25,7 +22,4 @@ def check_keywords(props):
         ("keywords",         props.keywords),
         ("category",         props.category),
     ]
-    for field_name, value in fields_to_scan:
-        if value and any(k in value.lower() for k in AI_KEYWORDS):
-            findings.append(f"[KEYWORD] Match found in '{field_name}': {value}")
-    return findings
+    return field_findings(fields_to_scan)
@@ -1,16 +1,21 @@
 
+from ..findings import info
+from ..profiling import profiled
+
+
+@profiled
 def check_revision(props):
     """
     Reports the raw revision count from document core properties.
 
     Args:
-        props: A python-docx CoreProperties object.
+        props (CoreProperties): Parsed docProps/core.xml properties.
 
     Returns:
-        list: A single-item list with the revision count, or empty if not set.
+        list: A single finding with the revision count, or empty if not set.
     """
     findings = []
     rev = props.revision
     if rev is not None:
-        findings.append(f"[REVISION] Revision count: {rev}")
+        findings.append(info("REVISION", "revision", rev, f"Revision count: {rev}"))
     return findings
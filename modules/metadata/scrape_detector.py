@@ -2,8 +2,12 @@
 import zipfile
 from datetime import timezone
 
+from ..findings import warning, error
+from ..profiling import profiled
 
-def check_scrape_indicators(file_path, props):
+
+@profiled
+def check_scrape_indicators(package, props):
     """
     Checks for patterns that suggest document metadata has been deliberately removed.
 
@@ -13,30 +17,30 @@ def check_scrape_indicators(file_path, props):
       3. 'created' and 'last_modified' timestamps being identical (common metadata-reset artifact)
 
     Args:
-        file_path (str): The path to the .docx file (needed to inspect the ZIP structure).
-        props:          A python-docx CoreProperties object.
+        package (DocxPackage): The shared package (needed to inspect the ZIP structure).
+        props (CoreProperties): Parsed docProps/core.xml properties.
 
     Returns:
-        list: Finding strings describing any scrape indicators detected.
+        list: Findings describing any scrape indicators detected.
     """
     findings = []
 
     # --- Check 1: Is docProps/core.xml present at all? ---
     try:
-        with zipfile.ZipFile(file_path, 'r') as z:
-            core_present = 'docProps/core.xml' in z.namelist()
+        core_present = package.has_part('docProps/core.xml')
     except zipfile.BadZipFile:
-        findings.append("[SCRAPE] Could not inspect ZIP structure — file may be corrupted.")
+        findings.append(error("SCRAPE", "Could not inspect ZIP structure — file may be corrupted."))
         return findings
     except Exception as e:
-        findings.append(f"[SCRAPE] Error inspecting file structure: {e}")
+        findings.append(error("SCRAPE", f"Error inspecting file structure: {e}", str(e)))
         return findings
 
     if not core_present:
-        findings.append(
-            "[SCRAPE] docProps/core.xml is absent from the file. "
+        findings.append(warning(
+            "SCRAPE", "core_xml_missing", True,
+            "docProps/core.xml is absent from the file. "
             "The core metadata file has been removed entirely."
-        )
+        ))
         return findings
 
     # --- Check 2: Multiple key fields blank simultaneously ---
@@ -52,16 +56,12 @@ def check_scrape_indicators(file_path, props):
         if val is None or (isinstance(val, str) and not val.strip())
     ]
 
-    if len(blank) >= 3:
-        findings.append(
-            f"[SCRAPE] {len(blank)}/4 key metadata fields are blank or absent "
-            f"({', '.join(blank)})."
-        )
-    elif len(blank) == 2:
-        findings.append(
-            f"[SCRAPE] 2/4 key metadata fields are blank or absent "
+    if len(blank) >= 2:
+        findings.append(warning(
+            "SCRAPE", "blank_key_fields", blank,
+            f"{len(blank)}/4 key metadata fields are blank or absent "
             f"({', '.join(blank)})."
-        )
+        ))
 
     # --- Check 3: created == last_modified (metadata reset artifact) ---
     created  = props.created
@@ -74,9 +74,10 @@ def check_scrape_indicators(file_path, props):
             modified = modified.replace(tzinfo=timezone.utc)
 
         if created == modified:
-            findings.append(
-                "[SCRAPE] 'created' and 'last_modified' timestamps are identical. "
+            findings.append(warning(
+                "SCRAPE", "timestamps_identical", True,
+                "'created' and 'last_modified' timestamps are identical. "
                 "This can occur when metadata is reset by a removal tool."
-            )
+            ))
 
     return findings
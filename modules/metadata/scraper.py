@@ -1,5 +1,7 @@
 
-import docx
+from ..docx_package import open_package, OversizePart
+from ..findings import header, summary, error
+from .core_properties import read_core_properties
 from .keyword_checker import check_keywords
 from .revision_checker import check_revision
 from .timestamp_checker import check_timestamps
@@ -9,7 +11,7 @@ from .scrape_detector import check_scrape_indicators
 from .gdocs_checker import check_gdocs
 
 
-def scrape_metadata(file_path):
+def scrape_metadata(source):
     """
     Analyzes the core metadata of a .docx file and reports raw findings.
 
@@ -22,27 +24,30 @@ def scrape_metadata(file_path):
       - Author field completeness
 
     Args:
-        file_path (str): The path to the .docx file.
+        source (str | DocxPackage): The path to the .docx file, or a shared package.
 
     Returns:
-        list: A list of strings containing the metadata analysis findings.
+        list: Findings from the metadata analysis.
     """
-    findings = ["--- Metadata Analysis ---"]
+    findings = [header("Metadata Analysis")]
     try:
-        props = docx.Document(file_path).core_properties
+        with open_package(source) as package:
+            props = read_core_properties(package)
 
-        findings += check_app_properties(file_path)
-        findings += check_gdocs(file_path)
-        findings += check_scrape_indicators(file_path, props)
-        findings += check_keywords(props)
-        findings += check_revision(props)
-        findings += check_timestamps(props)
-        findings += check_author(props)
+            findings += check_app_properties(package)
+            findings += check_gdocs(package)
+            findings += check_scrape_indicators(package, props)
+            findings += check_keywords(props)
+            findings += check_revision(props)
+            findings += check_timestamps(props)
+            findings += check_author(props)
 
         if len(findings) == 1:
-            findings.append("No additional metadata characteristics found.")
+            findings.append(summary("No additional metadata characteristics found."))
 
+    except OversizePart as e:
+        findings.append(error("ERROR", str(e), e.name))
     except Exception as e:
-        findings.append(f"An unexpected error occurred during metadata scan: {e}")
+        findings.append(error("ERROR", f"An unexpected error occurred during metadata scan: {e}", str(e)))
 
     return findings
@@ -1,16 +1,20 @@
 from datetime import timezone
 
+from ..findings import info, notice
+from ..profiling import profiled
 
+
+@profiled
 def check_timestamps(props):
     """
     Reports the document's creation and last-modification timestamps,
     and the time elapsed between them.
 
     Args:
-        props: A python-docx CoreProperties object.
+        props (CoreProperties): Parsed docProps/core.xml properties.
 
     Returns:
-        list: Finding strings with raw timestamp data and calculated delta.
+        list: Findings with raw timestamp data and calculated delta.
     """
     findings = []
     created  = props.created
@@ -28,21 +32,25 @@ def check_timestamps(props):
     modified = _normalize(modified)
 
     if created is not None:
-        findings.append(f"[TIMESTAMP] Created:       {created.strftime('%Y-%m-%d %H:%M:%S UTC')}")
+        findings.append(info("TIMESTAMP", "created", created.isoformat(),
+                             f"Created:       {created.strftime('%Y-%m-%d %H:%M:%S UTC')}"))
     if modified is not None:
-        findings.append(f"[TIMESTAMP] Last Modified: {modified.strftime('%Y-%m-%d %H:%M:%S UTC')}")
+        findings.append(info("TIMESTAMP", "modified", modified.isoformat(),
+                             f"Last Modified: {modified.strftime('%Y-%m-%d %H:%M:%S UTC')}"))
 
     if created is not None and modified is not None:
         delta_seconds = int((modified - created).total_seconds())
         if delta_seconds < 0:
-            findings.append(
-                "[TIMESTAMP] Note: 'Last Modified' timestamp is earlier than 'Created' "
+            findings.append(notice(
+                "TIMESTAMP", "edit_seconds", delta_seconds,
+                "Note: 'Last Modified' timestamp is earlier than 'Created' "
                 "— metadata may be inconsistent."
-            )
+            ))
         else:
             minutes, seconds = divmod(delta_seconds, 60)
-            findings.append(
-                f"[TIMESTAMP] Time between creation and last save: {minutes} min {seconds} sec"
-            )
+            findings.append(info(
+                "TIMESTAMP", "edit_seconds", delta_seconds,
+                f"Time between creation and last save: {minutes} min {seconds} sec"
+            ))
 
     return findings
@@ -0,0 +1,102 @@
+
+import re
+import zlib
+
+# numpy is imported inside the functions that use it, as in batch.rsid_index
+
+
+# Signature length: the estimate's standard error is about 1 / sqrt(NUM_PERM)
+NUM_PERM = 128
+
+# Words per shingle. Five-word runs are rare enough to be distinctive, yet a
+# lightly edited copy still shares most of them.
+SHINGLE_WORDS = 5
+
+_WORD = re.compile(r"\w+")
+
+# Universal hashing (a * x + b) mod p over 32-bit shingle hashes. a and b stay
+# below 2**32 so a * x + b fits in 64 bits before the reduction.
+_PRIME = (1 << 61) - 1
+_SEED = 1
+
+# Shingles hashed per block, bounding the NUM_PERM x block work matrix
+_BLOCK = 8192
+
+_permutations = None
+
+
+def _coefficients():
+    """The fixed (a, b) pairs, one per permutation; the same in every process."""
+    global _permutations
+    if _permutations is None:
+        import numpy as np
+
+        rng = np.random.RandomState(_SEED)
+        a = rng.randint(1, 1 << 32, NUM_PERM, dtype=np.uint64)
+        b = rng.randint(0, 1 << 32, NUM_PERM, dtype=np.uint64)
+        _permutations = (a[:, None], b[:, None])
+    return _permutations
+
+
+def shingle_hashes(text, size=SHINGLE_WORDS):
+    """
+    Distinct 32-bit hashes of the text's overlapping `size`-word shingles.
+
+    Words are runs of letters and digits, lower-cased, so punctuation,
+    spacing and line breaks do not matter. A text shorter than `size` words
+    is one shingle.
+
+    Returns:
+        numpy.ndarray: Sorted uint64 array (values below 2**32); empty for no words.
+    """
+    import numpy as np
+
+    words = _WORD.findall(text.lower())
+    if not words:
+        return np.empty(0, dtype=np.uint64)
+    hashes = np.fromiter((zlib.crc32(word.encode("utf-8")) for word in words),
+                         dtype=np.uint64, count=len(words))
+    size = min(size, len(hashes))
+    count = len(hashes) - size + 1
+
+    # Polynomial combination of each window, wrapping modulo 2**64
+    combined = np.zeros(count, dtype=np.uint64)
+    for offset in range(size):
+        combined = combined * np.uint64(1000003) + hashes[offset:offset + count]
+    folded = (combined >> np.uint64(32)) ^ (combined & np.uint64(0xFFFFFFFF))
+    return np.unique(folded)
+
+
+def signature(shingles):
+    """
+    MinHash signature of a set of shingle hashes.
+
+    Two signatures agree at each position with probability equal to the
+    Jaccard overlap of their shingle sets.
+
+    Args:
+        shingles (numpy.ndarray): From shingle_hashes(); must not be empty.
+
+    Returns:
+        numpy.ndarray: NUM_PERM uint32 values.
+    """
+    import numpy as np
+
+    a, b = _coefficients()
+    result = np.full(NUM_PERM, 0xFFFFFFFF, dtype=np.uint64)
+    for start in range(0, len(shingles), _BLOCK):
+        block = shingles[None, start:start + _BLOCK]
+        hashed = ((a * block + b) % np.uint64(_PRIME)) & np.uint64(0xFFFFFFFF)
+        np.minimum(result, hashed.min(axis=1), out=result)
+    return result.astype(np.uint32)
+
+
+def text_signature(text):
+    """
+    The batch signal for one document's text: {"shingles": count, "signature": [...]},
+    or None when the text has no words.
+    """
+    shingles = shingle_hashes(text)
+    if not len(shingles):
+        return None
+    return {"shingles": int(len(shingles)), "signature": signature(shingles).tolist()}
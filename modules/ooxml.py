@@ -0,0 +1,85 @@
+
+import zlib
+
+from lxml import etree
+
+
+# --- Namespaces ---
+
+W_NS  = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+EP_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/extended-properties'
+CP_NS = 'http://schemas.openxmlformats.org/package/2006/metadata/core-properties'
+DC_NS = 'http://purl.org/dc/elements/1.1/'
+DCTERMS_NS = 'http://purl.org/dc/terms/'
+MC_NS = 'http://schemas.openxmlformats.org/markup-compatibility/2006'
+CT_NS = 'http://schemas.openxmlformats.org/package/2006/content-types'
+REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+# Prefixes for XPath expressions
+NS = {
+    'w':       W_NS,
+    'ep':      EP_NS,
+    'cp':      CP_NS,
+    'dc':      DC_NS,
+    'dcterms': DCTERMS_NS,
+    'ct':      CT_NS,
+    'rel':     REL_NS,
+}
+
+# Clark-notation prefix for WordprocessingML tags and attributes, e.g. f'{W}rsidR'
+W = f'{{{W_NS}}}'
+
+
+def w(local_name):
+    """Clark-notation name of a WordprocessingML tag or attribute, e.g. w('p')."""
+    return W + local_name
+
+
+def rsid_to_int(value):
+    """
+    Map an RSID string to a 32-bit integer. Well-formed RSIDs are 8 hex digits
+    and map exactly; anything else is hashed with CRC-32.
+    """
+    try:
+        return int(value, 16) & 0xFFFFFFFF
+    except ValueError:
+        return zlib.crc32(value.encode('utf-8'))
+
+
+def xpath(expression):
+    """
+    Compile an XPath expression once, with the shared namespace prefixes.
+
+    String results are plain str (no back-reference to the tree), so they can
+    be cached and sent between processes.
+    """
+    return etree.XPath(expression, namespaces=NS, smart_strings=False)
+
+
+# --- Parsing ---
+
+def _parser(huge_tree=False):
+    # Package parts come from untrusted files: never resolve entities or fetch
+    # anything over the network. A new parser per call keeps this thread-safe.
+    return etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=huge_tree)
+
+
+def parse_xml(stream):
+    """Parse a whole XML part and return its root element."""
+    return etree.parse(stream, _parser()).getroot()
+
+
+def iterparse(stream, events=('end',), tag=None):
+    """
+    Stream a (possibly very large) XML part.
+
+    Args:
+        stream: Binary file-like object.
+        events (tuple): lxml iterparse events.
+        tag: Tag name or list of names (Clark notation). Events for any other
+             element are filtered out in C and never reach Python.
+    """
+    return etree.iterparse(
+        stream, events=events, tag=tag,
+        resolve_entities=False, no_network=True, huge_tree=True,
+    )
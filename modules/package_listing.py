@@ -0,0 +1,89 @@
+
+import zipfile
+from .docx_package import open_package
+from .findings import header, info, notice, warning, error
+from .profiling import profiled
+
+
+@profiled
+def check_package_listing(source):
+    """
+    Reports what a .docx contains from the ZIP central directory alone.
+
+    No part is decompressed: sizes come from each entry's ZipInfo, so this is
+    cheap even for documents with large bodies or embedded media.
+
+    Reports:
+      - Number of parts
+      - Uncompressed size of word/document.xml (a rough proxy for body length)
+      - Embedded media count and total size
+      - Presence of a comments part
+
+    Args:
+        source (str | DocxPackage): The path to the .docx file, or a shared package.
+
+    Returns:
+        list: Findings.
+    """
+    findings = [header("Package Contents")]
+    try:
+        with open_package(source) as package:
+            infos = package.zip.infolist()
+            findings.append(info("PACKAGE", "parts", len(infos), f"Parts in package: {len(infos)}"))
+
+            sizes = {zi.filename: zi.file_size for zi in infos}
+            if 'word/document.xml' in sizes:
+                size = sizes['word/document.xml']
+                findings.append(info("PACKAGE", "document_xml_bytes", size,
+                                     f"word/document.xml size: {size:,} bytes (uncompressed)"))
+            else:
+                findings.append(error("PACKAGE", "word/document.xml not found."))
+
+            media = [size for name, size in sizes.items() if name.startswith('word/media/')]
+            if media:
+                findings.append(info("PACKAGE", "media", {"count": len(media), "bytes": sum(media)},
+                                     f"Embedded media: {len(media)} file(s), {sum(media):,} bytes"))
+
+            if 'word/comments.xml' in sizes:
+                findings.append(notice("PACKAGE", "comments_part", sizes['word/comments.xml'],
+                                       "Package contains word/comments.xml (comments may be present)."))
+
+    except zipfile.BadZipFile:
+        findings.append(error("ERROR", "Error: The file is not a valid .docx file or it is corrupted. Package listing failed."))
+    except Exception as e:
+        findings.append(error("ERROR", f"An unexpected error occurred while listing the package: {e}", str(e)))
+
+    return findings
+
+
+@profiled
+def check_part_limits(source):
+    """
+    Reports parts that are too large to analyze safely, from the ZIP central
+    directory alone.
+
+    A part over the size or compression-ratio limits (see docx_package) is not
+    decompressed; the checkers that need it report it as not analyzed. A very
+    high ratio is typical of a zip bomb, built to exhaust memory when unpacked.
+
+    Args:
+        source (str | DocxPackage): The path to the .docx file, or a shared package.
+
+    Returns:
+        list: Findings; empty when every part is within the limits.
+    """
+    findings = []
+    try:
+        with open_package(source) as package:
+            oversize = package.oversize_parts()
+            if oversize:
+                findings.append(header("Package Safety"))
+            for name, (size, ratio, reason) in sorted(oversize.items()):
+                findings.append(warning("PACKAGE", "oversize_part", {"part": name, "bytes": size, "ratio": ratio},
+                                        f"Skipped {name}: {reason}. The file may be a zip bomb."))
+    except zipfile.BadZipFile:
+        pass  # reported by the other checkers
+    except Exception as e:
+        findings.append(error("ERROR", f"An unexpected error occurred while checking package limits: {e}", str(e)))
+
+    return findings
@@ -1,2 +1,3 @@
 
 from .analyzer import analyze_pdf
+from .document import PdfDocument, open_document
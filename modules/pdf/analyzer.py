@@ -1,9 +1,12 @@
 
+from ..findings import header, error
 from .metadata_checker import check_pdf_metadata
 from .content_checker import check_pdf_content
+from .document import PdfDocument
+from ..minhash import text_signature
 
 
-def analyze_pdf(file_path):
+def analyze_pdf(file_path, page_workers=None, include_content=True, signals=None):
     """
     Orchestrates the analysis of a PDF file.
 
@@ -11,22 +14,40 @@ def analyze_pdf(file_path):
       - PDF metadata (creator app, producer, author, timestamps, AI keywords)
       - Content statistics (page count, word count, paragraph estimate)
 
+    Both checks share one PdfDocument, so the file is parsed once.
+
     Args:
-        file_path (str): Path to the PDF file.
+        file_path (str | file): Path to the PDF file, or a binary file object holding it.
+        page_workers (int): Processes for page text extraction (see PdfDocument).
+        include_content (bool): False skips the content statistics, so no page
+                                is parsed or extracted.
+        signals (dict): Optional. With include_content, receives "minhash": the
+                        MinHash signature of the extracted text (see analyze_file).
 
     Returns:
-        list: Finding strings.
+        list: Findings.
     """
-    findings = ["--- PDF Metadata Analysis ---"]
+    document = PdfDocument(file_path, page_workers)
+    findings = [header("PDF Metadata Analysis")]
     try:
-        findings += check_pdf_metadata(file_path)
+        findings += check_pdf_metadata(document)
     except Exception as e:
-        findings.append(f"An unexpected error occurred during PDF metadata scan: {e}")
+        findings.append(error("ERROR", f"An unexpected error occurred during PDF metadata scan: {e}", str(e)))
+
+    if not include_content:
+        return findings
 
-    findings.append("--- PDF Content Analysis ---")
+    findings.append(header("PDF Content Analysis"))
     try:
-        findings += check_pdf_content(file_path)
+        findings += check_pdf_content(document)
     except Exception as e:
-        findings.append(f"An unexpected error occurred during PDF content analysis: {e}")
+        findings.append(error("ERROR", f"An unexpected error occurred during PDF content analysis: {e}", str(e)))
+
+    if signals is not None:
+        try:
+            # Page text is extracted once, by the content check above
+            signals["minhash"] = text_signature(document.text())
+        except Exception:
+            pass
 
     return findings
@@ -1,8 +1,14 @@
 
 import pypdf
 
+from ..findings import info, notice, error
+from ..keywords import body_findings
+from ..profiling import profiled
+from .document import open_document
 
-def check_pdf_content(file_path):
+
+@profiled
+def check_pdf_content(source):
     """
     Extracts text from a PDF and reports basic content statistics.
 
@@ -11,44 +17,44 @@ def check_pdf_content(file_path):
       - Total word count
       - Estimated paragraph count (blank-line-separated blocks)
       - Average words per page
+      - AI keywords in the text (only when enabled, see keywords.scan_body)
 
     Args:
-        file_path (str): Path to the PDF file.
+        source (str | PdfDocument): Path to the PDF file, or a shared PdfDocument.
 
     Returns:
-        list: Finding strings.
+        list: Findings.
     """
     findings = []
     try:
-        reader = pypdf.PdfReader(file_path)
-        page_count = len(reader.pages)
-        findings.append(f"[CONTENT] Page count: {page_count}")
-
-        full_text = ""
-        for page in reader.pages:
-            page_text = page.extract_text() or ""
-            full_text += page_text + "\n"
+        with open_document(source) as document:
+            page_count = document.page_count
+            findings.append(info("CONTENT", "pages", page_count, f"Page count: {page_count}"))
+            full_text = document.text()
 
         if not full_text.strip():
-            findings.append("[CONTENT] No extractable text found (PDF may be image-based or encrypted).")
+            findings.append(notice("CONTENT", "words", None,
+                                   "No extractable text found (PDF may be image-based or encrypted)."))
             return findings
 
         words = full_text.split()
         word_count = len(words)
-        findings.append(f"[CONTENT] Total word count: {word_count}")
+        findings.append(info("CONTENT", "words", word_count, f"Total word count: {word_count}"))
 
         # Estimate paragraph count by counting non-empty blocks separated by blank lines
         paragraphs = [b.strip() for b in full_text.split("\n\n") if b.strip()]
         para_count = len(paragraphs)
-        findings.append(f"[CONTENT] Estimated paragraph blocks: {para_count}")
+        findings.append(info("CONTENT", "paragraphs", para_count, f"Estimated paragraph blocks: {para_count}"))
 
         if page_count > 0:
             avg_words = round(word_count / page_count)
-            findings.append(f"[CONTENT] Average words per page: {avg_words}")
+            findings.append(info("CONTENT", "avg_words_per_page", avg_words, f"Average words per page: {avg_words}"))
+
+        findings += body_findings(full_text)
 
     except pypdf.errors.PdfReadError as e:
-        findings.append(f"[CONTENT] Could not extract text — file may be corrupt or encrypted: {e}")
+        findings.append(error("CONTENT", f"Could not extract text — file may be corrupt or encrypted: {e}", str(e)))
     except Exception as e:
-        findings.append(f"[CONTENT] Error during PDF content analysis: {e}")
+        findings.append(error("CONTENT", f"Error during PDF content analysis: {e}", str(e)))
 
     return findings
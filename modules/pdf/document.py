@@ -0,0 +1,130 @@
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+import pypdf
+
+
+# Below this many pages, starting worker processes costs more than it saves
+_PARALLEL_MIN_PAGES = 64
+
+# Page ranges handed out per worker, so a slow range does not hold up the rest
+_RANGES_PER_WORKER = 4
+
+
+# Each extraction worker parses the PDF once, then serves several page ranges
+_worker_reader = None
+
+
+def _open_worker_reader(file_path):
+    global _worker_reader
+    _worker_reader = pypdf.PdfReader(file_path)
+
+
+def _extract_range(start, stop):
+    """Worker entry point: text of pages [start, stop)."""
+    pages = _worker_reader.pages
+    return [pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def _page_ranges(page_count, parts):
+    """Split range(page_count) into at most `parts` contiguous (start, stop) ranges."""
+    size = -(-page_count // parts)
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+
+class PdfDocument:
+    """
+    Shared view of a single PDF.
+
+    The pypdf reader is built once, on first use, and page text is extracted
+    only when a checker asks for it, then kept as a list of per-page strings.
+    Errors from reading the file (e.g. pypdf.errors.PdfReadError) are raised
+    from the first access, so each checker reports them in its own words.
+    """
+
+    def __init__(self, file_path, page_workers=None):
+        """
+        Args:
+            file_path (str | file): Path to the PDF file, or a seekable binary
+                                    file object holding it.
+            page_workers (int): Processes used to extract page text of PDFs
+                                of _PARALLEL_MIN_PAGES pages or more. Opt-in:
+                                None or 1 extracts in-process, as does a file
+                                object (workers reopen the path) or a daemon
+                                process (which may not start children).
+        """
+        self.file_path = file_path
+        self.page_workers = page_workers
+        self._reader = None
+        self._read_error = None
+        self._page_texts = None
+
+    @property
+    def reader(self):
+        """The pypdf.PdfReader for this file. A file that failed to open is not retried."""
+        if self._read_error is not None:
+            raise self._read_error
+        if self._reader is None:
+            try:
+                self._reader = pypdf.PdfReader(self.file_path)
+            except Exception as e:
+                self._read_error = e
+                raise
+        return self._reader
+
+    @property
+    def metadata(self):
+        return self.reader.metadata
+
+    @property
+    def page_count(self):
+        return len(self.reader.pages)
+
+    def page_texts(self):
+        """Extracted text of every page, in page order (extracted once)."""
+        if self._page_texts is None:
+            workers = self._workers_for(self.page_count)
+            if workers > 1:
+                self._page_texts = self._extract_parallel(workers)
+            else:
+                self._page_texts = [page.extract_text() or "" for page in self.reader.pages]
+        return self._page_texts
+
+    def text(self):
+        """All page text, each page followed by a newline."""
+        texts = self.page_texts()
+        return "\n".join(texts) + "\n" if texts else ""
+
+    def _workers_for(self, page_count):
+        if not self.page_workers or self.page_workers < 2 or not isinstance(self.file_path, str):
+            return 1
+        # Batch workers are daemon processes, which may not start children;
+        # there the batch pool already uses every core anyway
+        if page_count < _PARALLEL_MIN_PAGES or multiprocessing.current_process().daemon:
+            return 1
+        return min(self.page_workers, page_count)
+
+    def _extract_parallel(self, workers):
+        ranges = _page_ranges(self.page_count, workers * _RANGES_PER_WORKER)
+        texts = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_open_worker_reader,
+                                 initargs=(self.file_path,)) as pool:
+            futures = [pool.submit(_extract_range, start, stop) for start, stop in ranges]
+            for future in futures:
+                texts.extend(future.result())
+        return texts
+
+
+@contextmanager
+def open_document(source):
+    """
+    Yield a PdfDocument for `source`, which may be a file path or an existing document.
+
+    A document passed in is shared as is, so its reader and page text are reused.
+    """
+    if isinstance(source, PdfDocument):
+        yield source
+        return
+    yield PdfDocument(source)
@@ -1,28 +1,14 @@
 
 import pypdf
 
-# AI-related keywords to scan for in PDF metadata fields
-_AI_KEYWORDS = [
-    "chatgpt", "gpt-4", "gpt-3", "openai", "dall-e", "midjourney",
-    "stable diffusion", "copilot", "claude", "gemini", "bard", "llm",
-    "artificial intelligence", "ai-generated",
-]
+from ..findings import info, notice, error
+from ..keywords import field_findings
+from ..profiling import profiled
+from .document import open_document
 
 
-def _scan_for_ai_keywords(fields):
-    """Scan a dict of {field_name: value} for AI-related keywords."""
-    findings = []
-    for field, value in fields.items():
-        if not value:
-            continue
-        lower = value.lower()
-        for kw in _AI_KEYWORDS:
-            if kw in lower:
-                findings.append(f"[KEYWORD] AI keyword '{kw}' found in PDF {field}: {value}")
-    return findings
-
-
-def check_pdf_metadata(file_path):
+@profiled
+def check_pdf_metadata(source):
     """
     Extracts and reports metadata from a PDF file.
 
@@ -35,72 +21,72 @@ def check_pdf_metadata(file_path):
       - AI keyword scan across all metadata text fields
 
     Args:
-        file_path (str): Path to the PDF file.
+        source (str | PdfDocument): Path to the PDF file, or a shared PdfDocument.
 
     Returns:
-        list: Finding strings.
+        list: Findings.
     """
     findings = []
     try:
-        reader = pypdf.PdfReader(file_path)
-        meta = reader.metadata
+        with open_document(source) as document:
+            meta = document.metadata
 
         if meta is None:
-            findings.append("[APP] No metadata found in PDF.")
+            findings.append(notice("APP", "metadata", None, "No metadata found in PDF."))
             return findings
 
         # Creator (originating application, e.g. "Google Docs", "Microsoft Word")
         creator = meta.creator or ""
         if creator:
-            findings.append(f"[APP] Created with: {creator}")
+            findings.append(info("APP", "application", creator, f"Created with: {creator}"))
         else:
-            findings.append("[APP] Creator application field is blank.")
+            findings.append(notice("APP", "application", "", "Creator application field is blank."))
 
         # Producer (PDF engine, e.g. "Adobe PDF Library", "Skia/PDF", "pdfTeX")
         producer = meta.producer or ""
         if producer:
-            findings.append(f"[APP] PDF producer: {producer}")
+            findings.append(info("APP", "producer", producer, f"PDF producer: {producer}"))
 
         # Author
         author = meta.author or ""
         if author:
-            findings.append(f"[AUTHOR] Author: {author}")
+            findings.append(info("AUTHOR", "author", author, f"Author: {author}"))
         else:
-            findings.append("[AUTHOR] Author field is blank.")
+            findings.append(notice("AUTHOR", "author", "", "Author field is blank."))
 
         # Title / Subject / Keywords (informational)
         title = meta.title or ""
         subject = meta.subject or ""
         keywords = meta.get("/Keywords", "") or ""
         if title:
-            findings.append(f"[CONTENT] PDF title: {title}")
+            findings.append(info("CONTENT", "title", title, f"PDF title: {title}"))
         if subject:
-            findings.append(f"[CONTENT] PDF subject: {subject}")
+            findings.append(info("CONTENT", "subject", subject, f"PDF subject: {subject}"))
         if keywords:
-            findings.append(f"[CONTENT] PDF keywords: {keywords}")
+            findings.append(info("CONTENT", "keywords", keywords, f"PDF keywords: {keywords}"))
 
         # Timestamps
         creation = meta.creation_date
         modification = meta.modification_date
         if creation:
-            findings.append(f"[TIMESTAMP] PDF created: {creation}")
+            findings.append(info("TIMESTAMP", "created", creation.isoformat(), f"PDF created: {creation}"))
         if modification:
-            findings.append(f"[TIMESTAMP] PDF modified: {modification}")
-
-        # AI keyword scan
-        scan_fields = {
-            "Creator": creator,
-            "Producer": producer,
-            "Author": author,
-            "Title": title,
-            "Subject": subject,
-            "Keywords": keywords,
-        }
-        findings += _scan_for_ai_keywords(scan_fields)
+            findings.append(info("TIMESTAMP", "modified", modification.isoformat(), f"PDF modified: {modification}"))
+
+        # AI keyword scan (the same keyword list as .docx properties)
+        scan_fields = [
+            ("creator",  creator),
+            ("producer", producer),
+            ("author",   author),
+            ("title",    title),
+            ("subject",  subject),
+            ("keywords", keywords),
+        ]
+        findings += field_findings(scan_fields, where="PDF ")
 
     except pypdf.errors.PdfReadError as e:
-        findings.append(f"[APP] Could not read PDF — file may be corrupt or encrypted: {e}")
+        findings.append(error("APP", f"Could not read PDF — file may be corrupt or encrypted: {e}", str(e)))
     except Exception as e:
-        findings.append(f"[APP] Error reading PDF metadata: {e}")
+        findings.append(error("APP", f"Error reading PDF metadata: {e}", str(e)))
 
     return findings
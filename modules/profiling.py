@@ -0,0 +1,196 @@
+
+import functools
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+# Profiling modes
+TIME = "time"        # wall time and bytes decompressed per checker
+MEMORY = "memory"    # the same, plus the tracemalloc peak of each checker
+MODES = (TIME, MEMORY)
+
+# Profile being recorded in this process, or None. Checked once per checker
+# call, so with profiling off a checker costs one extra global lookup.
+_active = None
+
+# tracemalloc.reset_peak is new in Python 3.9; without it every peak is the
+# highest since tracing started
+_reset_peak = getattr(tracemalloc, "reset_peak", lambda: None)
+
+
+class _Frame:
+    __slots__ = ("start", "bytes", "base", "peak")
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.bytes = 0
+        self.base = 0
+        self.peak = 0
+
+
+class Profile:
+    """
+    Per-checker measurements for one file.
+
+    Each checker call appends one record:
+      {"checker": name, "seconds": float, "bytes_decompressed": int, "peak_bytes": int | None}
+
+    bytes_decompressed is the uncompressed size of every ZIP part the checker
+    opened itself; a part already parsed by an earlier checker on the same
+    package is charged to that one. Streams decoded inside pypdf are not
+    counted. peak_bytes is the tracemalloc peak above the memory in use when
+    the checker started, or None unless memory tracing is on.
+
+    Nested checkers are recorded separately; the outer one's time, bytes and
+    peak include the inner one's.
+    """
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.records = []
+        self._stack = []
+
+    def call(self, name, fn, args, kwargs):
+        frame = _Frame()
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1].peak = max(self._stack[-1].peak, peak)
+            _reset_peak()
+            frame.base = frame.peak = current
+        self._stack.append(frame)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - frame.start
+            self._stack.pop()
+            peak_bytes = None
+            if self.memory:
+                frame.peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+                peak_bytes = frame.peak - frame.base
+            if self._stack:
+                parent = self._stack[-1]
+                parent.bytes += frame.bytes
+                parent.peak = max(parent.peak, frame.peak)
+            self.records.append({
+                "checker": name,
+                "seconds": seconds,
+                "bytes_decompressed": frame.bytes,
+                "peak_bytes": peak_bytes,
+            })
+
+    def add_bytes(self, nbytes):
+        if self._stack:
+            self._stack[-1].bytes += nbytes
+
+
+def profiled(fn):
+    """
+    Decorator for checkers: records the call in the active Profile, if any.
+
+    The checker's function name is the name it is reported under.
+    """
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        profile = _active
+        if profile is None:
+            return fn(*args, **kwargs)
+        return profile.call(name, fn, args, kwargs)
+    return wrapper
+
+
+def is_active():
+    """Return True while a Profile is being recorded in this process."""
+    return _active is not None
+
+
+def add_bytes(nbytes):
+    """Charge `nbytes` of decompressed data to the checker currently running."""
+    if _active is not None:
+        _active.add_bytes(nbytes)
+
+
+@contextmanager
+def recording(mode=TIME):
+    """
+    Record every profiled checker called in this process while the block runs.
+
+    Args:
+        mode (str): TIME, or MEMORY to also trace allocations (much slower).
+
+    Yields:
+        Profile: Its records are complete once the block exits.
+    """
+    global _active
+    memory = mode == MEMORY
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    previous, _active = _active, Profile(memory)
+    try:
+        yield _active
+    finally:
+        _active = previous
+        if started_tracing:
+            tracemalloc.stop()
+
+
+# --- Reports ---
+
+def _percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    rank = -(-len(sorted_values) * p // 100)
+    return sorted_values[max(rank, 1) - 1]
+
+
+def summarize(profiles):
+    """
+    Aggregate per-file records by checker.
+
+    Args:
+        profiles (iterable): Record lists, one per file (Profile.records).
+
+    Returns:
+        list: One dict per checker, slowest total first, with keys
+              checker, calls, total_seconds, mean_ms, p95_ms, max_ms,
+              bytes_decompressed and max_peak_bytes (None unless traced).
+    """
+    by_checker = {}
+    for records in profiles:
+        for record in records:
+            by_checker.setdefault(record["checker"], []).append(record)
+
+    rows = []
+    for checker, records in by_checker.items():
+        seconds = sorted(r["seconds"] for r in records)
+        peaks = [r["peak_bytes"] for r in records if r["peak_bytes"] is not None]
+        rows.append({
+            "checker": checker,
+            "calls": len(records),
+            "total_seconds": sum(seconds),
+            "mean_ms": sum(seconds) / len(seconds) * 1000,
+            "p95_ms": _percentile(seconds, 95) * 1000,
+            "max_ms": seconds[-1] * 1000,
+            "bytes_decompressed": sum(r["bytes_decompressed"] for r in records),
+            "max_peak_bytes": max(peaks) if peaks else None,
+        })
+    rows.sort(key=lambda row: row["total_seconds"], reverse=True)
+    return rows
+
+
+def format_summary(rows):
+    """Render summarize() rows as a fixed-width text table (list of lines)."""
+    lines = [
+        f"{'checker':<24} {'calls':>6} {'total s':>9} {'mean ms':>9} {'p95 ms':>9} {'max ms':>9} "
+        f"{'MB unzipped':>12} {'peak MB':>9}"
+    ]
+    for row in rows:
+        peak = f"{row['max_peak_bytes'] / 1e6:9.2f}" if row["max_peak_bytes"] is not None else f"{'-':>9}"
+        lines.append(
+            f"{row['checker']:<24} {row['calls']:>6} {row['total_seconds']:>9.3f} {row['mean_ms']:>9.2f} "
+            f"{row['p95_ms']:>9.2f} {row['max_ms']:>9.2f} {row['bytes_decompressed'] / 1e6:>12.2f} {peak}"
+        )
+    return lines
@@ -1,67 +1,236 @@
 
 import zipfile
-import xml.etree.ElementTree as ET
-from collections import Counter
+from array import array
+from .docx_package import open_package, OversizePart, MAIN_DOCUMENT
+from .findings import header, info, notice, warning, error
+from .ooxml import xpath, rsid_to_int
+from .profiling import profiled
 
-def scrape_rsids(file_path):
+_RSIDS = xpath('w:rsids')
+_SESSION_VALUES = xpath('w:rsids[1]/*/@w:val')
+
+# Sessions listed individually in the timeline; the rest are summed in one line
+_TIMELINE_ROWS = 20
+
+# One session that added at least this share of the final text, in a document
+# of at least this many words, is flagged as the likely paste
+_DOMINANT_SHARE = 0.6
+_DOMINANT_MIN_WORDS = 150
+
+
+def _settings_order(settings_values):
+    """Map each integer RSID to its 1-based position in the settings.xml w:rsids list."""
+    order = {}
+    for value in settings_values:
+        order.setdefault(rsid_to_int(value), len(order) + 1)
+    return order
+
+
+def session_timeline(session_text, settings_values=(), element_counts=None):
+    """
+    Per-session text contribution, in editing order.
+
+    Word appends each new session to the settings.xml w:rsids list, so its
+    order is the order the sessions happened in. Sessions missing from the
+    list follow, in the order their text first appears in the body.
+
+    Args:
+        session_text (SessionTextCollector): From the body scan.
+        settings_values (list): The w:rsids values from word/settings.xml, in order.
+        element_counts (Counter): Optional elements per RSID string (RsidCollector.counts).
+
+    Returns:
+        list: One dict per session that added, reformatted or deleted text:
+              rsid, position (in settings.xml, or None), chars, words, share
+              (of all added characters), formatted_chars, deleted_chars, elements.
+    """
+    order = _settings_order(settings_values)
+    added = session_text.added_chars
+    total = sum(added.values())
+    sessions = list(dict.fromkeys([*added, *session_text.deleted_chars, *session_text.formatted_chars]))
+    sessions.sort(key=lambda rsid: order.get(rsid, len(order) + 1))
+
+    timeline = []
+    for rsid in sessions:
+        name = session_text.names[rsid]
+        chars = added.get(rsid, 0)
+        timeline.append({
+            "rsid": name,
+            "position": order.get(rsid),
+            "chars": chars,
+            "words": session_text.added_words.get(rsid, 0),
+            "share": round(chars / total, 4) if total else 0.0,
+            "formatted_chars": session_text.formatted_chars.get(rsid, 0),
+            "deleted_chars": session_text.deleted_chars.get(rsid, 0),
+            "elements": element_counts.get(name, 0) if element_counts is not None else None,
+        })
+    return timeline
+
+
+def _timeline_findings(timeline, recorded):
+    """Report lines for a session timeline: totals, the largest sessions in order, and a paste flag."""
+    findings = []
+    writers = [entry for entry in timeline if entry["chars"]]
+    total_chars = sum(entry["chars"] for entry in writers)
+    total_words = sum(entry["words"] for entry in writers)
+    findings.append(info("RSID", "text_sessions", len(writers),
+                         f"Body text was added in {len(writers)} session(s) ({recorded} recorded in settings.xml): "
+                         f"{total_chars:,} characters, {total_words:,} words."))
+
+    largest = sorted(timeline, key=lambda entry: -(entry["chars"] + entry["deleted_chars"]))[:_TIMELINE_ROWS]
+    shown = {id(entry) for entry in largest}
+    for entry in timeline:
+        if id(entry) not in shown:
+            continue
+        where = f"#{entry['position']}" if entry["position"] else "not in settings.xml"
+        message = (f"  Session '{entry['rsid']}' ({where}): {entry['chars']:,} characters, "
+                   f"{entry['words']:,} words ({entry['share']:.1%} of the text)")
+        if entry["deleted_chars"]:
+            message += f", {entry['deleted_chars']:,} characters deleted"
+        findings.append(info("RSID", "session", entry, message + "."))
+
+    rest = [entry for entry in timeline if id(entry) not in shown]
+    if rest:
+        chars = sum(entry["chars"] for entry in rest)
+        words = sum(entry["words"] for entry in rest)
+        findings.append(info("RSID", "other_sessions", {"sessions": len(rest), "chars": chars, "words": words},
+                             f"  ... {len(rest)} smaller session(s): {chars:,} characters, {words:,} words "
+                             f"({chars / total_chars if total_chars else 0:.1%} of the text)."))
+
+    if writers and total_words >= _DOMINANT_MIN_WORDS:
+        top = max(writers, key=lambda entry: entry["chars"])
+        if top["share"] >= _DOMINANT_SHARE:
+            findings.append(warning("RSID", "dominant_session", top,
+                                    f"Session '{top['rsid']}' added {top['share']:.0%} of the final text "
+                                    f"({top['words']:,} words). Most of the document arrived in a single "
+                                    "editing session, the usual signature of text pasted in from elsewhere."))
+    return findings
+
+
+def _story_findings(package):
+    """
+    Report lines for the story parts besides word/document.xml: what each
+    holds, and RSIDs that appear in them but nowhere in the main document.
+    """
+    findings = []
+    scans = package.story_scans()
+    main = scans.get(MAIN_DOCUMENT)
+    others = {name: scan for name, scan in scans.items() if name != MAIN_DOCUMENT}
+    if others:
+        findings.append(info("RSID", "story_parts", len(others),
+                             f"Other story parts scanned (headers, footers, notes, glossary): {len(others)}"))
+        for name, scan in others.items():
+            words = len(scan.text.full_text.split())
+            findings.append(info("RSID", "story_part",
+                                 {"part": name, "rsids": len(scan.rsids.counts), "words": words},
+                                 f"  {name}: {len(scan.rsids.counts)} RSID(s), {words:,} word(s)"))
+
+        in_main = main.rsids.sessions if main is not None else set()
+        outside = {}
+        for name, scan in others.items():
+            for rsid in sorted(scan.rsids.sessions - in_main):
+                outside.setdefault(rsid, []).append(name)
+        if outside:
+            listed = ", ".join(f"'{rsid}' ({', '.join(parts)})" for rsid, parts in list(outside.items())[:10])
+            more = f" and {len(outside) - 10} more" if len(outside) > 10 else ""
+            findings.append(notice("RSID", "rsids_outside_body", outside,
+                                   f"{len(outside)} RSID(s) appear only outside the main text: {listed}{more}. "
+                                   "Text from another document or template can survive in these parts."))
+
+    for name, reason in package.story_errors().items():
+        findings.append(notice("RSID", "story_part_error", {"part": name, "reason": reason},
+                               f"{name} could not be scanned: {reason}"))
+    return findings
+
+
+@profiled
+def collect_rsid_set(source, include_body=True):
+    """
+    Collects every RSID in a .docx as compact integers: the word/settings.xml
+    w:rsids list plus all w:rsidR, w:rsidRPr and w:rsidP values in the body
+    and the other story parts (headers, footers, notes, glossary).
+
+    Args:
+        source (str | DocxPackage): The path to the .docx file, or a shared package.
+        include_body (bool): False reads only word/settings.xml.
+
+    Returns:
+        array: Sorted, de-duplicated unsigned 32-bit RSIDs (typecode 'I').
+    """
+    values = set()
+    with open_package(source) as package:
+        if package.has_part('word/settings.xml'):
+            values.update(v for v in _SESSION_VALUES(package.parse_part('word/settings.xml')) if v)
+        if include_body and package.has_part('word/document.xml'):
+            values |= package.body_scan().rsids.sessions
+    return array('I', sorted({rsid_to_int(v) for v in values}))
+
+@profiled
+def scrape_rsids(source, include_body=True):
     """
     Analyzes the RSID tags within a .docx file. 
     
     Args:
-        file_path (str): The path to the .docx file.
+        source (str | DocxPackage): The path to the .docx file, or a shared package.
+        include_body (bool): False reports only the word/settings.xml session list
+                             and never decompresses word/document.xml or the
+                             other story parts.
 
     Returns:
-        list: A list of strings containing the RSID analysis findings.
+        list: Findings from the RSID analysis.
     """
     findings = []
     try:
-        with zipfile.ZipFile(file_path, 'r') as z:
-            namelist = z.namelist()
-            nsmap = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
-            w = f"{{{nsmap['w']}}}"
+        with open_package(source) as package:
+            namelist = package.names
 
             # --- Master RSID list from word/settings.xml ---
-            findings.append("\n--- RSID (Revision Save ID) Analysis ---")
+            findings.append(header("RSID (Revision Save ID) Analysis"))
+            master_rsids = []
+            recorded = 0
             if 'word/settings.xml' in namelist:
-                with z.open('word/settings.xml') as settings_xml:
-                    settings_root = ET.parse(settings_xml).getroot()
-                    rsids_elem = settings_root.find(f"{w}rsids")
-                    if rsids_elem is not None:
-                        master_rsids = [
-                            child.attrib.get(f"{w}val")
-                            for child in rsids_elem
-                            if child.attrib.get(f"{w}val")
-                        ]
-                        findings.append(f"[RSID] Unique revision sessions recorded in settings: {len(master_rsids)}")
-                    else:
-                        findings.append("[RSID] No revision session list found in word/settings.xml.")
-                        findings.append("[RSID] Note: This is common for documents not authored in Microsoft Word (e.g. Google Docs exports).")
-            else:
-                findings.append("[RSID] word/settings.xml not found — revision session history unavailable.")
-
-            # --- Per-element RSID breakdown from word/document.xml ---
-            if 'word/document.xml' in namelist:
-                with z.open('word/document.xml') as doc_xml:
-                    root = ET.parse(doc_xml).getroot()
-                    rsids = [
-                        elem.attrib.get(f"{w}rsidR")
-                        for elem in root.iter()
-                        if elem.attrib.get(f"{w}rsidR")
-                    ]
-
-                    if rsids:
-                        rsid_counts = Counter(rsids)
-                        findings.append(f"[RSID] Unique RSIDs found in document body: {len(rsid_counts)}")
-                        for rsid, count in rsid_counts.items():
-                            findings.append(f"  Session '{rsid}': {count} item(s) created.")
-                    else:
-                        findings.append("[RSID] No rsidR attributes found in document body.")
+                settings_root = package.parse_part('word/settings.xml')
+                if _RSIDS(settings_root):
+                    master_rsids = [v for v in _SESSION_VALUES(settings_root) if v]
+                    # The list repeats w:rsidRoot and may repeat sessions: count each once
+                    recorded = len(_settings_order(master_rsids))
+                    findings.append(info("RSID", "settings_sessions", recorded,
+                                         f"Unique revision sessions recorded in settings: {recorded}"))
+                else:
+                    findings.append(notice("RSID", "settings_sessions", None,
+                                           "No revision session list found in word/settings.xml."))
+                    findings.append(notice("RSID", "settings_sessions_note", None,
+                                           "Note: This is common for documents not authored in Microsoft Word "
+                                           "(e.g. Google Docs exports)."))
             else:
-                findings.append("[RSID] word/document.xml not found.")
+                findings.append(notice("RSID", "settings_sessions", None,
+                                       "word/settings.xml not found — revision session history unavailable."))
+
+            # --- Per-element RSID breakdown from word/document.xml and the other story parts ---
+            if include_body and 'word/document.xml' in namelist:
+                body = package.body_scan()
+                rsid_counts = body.rsids.counts
+
+                if rsid_counts:
+                    findings.append(info("RSID", "unique_body_rsids", len(rsid_counts),
+                                         f"Unique RSIDs found in document text: {len(rsid_counts)}"))
+                else:
+                    findings.append(notice("RSID", "unique_body_rsids", None,
+                                           "No rsidR attributes found in document body."))
+                findings.extend(_story_findings(package))
+
+                timeline = session_timeline(body.session_text, master_rsids, rsid_counts) if rsid_counts else []
+                if timeline:
+                    findings.append(header("RSID Session Timeline"))
+                    findings.extend(_timeline_findings(timeline, recorded))
+            elif include_body:
+                findings.append(error("RSID", "word/document.xml not found."))
 
     except zipfile.BadZipFile:
-        findings.append("Error: The file is not a valid .docx file or it is corrupted. RSID scan failed.")
+        findings.append(error("ERROR", "Error: The file is not a valid .docx file or it is corrupted. RSID scan failed."))
+    except OversizePart as e:
+        findings.append(error("ERROR", str(e), e.name))
     except Exception as e:
-        findings.append(f"An unexpected error occurred during RSID scan: {e}")
+        findings.append(error("ERROR", f"An unexpected error occurred during RSID scan: {e}", str(e)))
     
     return findings